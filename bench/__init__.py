@@ -0,0 +1,7 @@
+"""
+Micro-benchmarks for ChromeSync.
+
+Run them from the top of the repository, eg.
+
+    $ python -m bench.mask
+"""
@@ -0,0 +1,75 @@
+"""
+Command and notification construction rate, with the parser looked up in
+wip.utils.parsers against the eval lookup Command used to do, and for
+the generated domains.
+
+    $ python -m bench.commands [count]
+"""
+
+import sys
+import time
+
+import wip
+import wip.CSS
+import wip.Debugger
+import wip.DOM
+import wip.Target
+from wip.utils import Command, Notification
+
+
+def eval_parser(method_name):
+    """The parser lookup Command and Notification used to run."""
+    try:
+        return eval('wip.' + method_name + '_parser', {'wip': __import__('wip')})
+    except:
+        return Command.default_parser
+
+
+def construct(count):
+    for _ in xrange(count):
+        wip.Debugger.setScriptSource('1', 'var x = 1;')
+        wip.Debugger.enable()
+        wip.Debugger.scriptParsed()
+
+
+def construct_generated(count):
+    for _ in xrange(count):
+        wip.DOM.querySelector(1, '#main')
+        wip.Target.attachToTarget('target', flatten=True)
+        wip.CSS.styleSheetAdded()
+
+
+def construct_with_eval(count):
+    for _ in xrange(count):
+        command = wip.Debugger.setScriptSource('1', 'var x = 1;')
+        command.parser = eval_parser(command.method)
+        command = wip.Debugger.enable()
+        command.parser = eval_parser(command.method)
+        notification = wip.Debugger.scriptParsed()
+        notification.parser = eval_parser(notification.name)
+
+
+def timed(func, count):
+    start = time.time()
+    func(count)
+    return time.time() - start
+
+
+def main(count=20000):
+    assert eval_parser('Debugger.setScriptSource') is \
+        Command('Debugger.setScriptSource').parser
+    assert eval_parser('Debugger.scriptParsed') is \
+        Notification('Debugger.scriptParsed').parser
+
+    objects = count * 3
+    # the dict lookup is still made in there, it costs next to nothing
+    print '%-10s %12.0f objects/s' % (
+        'eval', objects / timed(construct_with_eval, count))
+    print '%-10s %12.0f objects/s' % (
+        'registry', objects / timed(construct, count))
+    print '%-10s %12.0f objects/s' % (
+        'generated', objects / timed(construct_generated, count))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,234 @@
+"""
+Local stand-in for the Chrome remote debugger, so the benchmarks can run
+offline.
+
+It serves the /json page list over HTTP and a websocket for every page
+that speaks just enough of the Debugger domain:
+
+- Debugger.enable answers and then floods the client with scriptParsed
+  notifications, one per script. Like Chrome, notifications are written
+  with the method first.
+- Debugger.getScriptSource answers with the source of a script.
+- Debugger.setScriptSource stores the new source, answers, and records
+  when it arrived.
+
+Anything else gets a "method not found" error back.
+
+    >>> chrome = FakeChrome(pages=2, scripts=1000)
+    >>> chrome.start()
+    >>> chrome.port
+    >>> chrome.stop()
+
+Or in a process of its own, on port 9222 or the one given (0 for any):
+
+    $ python -m bench.fakechrome [port]
+"""
+
+import base64
+import collections
+import json
+import sha
+import socket
+import SocketServer
+import threading
+import time
+
+import websocket
+
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class FakePage(object):
+    """A tab with scripts."""
+
+    def __init__(self, page_id, base_url, scripts, script_size):
+        self.id = page_id
+        self.base_url = base_url
+        self.sources = {}
+        self.urls = {}
+        for n in range(scripts):
+            script_id = str(n + 1)
+            self.urls[script_id] = '%sscript%d.js' % (base_url, n)
+            self.sources[script_id] = '// script %d\n' % n + \
+                'var x = 1;\n' * (script_size // 11)
+
+
+class FakeChrome(object):
+    """Fake remote debugger. Thread safe enough for the benchmarks."""
+
+    def __init__(self, port=0, pages=1, scripts=100, script_size=1024,
+                 base_url='http://fake.chrome.local/static/'):
+        self.requested_port = port
+        self.base_url = base_url
+        self.pages = dict()
+        for n in range(pages):
+            page_id = 'page%d' % n
+            self.pages[page_id] = FakePage(page_id, base_url, scripts,
+                                           script_size)
+        # (time, page id, scriptId, length) of every setScriptSource
+        self.pushes = []
+        self.push_event = threading.Condition()
+        self.server = None
+        self.port = None
+
+    def start(self):
+        fake = self
+
+        class Handler(SocketServer.BaseRequestHandler):
+            def handle(self):
+                fake.handle(self.request)
+
+        SocketServer.ThreadingTCPServer.allow_reuse_address = True
+        self.server = SocketServer.ThreadingTCPServer(
+            ('127.0.0.1', self.requested_port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def page_list(self):
+        return [{
+            'id': page.id,
+            'type': 'page',
+            'title': page.id,
+            'url': page.base_url + 'index.html',
+            'webSocketDebuggerUrl': 'ws://127.0.0.1:%d/devtools/page/%s'
+                                    % (self.port, page.id),
+        } for page in self.pages.values()]
+
+    def wait_for_pushes(self, count, timeout=30):
+        """Block until count pushes have been received in total."""
+        deadline = time.time() + timeout
+        with self.push_event:
+            while len(self.pushes) < count:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise RuntimeError('only %d of %d pushes arrived'
+                                       % (len(self.pushes), count))
+                self.push_event.wait(remaining)
+
+    # -- connection handling --
+
+    def handle(self, sock):
+        request = ''
+        while '\r\n\r\n' not in request:
+            data = sock.recv(4096)
+            if not data:
+                return
+            request += data
+        lines = request.split('\r\n')
+        path = lines[0].split(' ')[1]
+        headers = dict()
+        for line in lines[1:]:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                headers[key.strip().lower()] = value.strip()
+
+        if path.startswith('/json'):
+            body = json.dumps(self.page_list())
+            sock.sendall('HTTP/1.1 200 OK\r\n'
+                         'Content-Type: application/json\r\n'
+                         'Content-Length: %d\r\n'
+                         'Connection: close\r\n\r\n%s' % (len(body), body))
+            return
+
+        page = self.pages.get(path.rsplit('/', 1)[-1])
+        if page is None or 'sec-websocket-key' not in headers:
+            sock.sendall('HTTP/1.1 404 Not Found\r\n'
+                         'Content-Length: 0\r\n\r\n')
+            return
+
+        accept = base64.encodestring(
+            sha.sha(headers['sec-websocket-key'] + GUID).digest()).strip()
+        sock.sendall('HTTP/1.1 101 WebSocket Protocol Handshake\r\n'
+                     'Upgrade: WebSocket\r\n'
+                     'Connection: Upgrade\r\n'
+                     'Sec-WebSocket-Accept: %s\r\n\r\n' % accept)
+        try:
+            self.serve_page(page, sock)
+        except (socket.error, websocket.WebSocketException):
+            pass
+
+    def serve_page(self, page, sock):
+        # the client side parser works just as well for the server side
+        ws = websocket.WebSocket()
+        ws.sock.close()
+        ws.io_sock = ws.sock = sock
+        ws.connected = True
+
+        def send(opcode, data):
+            frame = websocket.ABNF(1, 0, 0, 0, opcode, 0, data)
+            header, payload = frame.format_parts()
+            sock.sendall(header + payload)
+
+        def reply(message):
+            send(websocket.ABNF.OPCODE_TEXT, json.dumps(message))
+
+        while True:
+            frame = ws.recv_frame()
+            if frame.opcode == websocket.ABNF.OPCODE_CLOSE:
+                send(websocket.ABNF.OPCODE_CLOSE, frame.data)
+                return
+            if frame.opcode == websocket.ABNF.OPCODE_PING:
+                send(websocket.ABNF.OPCODE_PONG, frame.data)
+                continue
+            if frame.opcode != websocket.ABNF.OPCODE_TEXT:
+                continue
+
+            request = json.loads(frame.data)
+            method = request.get('method')
+            params = request.get('params') or {}
+            command_id = request.get('id')
+
+            if method == 'Debugger.enable':
+                reply({'id': command_id, 'result': {}})
+                for script_id in sorted(page.urls, key=int):
+                    reply(collections.OrderedDict([
+                        ('method', 'Debugger.scriptParsed'), ('params', {
+                        'scriptId': script_id,
+                        'url': page.urls[script_id],
+                        'startLine': 0,
+                        'startColumn': 0,
+                        'endLine': 0,
+                        'endColumn': 0,
+                        'hash': sha.sha(page.sources[script_id]).hexdigest(),
+                    })]))
+            elif method == 'Debugger.getScriptSource':
+                reply({'id': command_id, 'result': {
+                    'scriptSource': page.sources.get(params.get('scriptId'),
+                                                     '')}})
+            elif method == 'Debugger.setScriptSource':
+                script_id = params.get('scriptId')
+                source = params.get('scriptSource', '')
+                page.sources[script_id] = source
+                with self.push_event:
+                    self.pushes.append((time.time(), page.id, script_id,
+                                        len(source)))
+                    self.push_event.notify_all()
+                reply({'id': command_id, 'result': {'callFrames': [],
+                                                   'status': 'Ok'}})
+            else:
+                reply({'id': command_id, 'error': {
+                    'code': -32601,
+                    'message': "'%s' wasn't found" % method}})
+
+
+if __name__ == '__main__':
+    import sys
+    chrome = FakeChrome(port=int(sys.argv[1]) if sys.argv[1:] else 9222)
+    chrome.start()
+    print 'Fake Chrome on port %d, ^C to stop' % chrome.port
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        chrome.stop()
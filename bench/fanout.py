@@ -0,0 +1,140 @@
+"""
+Pushing a saved file to many tabs the way TabWatch did (each tab reads
+and hashes the file and encodes its own setScriptSource) against the
+shared sync.SourceChange, whose encoded source every tab's push reuses.
+
+    $ python -m bench.fanout [size] [repeat]
+
+'sent' is the time until every tab's push has been written to its
+socket, 'acked' until the last tab has answered. Like Chrome, where
+every tab has a renderer process of its own, each tab is a fake Chrome
+in a process of its own, so decoding the pushes doesn't hold up this
+one (given the cores to run them on).
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import websocket
+import wip.Debugger
+from sync import SourceChange, source_hash
+from wip.utils import PreparedCommand
+
+
+TABS = (1, 4, 16)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_chromes(count):
+    """count fake Chromes, each in a process of its own."""
+    processes = []
+    for _ in range(count):
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'bench.fakechrome', '0'],
+            cwd=ROOT, stdout=subprocess.PIPE)
+        # Fake Chrome on port <port>, ...
+        process.port = int(process.stdout.readline().split()[4].rstrip(','))
+        processes.append(process)
+    return processes
+
+
+def connect(chromes):
+    from swi import Protocol
+    protocols = []
+    for chrome in chromes:
+        protocol = Protocol()
+        opened = threading.Event()
+        protocol.connect('ws://127.0.0.1:%d/devtools/page/page0' % chrome.port,
+                         opened.set, loop=websocket.get_reactor())
+        if not opened.wait(10):
+            raise RuntimeError('could not connect to the fake chrome')
+        protocols.append(protocol)
+    return protocols
+
+
+def per_tab(protocols, path):
+    futures = []
+    for protocol in protocols:
+        with open(path) as f:
+            src = f.read()
+        source_hash(src)
+        futures.append(protocol.send(wip.Debugger.setScriptSource('1', src)))
+    return futures
+
+
+def fan_out(protocols, path):
+    change = SourceChange(path)
+    change.read()
+    futures = []
+    for protocol in protocols:
+        command = PreparedCommand('Debugger.setScriptSource',
+                                  {'scriptId': '1'},
+                                  {'scriptSource': change.encode()})
+        futures.append(protocol.send(command))
+    return futures
+
+
+def messages_sent(protocols):
+    return sum(protocol.messages_sent for protocol in protocols)
+
+
+def last_push(protocols, push, path, repeat):
+    """Best times from saving to the last tab's push being sent and
+    answered."""
+    best = None
+    for _ in range(repeat):
+        sent = messages_sent(protocols) + len(protocols)
+        acked = []
+        saved = time.time()
+        for future in push(protocols, path):
+            future.add_done_callback(lambda future: acked.append(time.time()))
+        while messages_sent(protocols) < sent:
+            time.sleep(0.0001)
+        written = time.time() - saved
+        deadline = time.time() + 30
+        while len(acked) < len(protocols):
+            if time.time() > deadline:
+                raise RuntimeError('only %d of %d pushes were answered'
+                                   % (len(acked), len(protocols)))
+            time.sleep(0.0001)
+        elapsed = (written, max(acked) - saved)
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(size=1 << 20, repeat=5):
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'script.js')
+    with open(path, 'w') as f:
+        f.write('var x = "\\u00e9";\n' * (size // 18))
+    try:
+        print '%-6s %25s %25s' % ('tabs', 'per tab', 'fan-out')
+        print '%-6s %12s %12s %12s %12s' % ('', 'sent', 'acked',
+                                            'sent', 'acked')
+        for tabs in TABS:
+            chromes = start_chromes(tabs)
+            try:
+                protocols = connect(chromes)
+                times = [last_push(protocols, push, path, repeat)
+                         for push in (per_tab, fan_out)]
+                for protocol in protocols:
+                    protocol.disconnect()
+            finally:
+                for chrome in chromes:
+                    chrome.kill()
+                    chrome.wait()
+            print '%-6d %10.2fms %10.2fms %10.2fms %10.2fms' % (
+                (tabs,) + tuple(t * 1000 for t in times[0] + times[1]))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
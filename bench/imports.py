@@ -0,0 +1,58 @@
+"""
+Cold import times, each in a fresh interpreter.
+
+    $ python -m bench.imports [repeat]
+
+'eager' rows import what the module used to import up front, to compare
+against.
+"""
+
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = (
+    ('wip', 'import wip'),
+    ('wip, eager', 'import wip\nfor d in wip.DOMAINS: getattr(wip, d)'),
+    ('wip.Debugger', 'import wip.Debugger'),
+    ('websocket', 'import websocket'),
+    ('swi', 'import swi'),
+    ('sync', 'import sync'),
+    ('sync, eager', 'import sync, requests, pyinotify, swi, wip.Debugger'),
+    # the same, less the dependencies that may not be installed
+    ('sync, swi', 'import sync, swi, wip.Debugger'),
+)
+
+TIMER = '''
+import time
+start = time.time()
+%s
+print time.time() - start
+'''
+
+
+def cold_import(code):
+    """Seconds code took in a new interpreter, None if it failed."""
+    process = subprocess.Popen([sys.executable, '-c', TIMER % code],
+                               cwd=ROOT, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+    out, _ = process.communicate()
+    if process.returncode:
+        return None
+    return float(out)
+
+
+def main(repeat=5):
+    for name, code in SCENARIOS:
+        times = [cold_import(code) for _ in range(repeat)]
+        if None in times:
+            print '%-14s %10s' % (name, 'failed (not installed?)')
+        else:
+            print '%-14s %8.2fms' % (name, min(times) * 1000)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,56 @@
+"""
+Compare the old byte-at-a-time websocket masking with ABNF.mask.
+
+    $ python -m bench.mask [repeat]
+"""
+
+import os
+import sys
+import time
+
+import websocket
+
+
+SIZES = (
+    ('1 KB', 1 << 10),
+    ('1 MB', 1 << 20),
+    ('10 MB', 10 << 20),
+)
+
+
+def bytewise_mask(mask_key, data):
+    """The masking loop websocket.ABNF.mask used to run."""
+    _m = map(ord, mask_key)
+    _d = map(ord, data)
+    for i in range(len(_d)):
+        _d[i] ^= _m[i % 4]
+    s = map(chr, _d)
+    return "".join(s)
+
+
+def best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(repeat=3):
+    mask_key = os.urandom(4)
+    print '%-8s %12s %12s %9s' % ('size', 'bytewise', 'bulk', 'speedup')
+    for label, size in SIZES:
+        data = os.urandom(size)
+        assert websocket.ABNF.mask(mask_key, data) == \
+            bytewise_mask(mask_key, data)
+        slow = best_of(repeat, bytewise_mask, mask_key, data)
+        fast = best_of(repeat, websocket.ABNF.mask, mask_key, data)
+        print '%-8s %10.2fms %10.2fms %8.1fx' % (
+            label, slow * 1000, fast * 1000, slow / max(fast, 1e-9))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
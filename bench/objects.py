@@ -0,0 +1,157 @@
+"""
+Parse time and memory of a Debugger.paused event with a deep stack, with
+the slotted wip objects against the __dict__ based ones they replaced,
+and the lazy view wip.Debugger.paused_parser returns now.
+
+    $ python -m bench.objects [frames] [repeat]
+"""
+
+import sys
+import time
+
+import wip
+import wip.Debugger
+from wip.utils import WIPObject
+
+
+# the classes as they were before they declared their fields
+class RemoteObjectId(WIPObject):
+    def __init__(self, value):
+        self.value = value
+
+
+class RemoteObject(WIPObject):
+    def __init__(self, value):
+        self.set(value, 'className')
+        self.set(value, 'description')
+        self.set_class(value, 'objectId', RemoteObjectId)
+        self.set(value, 'subtype')
+        self.set(value, 'type')
+        self.set(value, 'value')
+
+
+class ScriptId(WIPObject):
+    def __init__(self, value):
+        self.value = value
+
+
+class CallFrameId(ScriptId):
+    pass
+
+
+class Scope(WIPObject):
+    def __init__(self, value):
+        self.set_class(value, 'object', RemoteObject)
+        self.set(value, 'type')
+
+
+class Location(WIPObject):
+    def __init__(self, value):
+        self.set(value, 'columnNumber')
+        self.set(value, 'lineNumber')
+        self.set_class(value, 'scriptId', ScriptId)
+
+
+class CallFrame(WIPObject):
+    def __init__(self, value):
+        self.set_class(value, 'callFrameId', CallFrameId)
+        self.set(value, 'functionName')
+        self.set_class(value, 'location', Location)
+        self.scopeChain = []
+        if 'scopeChain' in value:
+            for scope in value['scopeChain']:
+                self.scopeChain.append(Scope(scope))
+        self.set_class(value, 'this', RemoteObject)
+
+
+def remote_object(n):
+    return {
+        'type': 'object',
+        'className': 'Object',
+        'description': 'Object',
+        'objectId': '{"injectedScriptId":1,"id":%d}' % n,
+    }
+
+
+def paused_params(frames):
+    return {'reason': 'other', 'callFrames': [{
+        'callFrameId': '{"ordinal":%d,"injectedScriptId":1}' % n,
+        'functionName': 'f%d' % n,
+        'location': {'scriptId': '42', 'lineNumber': n, 'columnNumber': 4},
+        'scopeChain': [{'type': t, 'object': remote_object(n)}
+                       for t in ('local', 'closure', 'closure', 'global')],
+        'this': remote_object(n),
+    } for n in range(frames)]}
+
+
+def legacy_parser(params):
+    return {'reason': params['reason'],
+            'callFrames': [CallFrame(f) for f in params['callFrames']]}
+
+
+def slots_parser(params):
+    return {'reason': params['reason'],
+            'callFrames': [wip.Debugger.CallFrame(f)
+                           for f in params['callFrames']]}
+
+
+def lazy_reason(params):
+    """What a subscriber that only wants the reason pays."""
+    return wip.Debugger.paused_parser(params)['reason']
+
+
+def lazy_all(params):
+    return wip.Debugger.paused_parser(params)['callFrames']
+
+
+def footprint(value):
+    """Bytes used by value and the wip objects and lists it holds."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return size + sum(footprint(item) for item in value)
+    if isinstance(value, dict):
+        return size + sum(footprint(item) for item in value.values())
+    if isinstance(value, WIPObject):
+        if hasattr(value, '__dict__'):
+            size += sys.getsizeof(value.__dict__)
+            names = value.__dict__.keys()
+        else:
+            names = [n for n in type(value).__slots__ if hasattr(value, n)]
+        for name in names:
+            item = getattr(value, name)
+            if isinstance(item, (WIPObject, list, dict)):
+                size += footprint(item)
+    return size
+
+
+def best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(frames=200, repeat=20):
+    params = paused_params(frames)
+    # per frame: frame, id, location, script id, this (+ id) and four
+    # scopes each with an object (+ id)
+    objects = frames * 14
+    print '%-12s %12s %14s' % ('', 'parse', 'bytes/object')
+    for name, parser in (('dict', legacy_parser),
+                         ('slots', slots_parser)):
+        elapsed = best_of(repeat, parser, params)
+        size = footprint(parser(params)['callFrames'])
+        print '%-12s %10.2fms %14.0f' % (name, elapsed * 1000,
+                                         float(size) / objects)
+    for name, parser in (('lazy, reason', lazy_reason),
+                         ('lazy, all', lazy_all)):
+        elapsed = best_of(repeat, parser, params)
+        print '%-12s %10.4fms' % (name, elapsed * 1000)
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
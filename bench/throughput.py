@@ -0,0 +1,211 @@
+"""
+Throughput and latency of the websocket, swi and sync layers, measured
+against bench.fakechrome so it runs offline.
+
+    $ python -m bench.throughput [benchmark ...]
+
+Benchmarks: websocket, protocol, filter, push, chromewatch (all by default).
+chromewatch needs pyinotify and requests installed.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import websocket
+from bench.fakechrome import FakeChrome
+
+
+SCRIPTS = 5000
+PUSHES = 50
+PUSH_SIZE = 1 << 20
+
+
+def percentile(samples, p):
+    """p-th percentile (0-100) of a sorted list."""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, int(round(p / 100.0 * (len(samples) - 1))))
+    return samples[index]
+
+
+def report(name, count, elapsed, size, latencies=None):
+    line = '%-12s %7d msgs %8.3fs %10.0f msg/s' % (
+        name, count, elapsed, count / elapsed)
+    if size is not None:
+        line += ' %8.2f MB/s' % (size / elapsed / (1 << 20))
+    if latencies:
+        latencies = sorted(latencies)
+        line += '  p50 %.2fms p95 %.2fms p99 %.2fms' % tuple(
+            percentile(latencies, p) * 1000 for p in (50, 95, 99))
+    print line
+
+
+def page_url(chrome):
+    return chrome.page_list()[0]['webSocketDebuggerUrl']
+
+
+def bench_websocket(chrome):
+    """Raw WebSocket receive rate of a scriptParsed flood."""
+    ws = websocket.create_connection(page_url(chrome))
+    start = time.time()
+    ws.send('{"id": 1, "method": "Debugger.enable", "params": {}}')
+    size = len(ws.recv())
+    for _ in range(SCRIPTS):
+        size += len(ws.recv())
+    elapsed = time.time() - start
+    ws.close()
+    report('websocket', SCRIPTS + 1, elapsed, size)
+
+
+def connect_protocol(chrome, loop):
+    from swi import Protocol
+    protocol = Protocol()
+    opened = threading.Event()
+    protocol.connect(page_url(chrome), opened.set, loop=loop)
+    if not opened.wait(10):
+        raise RuntimeError('could not connect to the fake chrome')
+    return protocol
+
+
+def bench_protocol(chrome):
+    """scriptParsed notifications parsed and dispatched by swi.Protocol."""
+    import wip.Debugger
+    protocol = connect_protocol(chrome, websocket.get_reactor())
+    parsed = []
+    done = threading.Event()
+
+    def on_script_parsed(data, notification):
+        parsed.append(data['url'])
+        if len(parsed) == SCRIPTS:
+            done.set()
+
+    protocol.subscribe(wip.Debugger.scriptParsed(), on_script_parsed)
+    start = time.time()
+    protocol.send(wip.Debugger.enable())
+    if not done.wait(60):
+        raise RuntimeError('only %d of %d scripts arrived'
+                           % (len(parsed), SCRIPTS))
+    elapsed = time.time() - start
+    protocol.disconnect()
+    report('protocol', SCRIPTS, elapsed, None)
+
+
+def bench_filter(chrome):
+    """scriptParsed notifications dropped unparsed, nobody subscribed."""
+    import wip.Debugger
+    protocol = connect_protocol(chrome, websocket.get_reactor())
+    start = time.time()
+    protocol.send(wip.Debugger.enable())
+    deadline = start + 60
+    while protocol.dropped['Debugger.scriptParsed'] < SCRIPTS:
+        if time.time() > deadline:
+            raise RuntimeError('only %d of %d scripts arrived'
+                               % (sum(protocol.dropped.values()), SCRIPTS))
+        time.sleep(0.001)
+    elapsed = time.time() - start
+    protocol.disconnect()
+    report('filter', SCRIPTS, elapsed, None)
+
+
+def bench_push(chrome):
+    """setScriptSource round trips through swi.Protocol."""
+    import wip.Debugger
+    protocol = connect_protocol(chrome, websocket.get_reactor())
+    source = 'var x = 1;\n' * (PUSH_SIZE // 11)
+    latencies = []
+
+    start = time.time()
+    for _ in range(PUSHES):
+        sent = time.time()
+        protocol.send(wip.Debugger.setScriptSource('1', source)).result(30)
+        latencies.append(time.time() - sent)
+    elapsed = time.time() - start
+    protocol.disconnect()
+    report('push', PUSHES, elapsed, PUSHES * len(source), latencies)
+    stats = protocol.latency_stats()['Debugger.setScriptSource']
+    print '%-12s %7d acks %48s  p50 %.2fms p95 %.2fms p99 %.2fms' % (
+        '  (swi)', stats['count'], '',
+        stats['p50'] * 1000, stats['p95'] * 1000, stats['p99'] * 1000)
+
+
+def bench_chromewatch(chrome):
+    """Time from saving a file to the new source arriving in Chrome."""
+    # sync only imports these once it gets to them, on other threads
+    import pyinotify
+    import requests
+    import config
+    import sync
+
+    directory = tempfile.mkdtemp()
+    try:
+        paths = []
+        for script_id, url in sorted(chrome.pages.values()[0].urls.items()):
+            path = os.path.join(directory, url[len(chrome.base_url):])
+            with open(path, 'w') as f:
+                f.write('// %s\n' % script_id)
+            paths.append(path)
+        scripts = len(paths)
+        paths = paths[:PUSHES]
+
+        config.Config.mappings = {chrome.base_url: directory + '/'}
+        watch = sync.ChromeWatch(port=chrome.port)
+        try:
+            # wait for the scriptParsed flood to be mapped to files and
+            # for the getScriptSources it sends to be answered, so the
+            # pushes don't queue behind them
+            deadline = time.time() + 60
+            tabs = watch.protocols.values()
+            while not all(len(tab.path_to_script) == scripts and
+                          not tab.protocol.commands for tab in tabs):
+                if time.time() > deadline:
+                    raise RuntimeError('scripts were never parsed')
+                time.sleep(0.05)
+
+            source = 'var x = 1;\n' * (PUSH_SIZE // 11)
+            latencies = []
+            start = time.time()
+            for path in paths:
+                pushed = len(chrome.pushes)
+                saved = time.time()
+                with open(path, 'w') as f:
+                    f.write(source)
+                chrome.wait_for_pushes(pushed + len(tabs))
+                latencies.append(chrome.pushes[-1][0] - saved)
+            elapsed = time.time() - start
+        finally:
+            watch.stop()
+        report('chromewatch', len(paths), elapsed,
+               len(paths) * len(source), latencies)
+    finally:
+        shutil.rmtree(directory)
+
+
+BENCHMARKS = [
+    ('websocket', bench_websocket),
+    ('protocol', bench_protocol),
+    ('filter', bench_filter),
+    ('push', bench_push),
+    ('chromewatch', bench_chromewatch),
+]
+
+
+def main(names):
+    chrome = FakeChrome(scripts=SCRIPTS)
+    chrome.start()
+    try:
+        for name, benchmark in BENCHMARKS:
+            if not names or name in names:
+                try:
+                    benchmark(chrome)
+                except ImportError, e:
+                    print '%-12s %s' % (name, 'not installed (%s)' % e)
+    finally:
+        chrome.stop()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
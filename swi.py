@@ -9,8 +9,13 @@ I've made a few modifications - mostly around printing / logging
 
 """
 
+import collections
 import logging
+import math
+import Queue
+import re
 import threading
+import time
 import json
 
 import websocket
@@ -21,17 +26,331 @@ logger = logging.getLogger('ChromeSync')
 logger.setLevel(logging.INFO)
 
 
+# Chrome writes the method first in a notification, which is enough to
+# drop the ones nobody subscribed to without parsing the whole message
+NOTIFICATION_METHOD = re.compile(r'\{\s*"method"\s*:\s*"([^"\\]*)"')
+
+# commands that replace an unsent one with the same value of this param
+COALESCE = {
+    'Debugger.setScriptSource': 'scriptId',
+}
+
+
+# Chrome answered a command with an error, or it never got an answer
+class ProtocolError(Exception):
+
+    def __init__(self, message, code=None):
+        Exception.__init__(self, message)
+        self.code = code
+
+
+class CommandTimeout(ProtocolError):
+    pass
+
+
+class CommandCancelled(ProtocolError):
+    pass
+
+
+# Result of a command sent with Protocol.send. Resolves with the parsed
+# result, or fails with a ProtocolError.
+class CommandFuture(object):
+
+    def __init__(self, command, on_cancel=None):
+        self.command = command
+        self.on_cancel = on_cancel
+        self.condition = threading.Condition()
+        self.finished = False
+        self.value = None
+        self.error = None
+        self.callbacks = []
+
+    def done(self):
+        return self.finished
+
+    def cancelled(self):
+        return isinstance(self.error, CommandCancelled)
+
+    # stop waiting for the answer, it will be ignored when it comes
+    def cancel(self):
+        if not self.set_exception(CommandCancelled('Cancelled')):
+            return False
+        if self.on_cancel:
+            self.on_cancel(self.command)
+        return True
+
+    # block until the answer is in, raise the error if there was one
+    def result(self, timeout=None):
+        error = self.exception(timeout)
+        if error:
+            raise error
+        return self.value
+
+    def exception(self, timeout=None):
+        with self.condition:
+            if not self.finished:
+                self.condition.wait(timeout)
+            if not self.finished:
+                raise CommandTimeout('No answer to %s within %ss'
+                                     % (self.command.method, timeout))
+            return self.error
+
+    # call fn(future) once the future is done (straight away if it is)
+    def add_done_callback(self, fn):
+        with self.condition:
+            if not self.finished:
+                self.callbacks.append(fn)
+                return
+        fn(self)
+
+    def set_result(self, value):
+        return self.finish(value, None)
+
+    def set_exception(self, error):
+        return self.finish(None, error)
+
+    def finish(self, value, error):
+        with self.condition:
+            if self.finished:
+                return False
+            self.value = value
+            self.error = error
+            self.finished = True
+            self.condition.notify_all()
+            callbacks, self.callbacks = self.callbacks, []
+        for fn in callbacks:
+            try:
+                fn(self)
+            except Exception:
+                logger.exception('SWI: Error in command callback')
+        return True
+
+
+# Distribution of latencies in seconds. Samples go in buckets 10% wider
+# than the one before, starting at 0.1ms, so the percentiles are within
+# 10% without keeping every sample.
+class LatencyHistogram(object):
+
+    base = 0.0001
+    growth = 1.1
+
+    def __init__(self):
+        self.buckets = collections.Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        if value > self.base:
+            bucket = int(math.ceil(math.log(value / self.base, self.growth)))
+        else:
+            bucket = 0
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    # upper bound of the bucket the p-th percentile (0-100) falls in
+    def percentile(self, p):
+        rank = p / 100.0 * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.base * self.growth ** bucket, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+# Worker threads that run the callbacks of every Protocol, so a slow
+# callback never holds up reading from the websockets
+class Dispatcher(object):
+
+    def __init__(self, workers=4):
+        self.ready = Queue.Queue()
+        for n in range(workers):
+            thread = threading.Thread(target=self.work, name='swi-dispatch-%d' % n)
+            thread.daemon = True
+            thread.start()
+
+    def schedule(self, queue):
+        self.ready.put(queue)
+
+    def work(self):
+        while True:
+            self.ready.get().run()
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+# the process wide Dispatcher, started on first use
+def get_dispatcher():
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = Dispatcher()
+        return _dispatcher
+
+
+# Calls to run on a Dispatcher one after the other, in the order they
+# were put. Only one worker runs a queue at a time, and it gives the
+# others a turn after every batch of calls.
+#
+# The queue is bounded: once max_size calls are waiting on_full is
+# called (to stop reading), and on_drained once it is down to half.
+class DispatchQueue(object):
+
+    batch = 50
+
+    def __init__(self, dispatcher, max_size=1000, on_full=None, on_drained=None):
+        self.dispatcher = dispatcher
+        self.max_size = max_size
+        self.on_full = on_full
+        self.on_drained = on_drained
+        self.lock = threading.Lock()
+        self.calls = collections.deque()
+        self.running = False
+        self.full = False
+        # metrics
+        self.peak_depth = 0
+        self.handled = 0
+        self.handler_time = 0.0
+        self.max_handler_time = 0.0
+
+    def depth(self):
+        return len(self.calls)
+
+    def put(self, fn, *args):
+        with self.lock:
+            self.calls.append((fn, args))
+            depth = len(self.calls)
+            self.peak_depth = max(self.peak_depth, depth)
+            schedule = not self.running
+            self.running = True
+            full = depth >= self.max_size and not self.full
+            if full:
+                self.full = True
+        if full and self.on_full:
+            self.on_full()
+        if schedule:
+            self.dispatcher.schedule(self)
+
+    def run(self):
+        for _ in range(self.batch):
+            with self.lock:
+                if not self.calls:
+                    self.running = False
+                    return
+                fn, args = self.calls.popleft()
+                drained = self.full and len(self.calls) <= self.max_size // 2
+                if drained:
+                    self.full = False
+            if drained and self.on_drained:
+                self.on_drained()
+
+            start = time.time()
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception('SWI: Error in callback')
+            elapsed = time.time() - start
+            self.handled += 1
+            self.handler_time += elapsed
+            self.max_handler_time = max(self.max_handler_time, elapsed)
+
+        with self.lock:
+            if not self.calls:
+                self.running = False
+                return
+        self.dispatcher.schedule(self)
+
+    def stats(self):
+        return {
+            'depth': self.depth(),
+            'peak_depth': self.peak_depth,
+            'handled': self.handled,
+            'handler_time': self.handler_time,
+            'max_handler_time': self.max_handler_time,
+        }
+
 
 # Define protocol to communicate with remote debugger by web sockets
+#
+# Commands waiting for an answer are kept in self.commands, oldest first.
+# There are never more than max_pending of them: sending another one
+# fails the oldest. Commands without an answer after command_timeout
+# seconds (or the timeout given to send) fail with CommandTimeout, from
+# a timer on the loop (or the websocket reactor). The time every answer
+# took goes into a LatencyHistogram for its method in self.latency, and
+# self.timeouts counts the ones that never came.
+#
+# Notifications that nobody subscribed to are dropped before they are
+# parsed, self.dropped counts them by method.
+#
+# Everything else is parsed and handed to the callbacks on a Dispatcher,
+# in the order it arrived, through self.queue. If more than max_queued
+# messages are waiting the websocket stops reading until they are down
+# to half. Callbacks mustn't wait on a CommandFuture of their own
+# Protocol, its answer is queued behind them.
+#
+# Commands go out through self.outbox, written by a thread of this
+# Protocol's own, so a big write holds up neither the caller nor the
+# other Protocols. The thread goes once it has had nothing to write for
+# writer_idle seconds. A command in COALESCE replaces the same command
+# for the same target if that is still in the outbox, so saving a file
+# many times quickly only sends the latest source. When more than
+# max_queued_bytes are waiting to be written, send blocks until the
+# socket catches up.
 class Protocol(object):
 
-    def __init__(self):
+    writer_idle = 1.0
+
+    def __init__(self, compression=False, ping_interval=None, ping_timeout=None,
+                 max_pending=1000, command_timeout=None, max_queued=1000,
+                 dispatcher=None, max_queued_bytes=16 << 20,
+                 connect_timeout=10.0):
+        self.compression = compression
+        self.connect_timeout = connect_timeout
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.max_pending = max_pending
+        self.command_timeout = command_timeout
+        self.max_queued_bytes = max_queued_bytes
+        self.socket = None
+        self.messages_sent = 0
+        self.bytes_sent = 0
+        self.messages_received = 0
+        self.dropped = collections.Counter()
+        self.coalesced = 0
+        self.lock = threading.RLock()
+        self.writable = threading.Condition(self.lock)
+        self.outbox = collections.deque()
+        self.queued = {}
+        self.queued_bytes = 0
+        self.writer = None
         self.next_id = 0
-        self.commands = {}
+        self.commands = collections.OrderedDict()
+        self.latency = {}
+        self.timeouts = collections.Counter()
+        self.loop = None
         self.notifications = {}
         self.last_log_object = None
+        self.queue = DispatchQueue(dispatcher or get_dispatcher(), max_queued,
+                                   self.pause_reading, self.resume_reading)
 
-    def connect(self, url, on_open=None, on_close=None):
+    # connect in a thread of its own, or on loop if given (websocket.EventLoop)
+    def connect(self, url, on_open=None, on_close=None, loop=None):
         logger.debug('SWI: Connecting to ' + url)
         websocket.enableTrace(False)
         self.last_break = None
@@ -39,29 +358,231 @@ class Protocol(object):
         self.url = url
         self.on_open = on_open
         self.on_close = on_close
+        self.loop = loop
+        if loop:
+            self.socket = self.create_socket()
+            self.socket.run_in(loop)
+            return
         thread = threading.Thread(target=self.thread_callback)
         thread.start()
 
     def disconnect(self):
         logger.debug('SWI: Disconnecting')
         self.socket.close()
+        # don't keep an idle writer around
+        with self.writable:
+            self.writable.notify_all()
 
     # start connect with new thread
     def thread_callback(self):
         logger.debug('SWI: Thread started')
-        self.socket = websocket.WebSocketApp(self.url, on_message=self.message_callback, on_open=self.open_callback, on_close=self.close_callback)
+        self.socket = self.create_socket()
         self.socket.run_forever()
         logger.debug('SWI: Thread stopped')
 
+    def create_socket(self):
+        return websocket.WebSocketApp(self.url, on_message=self.message_callback, on_open=self.open_callback, on_close=self.close_callback, compression=self.compression, ping_interval=self.ping_interval, ping_timeout=self.ping_timeout, connect_timeout=self.connect_timeout)
+
     # send command and increment command counter
-    def send(self, command, callback=None, options=None):
-        command.id = self.next_id
+    # returns a CommandFuture for the answer
+    #
+    # Safe to call from any thread: the command joins self.outbox and the
+    # writer thread writes it to the socket.
+    # errback(command, error) is called if it fails (error from Chrome,
+    # timeout, dropped or connection closed).
+    def send(self, command, callback=None, options=None, timeout=None,
+             errback=None):
         command.callback = callback
         command.options = options
-        self.commands[command.id] = command
-        self.next_id += 1
-        logger.debug('SWI: ' + json.dumps(command.request))
-        self.socket.send(json.dumps(command.request))
+        command.future = CommandFuture(command, self.forget)
+        command.sent = time.time()
+        command.timer = None
+        if timeout is None:
+            timeout = self.command_timeout
+        if errback:
+            def failed(future):
+                if future.error and not future.cancelled():
+                    errback(command, future.error)
+            command.future.add_done_callback(failed)
+
+        with self.lock:
+            command.id = self.next_id
+            self.next_id += 1
+            dropped = []
+            while len(self.commands) >= self.max_pending:
+                _, oldest = self.commands.popitem(last=False)
+                if oldest.timer:
+                    oldest.timer.cancel()
+                dropped.append(oldest)
+            self.commands[command.id] = command
+            if timeout:
+                command.timer = self.timers().call_later(
+                    timeout, self.timed_out, command, timeout)
+        for oldest in dropped:
+            oldest.future.set_exception(ProtocolError(
+                'Dropped, more than %d commands waiting' % self.max_pending))
+
+        key = None
+        if command.method in COALESCE:
+            key = (command.method, command.params.get(COALESCE[command.method]))
+        # serialized once, the utf-8 bytes go straight into the frame
+        payload = command.serialize()
+        # the params can be a whole script, don't keep them around
+        command.release_params()
+        self.enqueue(command, payload, key)
+        return command.future
+
+    # queue a serialized command for the socket, replacing one that is
+    # still waiting there with the same key
+    def enqueue(self, command, payload, key):
+        with self.writable:
+            while True:
+                # what it replaces is as good as written
+                entry = self.queued.get(key) if key is not None else None
+                waiting = self.queued_bytes - (len(entry[1]) if entry else 0)
+                if not waiting or \
+                        waiting + len(payload) <= self.max_queued_bytes:
+                    break
+                self.writable.wait()
+
+            superseded = None
+            if key is not None:
+                entry = self.queued.pop(key, None)
+                if entry:
+                    superseded = entry[0]
+                    self.take(superseded.id)
+                    self.queued_bytes -= len(entry[1])
+                    entry[1] = None
+                    self.coalesced += 1
+            entry = [command, payload, key]
+            self.outbox.append(entry)
+            if key is not None:
+                self.queued[key] = entry
+            self.queued_bytes += len(payload)
+            writer = None
+            if self.writer is None:
+                writer = self.writer = threading.Thread(target=self.write_loop,
+                                                        name='swi-writer')
+                writer.daemon = True
+            else:
+                self.writable.notify_all()
+
+        if superseded:
+            # whoever was waiting for the old source gets the new answer
+            command.future.add_done_callback(
+                lambda future: superseded.future.finish(future.value, future.error))
+        if writer:
+            writer.start()
+
+    # the writer thread, there's only ever one for a Protocol
+    def write_loop(self):
+        while True:
+            self.drain()
+            with self.writable:
+                if not self.outbox:
+                    self.writable.wait(self.writer_idle)
+                if not self.outbox:
+                    self.writer = None
+                    return
+
+    # write out the outbox, from the writer thread
+    def drain(self):
+        failed = []
+        while True:
+            with self.writable:
+                if not self.outbox:
+                    break
+                entry = self.outbox.popleft()
+                command, payload, key = entry
+                if payload is None:
+                    continue
+                if key is not None and self.queued.get(key) is entry:
+                    del self.queued[key]
+                self.queued_bytes -= len(payload)
+                self.writable.notify_all()
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('SWI: ->> %s', payload[:200])
+            try:
+                if not self.socket:
+                    raise ProtocolError('not connected')
+                self.socket.send(payload)
+            except Exception, e:
+                self.forget(command)
+                failed.append((command, ProtocolError('Send failed: %s' % e)))
+                continue
+            self.messages_sent += 1
+            self.bytes_sent += len(payload)
+
+        # outside the lock, the callbacks may send
+        for command, error in failed:
+            command.future.set_exception(error)
+
+    # take a command out of self.commands and stop its timer, returns
+    # the command if it was there (call with self.lock held)
+    def take(self, command_id):
+        command = self.commands.pop(command_id, None)
+        if command and command.timer:
+            command.timer.cancel()
+        return command
+
+    # drop a command, its answer will be ignored
+    def forget(self, command):
+        with self.lock:
+            self.take(command.id)
+
+    # loop or reactor the timeouts run on
+    def timers(self):
+        return self.loop or websocket.get_reactor()
+
+    # no answer to command within timeout seconds, fail it
+    def timed_out(self, command, timeout):
+        with self.lock:
+            if self.commands.get(command.id) is not command:
+                return
+            del self.commands[command.id]
+        self.timeouts[command.method] += 1
+        logger.warning('SWI: No answer to %s within %ss' % (command.method, timeout))
+        # the callbacks don't belong on the loop
+        self.queue.put(command.future.set_exception, CommandTimeout(
+            'No answer to %s within %ss' % (command.method, timeout)))
+
+    # how long Chrome took to answer each method, in seconds:
+    # {method: {'count', 'mean', 'p50', 'p95', 'p99', 'max'}}
+    def latency_stats(self):
+        return dict((method, histogram.summary())
+                    for method, histogram in self.latency.items())
+
+    # fail every command still waiting for an answer
+    def fail_pending(self, error):
+        with self.writable:
+            commands = self.commands.values()
+            self.commands.clear()
+            for command in commands:
+                if command.timer:
+                    command.timer.cancel()
+            # nothing left in there is worth sending
+            for entry in self.outbox:
+                entry[1] = None
+            self.queued.clear()
+            self.queued_bytes = 0
+            self.writable.notify_all()
+        for command in commands:
+            command.future.set_exception(error)
+
+    # latest websocket round trip time in seconds, None until measured
+    def rtt(self):
+        if self.socket:
+            return self.socket.rtt
+        return None
+
+    def pause_reading(self):
+        if self.socket:
+            self.socket.pause_reading()
+
+    def resume_reading(self):
+        if self.socket:
+            self.socket.resume_reading()
 
     # subscribe to notification with callback
     def subscribe(self, notification, callback):
@@ -72,10 +593,21 @@ class Protocol(object):
     def unsubscribe(self, notification):
         del self.notifications[notification.name]
 
-    # unsubscribe
+    # message from Chrome, a notification or the answer to a command
     def message_callback(self, ws, message):
+        self.messages_received += 1
+        match = NOTIFICATION_METHOD.match(message)
+        if match and match.group(1) not in self.notifications:
+            self.dropped[match.group(1)] += 1
+            return
+        self.queue.put(self.dispatch, message)
+
+    # parse a message and call whoever is waiting for it, on the dispatcher
+    def dispatch(self, message):
         parsed = json.loads(message)
-        logger.debug('SWI: <<- %s\n' % message)
+        # full bodies can be megabytes, websocket.frame_trace has the frames
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('SWI: <<- %s', message[:200])
 
         if 'method' in parsed:
             if parsed['method'] in self.notifications:
@@ -88,25 +620,46 @@ class Protocol(object):
             # else:
                 # print 'SWI: New unsubscribe notification --- ' + parsed['method']
         else:
-            if parsed['id'] in self.commands:
-                command = self.commands[parsed['id']]
+            with self.lock:
+                command = self.take(parsed['id'])
+            if command:
+                if command.method not in self.latency:
+                    self.latency[command.method] = LatencyHistogram()
+                self.latency[command.method].add(time.time() - command.sent)
                 if 'error' in parsed:
-                    sublime.set_timeout(lambda: sublime.error_message(parsed['error']['message']), 0)
+                    command.error = parsed['error']
+                    logger.warning('SWI: %s failed: %s' % (command.method, command.error.get('message')))
+                    command.future.set_exception(ProtocolError(command.error.get('message'), command.error.get('code')))
                 else:
-                    if 'result' in parsed:
-                        command.data = command.parser(parsed['result'])
+                    # the command is no longer pending and its timeout is
+                    # cancelled, so a failure here has to fail the future
+                    try:
+                        if 'result' in parsed:
+                            command.data = command.parser(parsed['result'])
+                        else:
+                            command.data = None
+                        if command.callback:
+                            command.callback(command)
+                    except Exception as e:
+                        logger.exception('SWI: %s answer failed' % command.method)
+                        command.future.set_exception(ProtocolError('%s: %s: %s' % (command.method, type(e).__name__, e)))
                     else:
-                        command.data = None
-                    if command.callback:
-                        command.callback(command)
+                        command.future.set_result(command.data)
             # print 'SWI: Command response with ID ' + str(parsed['id'])
 
     def open_callback(self, ws):
+        self.queue.put(self.opened)
+
+    def opened(self):
         if self.on_open:
             self.on_open()
         logger.debug('SWI: WebSocket opened')
 
     def close_callback(self, ws):
+        self.queue.put(self.closed)
+
+    def closed(self):
+        self.fail_pending(ProtocolError('Connection closed'))
         if self.on_close:
             self.on_close()
         logger.debug('SWI: WebSocket closed')
@@ -20,18 +20,20 @@ Copyright (C) 2013 Aidan Kane (aidos)
 
 """
 
+import hashlib
 import logging
+import os
 import os.path
 import threading
+import time
 import json
-import requests
-import pyinotify
 
-import websocket
 import wip
-import wip.Debugger
+from wip.utils import PreparedCommand
 import config
-from swi import Protocol
+
+# requests, pyinotify and the websocket stack are imported where they are
+# used, so importing sync (from an editor hook, say) stays quick
 
 
 logging.basicConfig()
@@ -41,23 +43,51 @@ logger.setLevel(logging.INFO)
 
 
 
-def get_page_list(port=9222):
+def get_page_list(port=9222, timeout=5.0):
     """Find pages in the active brower."""
-    tabs = requests.get('http://localhost:%s/json' % port).json()
+    import requests
+    tabs = requests.get('http://localhost:%s/json' % port,
+                        timeout=timeout).json()
     pages = [t for t in tabs if t['type'] == 'page']
     return pages
 
 
 
+def call_later(loop, delay, callback):
+    """Run callback after delay seconds, on loop if there is one or in a
+    timer thread otherwise. Returns something with a cancel method."""
+    if loop:
+        return loop.call_later(delay, callback)
+    timer = threading.Timer(delay, callback)
+    timer.start()
+    return timer
+
+
 class ChromeWatch():
-    """Going to watch over the whole Chrome instance."""
+    """Going to watch over the whole Chrome instance.
 
-    def __init__(self, port=9222):
+    All the tabs read on the websocket reactor thread, so the number of
+    threads doesn't grow with the number of tabs. A tab only has a thread
+    of its own while it is writing (pushing a file to every tab writes
+    to them all at once). Pass a websocket.EventLoop as loop to run them
+    on that loop instead."""
+
+    def __init__(self, port=9222, compression=False, loop=None,
+                 ping_interval=5.0, ping_timeout=10.0, command_timeout=30.0):
         self.port = port
+        self.compression = compression
+        if loop is None:
+            import websocket
+            loop = websocket.get_reactor()
+        self.loop = loop
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.command_timeout = command_timeout
 
         c = config.Config()
         self.mappings = c.mappings
 
+        # TabWatch for every page id
         self.protocols = dict()
         self.protocol_lock = threading.RLock()
 
@@ -71,17 +101,60 @@ class ChromeWatch():
         if not self.watch_chrome:
             return
 
+        try:
+            pages = get_page_list(self.port)
+        except Exception, e:
+            # try again next time, the tabs we have keep going
+            logger.warning('Could not list the pages in Chrome: %s' % e)
+            pages = None
+
+        if pages is not None:
+            self.update_tabs(pages)
+
+        # in a timer thread, never on the loop: asking Chrome for its
+        # pages blocks, and over a stuck tunnel it blocks for a while
+        if self.watch_chrome:
+            self.poll_timer = call_later(None, 5.0, self.poll_for_pages)
+
+    def update_tabs(self, pages):
+        """Watch the tabs that are new in pages, stop watching the ones
+        that aren't there any more."""
+
         # create a protocol for every page / tab
-        pages = get_page_list(self.port)
-        for p in pages:
-            if 'webSocketDebuggerUrl' in p:
-                ws = p['webSocketDebuggerUrl']
-                with self.protocol_lock:
-                    if ws not in self.protocols:
-                        self.protocols[ws] = TabWatch(ws, self.mappings)
+        with self.protocol_lock:
+            for p in pages:
+                if p['id'] in self.protocols:
+                    continue
+                if 'webSocketDebuggerUrl' in p:
+                    ws = p['webSocketDebuggerUrl']
+                    self.protocols[p['id']] = TabWatch(ws, self.mappings,
+                                                       self.compression,
+                                                       self.loop,
+                                                       self.ping_interval,
+                                                       self.ping_timeout,
+                                                       self.command_timeout)
+
+            # and drop the ones for tabs that have been closed
+            open_pages = set(p['id'] for p in pages)
+            for page_id in self.protocols.keys():
+                if page_id not in open_pages:
+                    self.protocols.pop(page_id).stop()
+
+    def round_trip_times(self):
+        """Latest round trip time to every tab, in seconds (None until it
+        has been measured). Keyed by page id."""
 
-        self.poll_timer = threading.Timer(5.0, self.poll_for_pages)
-        self.poll_timer.start()
+        with self.protocol_lock:
+            return dict((page_id, tab.rtt())
+                        for page_id, tab in self.protocols.items())
+
+    def latency_stats(self):
+        """How long every tab took to answer each kind of command, see
+        swi.Protocol.latency_stats. Keyed by page id."""
+
+        with self.protocol_lock:
+            return dict((page_id, tab.latency_stats())
+                        for page_id, tab in self.protocols.items())
 
     def stop(self):
         """You really need to do this to stop things from hanging on exit."""
@@ -93,128 +166,382 @@ class ChromeWatch():
         with self.protocol_lock:
             for p in self.protocols.values():
                 p.stop()
-            p = dict()
+            self.protocols = dict()
+
+
+
+
+class FileWatch(object):
+    """Tracks files being modified, for every TabWatch in the process.
+
+    One inotify watch manager and notifier thread, however many tabs.
+    Keeps the callbacks interested in each path, and watches a directory
+    (inotify works on directories) for as long as any path in it is
+    watched. The notifier thread stops when nothing is watched.
+
+    One more thread, started with the first watch, waits out the quiet
+    seconds of every change and calls the callbacks, so a checkout that
+    touches many files doesn't start a thread per file.
+
+    A file counts as changed once it has been closed after writing, or
+    renamed into place (editors that save atomically), and then left
+    alone for quiet seconds. The callbacks for its path are called once
+    per change, never while the file is still being written, with a
+    SourceChange they all share."""
+
+    def __init__(self, quiet=0.1):
+        self.quiet = quiet
+        self.lock = threading.RLock()
+        # callbacks by path
+        self.callbacks = dict()
+        # watched paths by directory
+        self.directories = dict()
+        # timer of the change waiting for quiet, by path
+        self.pending = dict()
+        self.manager = None
+        self.notifier = None
+        # runs the quiet timers and the callbacks
+        self.loop = None
+
+    def watch(self, path, callback):
+        """Call callback(change) whenever path is modified, change being
+        a SourceChange."""
+        import pyinotify
+
+        with self.lock:
+            self.callbacks.setdefault(path, set()).add(callback)
+            directory = os.path.dirname(path)
+            if directory in self.directories:
+                self.directories[directory].add(path)
+                return
+            self.directories[directory] = set([path])
+            if self.notifier is None:
+                self.start()
+            self.manager.add_watch(directory, pyinotify.IN_CLOSE_WRITE |
+                                              pyinotify.IN_MOVED_TO)
+
+    def unwatch(self, path, callback):
+        """Stop calling callback for path."""
+
+        notifier = None
+        with self.lock:
+            callbacks = self.callbacks.get(path)
+            if not callbacks or callback not in callbacks:
+                return
+            callbacks.discard(callback)
+            if callbacks:
+                return
+            del self.callbacks[path]
+            self.cancel(path)
 
+            directory = os.path.dirname(path)
+            paths = self.directories[directory]
+            paths.discard(path)
+            if paths:
+                return
+            del self.directories[directory]
+            wd = self.manager.get_wd(directory)
+            if wd is not None:
+                self.manager.rm_watch(wd)
+            if not self.directories:
+                notifier, self.notifier, self.manager = self.notifier, None, None
+
+        # not under the lock, the notifier thread may be waiting on it
+        if notifier:
+            notifier.stop()
+
+    def start(self):
+        import pyinotify
+
+        watch = self
+
+        class FileModified(pyinotify.ProcessEvent):
+            """Used for tracking files modified in the system."""
 
+            def process_IN_CLOSE_WRITE(self, event):
+                watch.on_modified(event.pathname)
+
+            def process_IN_MOVED_TO(self, event):
+                watch.on_modified(event.pathname)
+
+        if self.loop is None:
+            import websocket
+            self.loop = websocket.Reactor()
+            self.loop.start()
+
+        self.manager = pyinotify.WatchManager()
+        self.notifier = pyinotify.ThreadedNotifier(self.manager, FileModified())
+        self.notifier.daemon = True
+        self.notifier.start()
+
+    def on_modified(self, path):
+        # because we're watching whole directories we'll be notified about
+        # files nobody wants to watch (editors' temporary files among them)
+        with self.lock:
+            if path not in self.callbacks:
+                return
+            # wait for quiet seconds without another write
+            self.cancel(path)
+            change = []
+            change.append(self.loop.call_later(
+                self.quiet, lambda: self.on_settled(path, change)))
+            self.pending[path] = change
+
+    def cancel(self, path):
+        change = self.pending.pop(path, None)
+        if change:
+            change[0].cancel()
+
+    def on_settled(self, path, change):
+        with self.lock:
+            # the timer may have fired as a later write cancelled it
+            if self.pending.get(path) is not change:
+                return
+            del self.pending[path]
+            callbacks = list(self.callbacks.get(path, ()))
+        change = SourceChange(path)
+        for callback in callbacks:
+            try:
+                callback(change)
+            except Exception:
+                logger.exception('Error handling change to %s' % path)
+
+
+_file_watch = None
+_file_watch_lock = threading.Lock()
+
+
+def get_file_watch():
+    """The FileWatch all the tabs share."""
+    global _file_watch
+    with _file_watch_lock:
+        if _file_watch is None:
+            _file_watch = FileWatch()
+        return _file_watch
+
+
+# mtimes can be as coarse as 2s (FAT), 1s on many network filesystems
+RACY_WINDOW = 2.0
+
+
+def file_stamp(path):
+    """What changes when a file is written: (mtime, size, inode)."""
+    st = os.stat(path)
+    return (st.st_mtime, st.st_size, st.st_ino)
+
+
+def source_hash(src):
+    return hashlib.sha1(src).hexdigest()
+
+
+class SourceChange(object):
+    """A settled change to a watched file, shared by the tabs watching it.
+
+    The file is read, hashed and JSON encoded once at most, however many
+    tabs push it, and not at all if none of them needs to."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.src = None
+        self.digest = None
+        self.encoded = None
+        try:
+            self.stamp = file_stamp(path)
+        except OSError:
+            self.stamp = None
+        # written within RACY_WINDOW of the stat, so another write of the
+        # same size could still come with the same stamp (git's "racily
+        # clean" problem). such a stamp is never trusted.
+        self.racy = self.stamp is not None and \
+            time.time() - self.stamp[0] < RACY_WINDOW
+
+    def read(self):
+        """The source and its sha1, raises IOError."""
+        with self.lock:
+            if self.src is None:
+                with open(self.path) as f:
+                    src = f.read()
+                self.digest = source_hash(src)
+                self.src = src
+            return self.src, self.digest
+
+    def encode(self):
+        """The source as a JSON string."""
+        with self.lock:
+            if self.encoded is None:
+                self.encoded = json.dumps(self.src)
+            return self.encoded
 
 
 class TabWatch(object):
     """Watch a Tab in the browser. Keep a list of scripts that have
-    been parsed and push updates back out."""
+    been parsed and push updates back out.
 
-    def __init__(self, websocket, url_to_path):
+    Keeps a hash of the source Chrome has for every mapped script, so
+    saving a file without changing it doesn't push it again."""
+
+    def __init__(self, websocket, url_to_path, compression=False, loop=None,
+                 ping_interval=None, ping_timeout=None, command_timeout=None):
         self.websocket = websocket
         self.url_to_path = url_to_path
+        self.compression = compression
+        self.loop = loop
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.command_timeout = command_timeout
 
         self.protocol = None
-        self.file_manager = None
+        # note: the files are watched through the directories above them
+        self.file_watch = get_file_watch()
         self.path_to_script = dict()
-        self.watching = dict()
+        self.watching = set()
+
+        # sha1 of the source Chrome has, by scriptId
+        self.script_hashes = dict()
+        # sha1 of the sources pushed last, by scriptId
+        self.pushed_hashes = dict()
+        # sha1 of a source by Chrome's own hash of it, to skip fetching
+        # the sources of scripts that come back unchanged after a reload
+        self.chrome_hashes = dict()
+        # file_stamp of the files known to match what Chrome has, by path.
+        # only stamps taken well after the write are kept (see SourceChange)
+        self.stamps = dict()
+        self.skipped_pushes = 0
 
         # we need to lock access around state
         self.chrome_lock = threading.RLock()
         self.fs_lock = threading.RLock()
 
-        self.create_chrome_watcher()
-        # note: we actually have to watch the directory above the file
-        self.create_file_watcher()
-
         # by default we reconnect to Chrome if we los the connection
         self.keep_alive = True
         self.timer_reconnect = None
 
-    def create_file_watcher(self):
-        """Seperate thread to track files being modified."""
-
-        class FileModified(pyinotify.ProcessEvent):
-            """Used for tracking files modified in the system."""
-
-            def __init__(self, callback):
-                self.callback = callback
-
-            def process_IN_MODIFY(self, event):
-                self.callback(event.pathname)
-
-        wm = pyinotify.WatchManager()
-        handler = FileModified(self.on_script_modified)
-        self.file_notifier = pyinotify.ThreadedNotifier(wm, handler)
-        self.file_notifier.start()
-        self.file_manager = wm
+        self.create_chrome_watcher()
 
     def start_watching_script(self, path):
         """Start watching a file for modifications."""
 
         with self.fs_lock:
-            directory = os.path.dirname(path)
-
-            if directory in self.watching:
-                # already watching the directory
-                watched_paths = self.watching[directory]
-                if path not in watched_paths:
-                    watched_paths.append(path)
-            else:
-                self.watching[directory] = [path]
-                self.file_manager.add_watch(directory, pyinotify.IN_MODIFY)
+            if path in self.watching:
+                return
+            self.watching.add(path)
+        self.file_watch.watch(path, self.on_script_modified)
 
     def stop_watching_script(self, path):
         """Stop watching a file for modifications."""
 
         with self.fs_lock:
-            directory = os.path.dirname(path)
-            if directory not in self.watching:
+            if path not in self.watching:
                 return
-
-            watched_paths = self.watching[directory]
-            if path in watched_paths:
-                watched_paths.remove(path)
-
-            if len(watched_paths) == 0:
-                wd = self.file_manager.get_wd(directory)
-                self.file_manager.rm_watch(wd)
-                self.watching.remove(directory)
+            self.watching.discard(path)
+        self.file_watch.unwatch(path, self.on_script_modified)
 
     def clear_all_watches(self):
         with self.fs_lock:
-            wm = self.file_manager
-            wm.rm_watch(wm.watches.keys())
-            self.watching = dict()
+            paths, self.watching = self.watching, set()
+        for path in paths:
+            self.file_watch.unwatch(path, self.on_script_modified)
 
-
-    def on_script_modified(self, path):
+    def on_script_modified(self, change):
         """Called whenever a watched script on the filesystem is updated."""
 
+        path = change.path
         logger.info('File Modified: %s' % path)
 
-        # because we're watching a whole directory we'll be notified about
-        # files we don't actually want to watch
-        directory = os.path.dirname(path)
         with self.fs_lock:
-            if directory not in self.watching:
-                return
-            if path not in self.watching[directory]:
+            if path not in self.watching:
                 return
 
         # TODO: should really have a Queue in here because Chrome may be
         # in a disconnected state at the time (inspector running)
 
+        stamp = change.stamp
+        if stamp is None:
+            return
         with self.chrome_lock:
             _, script_id = self.path_to_script[path]
-        src = ''
-        with open(path) as f:
-            src = f.read()
+            if self.stamps.get(path) == stamp:
+                # the file hasn't been touched since it matched Chrome: a
+                # later write would have a later mtime than the stamp had
+                self.skipped_pushes += 1
+                return
+
+        try:
+            _, digest = change.read()
+        except IOError:
+            return
+
+        with self.chrome_lock:
+            if self.script_hashes.get(script_id) == digest:
+                logger.info('Unchanged, not pushed: %s' % path)
+                self.remember_stamp(path, change)
+                self.skipped_pushes += 1
+                return
+            self.pushed_hashes[script_id] = digest
+
+        # only the id and scriptId differ from one tab to the next. the
+        # protocol's own thread writes it, so the next tab doesn't wait
+        command = PreparedCommand('Debugger.setScriptSource',
+                                  {'scriptId': script_id},
+                                  {'scriptSource': change.encode()})
+        future = self.protocol.send(command)
+        future.add_done_callback(
+            lambda future: self.on_script_pushed(change, script_id, digest,
+                                                 future))
+
+    def on_script_pushed(self, change, script_id, digest, future):
+        """Called once Chrome has answered a setScriptSource."""
+
+        path = change.path
+        error = future.exception()
+        if error:
+            logger.error('Failed to update %s: %s' % (path, error))
+            return
+        # Chrome answers a source it didn't apply with a status
+        status = (future.result() or {}).get('status', 'Ok')
+        if status != 'Ok':
+            logger.error('Failed to update %s: %s' % (path, status))
+            return
 
-        # TODO: do I need a callback in here...??
-        self.protocol.send(wip.Debugger.setScriptSource(script_id, src))
+        with self.chrome_lock:
+            # an older push can finish after a newer one was sent
+            if self.pushed_hashes.get(script_id) != digest:
+                return
+            self.script_hashes[script_id] = digest
+            self.remember_stamp(path, change)
+
+    def remember_stamp(self, path, change):
+        """Note that path matches Chrome as of change, call with
+        chrome_lock held."""
+        if change.racy:
+            self.stamps.pop(path, None)
+        else:
+            self.stamps[path] = change.stamp
+
+    def on_script_source(self, script_id, chrome_hash, future):
+        """Called with the answer to the getScriptSource sent when a
+        mapped script was parsed."""
+
+        if future.exception():
+            return
+        digest = source_hash(future.result()['scriptSource'].encode('utf-8'))
+        with self.chrome_lock:
+            self.script_hashes.setdefault(script_id, digest)
+            if chrome_hash:
+                self.chrome_hashes[chrome_hash] = digest
 
 
     def create_chrome_watcher(self):
         """Create the websocket connection to Chrome."""
+        from swi import Protocol
 
         # TODO: what to do about existing
         if self.protocol:
             self.protocol.disconnect()
 
-        p = Protocol()
+        p = Protocol(self.compression, self.ping_interval, self.ping_timeout,
+                     command_timeout=self.command_timeout)
         p.subscribe(wip.Debugger.scriptParsed(), self.on_script_parsed)
         p.subscribe(wip.Debugger.globalObjectCleared(), self.on_page_reloaded)
         self.protocol = p
@@ -223,7 +550,7 @@ class TabWatch(object):
 
     def protocol_connect(self):
         self.protocol.connect(self.websocket, self.on_chrome_connected,
-                              self.on_chrome_disconnected)
+                              self.on_chrome_disconnected, self.loop)
 
     def stop(self):
         """Kill off the child threads (watching chrome and watching files)."""
@@ -236,9 +563,16 @@ class TabWatch(object):
         if self.protocol:
             self.protocol.disconnect()
 
+        # the shared file watch stops its thread with the last watch
         self.clear_all_watches()
-        if self.file_notifier:
-            self.file_notifier.stop()
+
+    def rtt(self):
+        """Latest round trip time to Chrome in seconds, None if unknown."""
+        return self.protocol.rtt()
+
+    def latency_stats(self):
+        """Latency of Chrome's answers by method, see Protocol.latency_stats."""
+        return self.protocol.latency_stats()
 
     def on_chrome_connected(self):
         """Connected to Chrome - make sure it's sending us debug info."""
@@ -252,14 +586,16 @@ class TabWatch(object):
 
         def attempt_reconnect():
             self.protocol_connect()
-        self.timer_reconnect = threading.Timer(2.0, attempt_reconnect)
-        self.timer_reconnect.start()
+        self.timer_reconnect = call_later(self.loop, 2.0, attempt_reconnect)
 
     def on_page_reloaded(self, data, notification):
         """Called from Chrome everytime the page is reloaded."""
         # reset the scripts / watchers
         with self.chrome_lock:
             self.path_to_script = dict()
+            self.script_hashes = dict()
+            self.pushed_hashes = dict()
+            self.stamps = dict()
         self.clear_all_watches()
 
     def on_script_parsed(self, data, notification):
@@ -272,10 +608,22 @@ class TabWatch(object):
 
         if local_path:
             # TODO: could be two urls mapping to the same local_path
+            chrome_hash = data.get('hash')
             with self.chrome_lock:
                 self.path_to_script[local_path] = (url, script_id)
+                known = self.chrome_hashes.get(chrome_hash)
+                if known:
+                    self.script_hashes[script_id] = known
             self.start_watching_script(local_path)
 
+            if not known:
+                # find out what Chrome has, to compare saved files with
+                future = self.protocol.send(
+                    wip.Debugger.getScriptSource(script_id))
+                future.add_done_callback(
+                    lambda future: self.on_script_source(script_id,
+                                                         chrome_hash, future))
+
     def get_local_path_of_url(self, url):
         """Check if the given url is one that we have mapped."""
 
@@ -23,10 +23,20 @@ Copyright (C) 2010 Hiroki Ohtani(liris)
 import socket
 from urlparse import urlparse
 import os
+import errno
+import fcntl
+import heapq
+import itertools
+import select
 import struct
+import time
 import uuid
 import sha
+import array
 import base64
+import collections
+import threading
+import zlib
 import logging
 
 """
@@ -71,6 +81,8 @@ traceEnabled = False
 def enableTrace(tracable):
     """
     turn on/off the tracability.
+    The handshake is logged. Frames are not logged, they are always
+    recorded in frame_trace instead. See dumpTrace.
 
     tracable: boolean value. if set True, tracability is enabled.
     """
@@ -82,6 +94,134 @@ def enableTrace(tracable):
         logger.setLevel(logging.DEBUG)
 
 
+TraceRecord = collections.namedtuple("TraceRecord",
+    "time connection direction opcode flags length head")
+
+
+class FrameTrace(object):
+    """
+    Fixed size ring buffer of the most recent frames sent and received.
+    Everything is preallocated and recording a frame is a handful of
+    array stores, so it can be left on all the time and dumped when
+    something goes wrong.
+    """
+
+    SEND = 0
+    RECV = 1
+
+    # file format of dump, a header then one record per frame,
+    # each record followed by its head.
+    MAGIC = "WSTRACE1"
+    _HEADER = struct.Struct("!8sI")
+    _RECORD = struct.Struct("!dIBBBQH")
+
+    def __init__(self, size = 4096, head_size = 64):
+        """
+        size: number of frames to keep.
+
+        head_size: number of payload bytes kept from every frame.
+        """
+        self.size = size
+        self.head_size = head_size
+        self._times = array.array("d", [0.0]) * size
+        self._connections = array.array("L", [0]) * size
+        self._directions = bytearray(size)
+        self._opcodes = bytearray(size)
+        self._flags = bytearray(size)
+        self._lengths = array.array("L", [0]) * size
+        self._heads = [""] * size
+        # next() on a count is atomic, so threads don't need a lock.
+        self._counter = itertools.count()
+        self._recorded = 0
+
+    def record(self, connection, direction, opcode, flags, length, data):
+        """
+        record a frame.
+
+        connection: number telling the connections apart.
+
+        direction: SEND or RECV.
+
+        flags: fin and rsv bits of the frame, as in its first byte.
+
+        length: payload length on the wire.
+
+        data: payload, only the head of it is kept.
+        """
+        n = next(self._counter)
+        i = n % self.size
+        self._times[i] = time.time()
+        self._connections[i] = connection
+        self._directions[i] = direction
+        self._opcodes[i] = opcode
+        self._flags[i] = flags
+        self._lengths[i] = length
+        self._heads[i] = _tobytes(data[:self.head_size])
+        self._recorded = n + 1
+
+    def records(self):
+        """
+        return value: list of TraceRecord, oldest first.
+        """
+        end = self._recorded
+        start = max(0, end - self.size)
+        result = []
+        for n in range(start, end):
+            i = n % self.size
+            result.append(TraceRecord(self._times[i], self._connections[i],
+                self._directions[i], self._opcodes[i], self._flags[i],
+                self._lengths[i], self._heads[i]))
+        return result
+
+    def dump(self, path):
+        """
+        write the recorded frames to path, oldest first.
+        """
+        records = self.records()
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(self.MAGIC, len(records)))
+            for r in records:
+                f.write(self._RECORD.pack(r.time, r.connection, r.direction,
+                    r.opcode, r.flags, r.length, len(r.head)))
+                f.write(r.head)
+
+    @staticmethod
+    def load(path):
+        """
+        read a file written by dump.
+
+        return value: list of TraceRecord, oldest first.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, count = FrameTrace._HEADER.unpack_from(data)
+        if magic != FrameTrace.MAGIC:
+            raise ValueError("%s is not a frame trace" % path)
+        offset = FrameTrace._HEADER.size
+        records = []
+        for _ in range(count):
+            fields = FrameTrace._RECORD.unpack_from(data, offset)
+            offset += FrameTrace._RECORD.size
+            head = data[offset:offset + fields[-1]]
+            offset += fields[-1]
+            records.append(TraceRecord(*(fields[:-1] + (head,))))
+        return records
+
+
+# every frame is recorded here. Set to None to stop recording.
+frame_trace = FrameTrace()
+
+
+def dumpTrace(path):
+    """
+    write the most recent frames to a file. see FrameTrace.load.
+
+    path: file to write.
+    """
+    if frame_trace is not None:
+        frame_trace.dump(path)
+
+
 def setdefaulttimeout(timeout):
     """
     Set the global timeout setting to connect.
@@ -176,6 +316,15 @@ def _create_sec_websocket_key():
     uid = uuid.uuid4()
     return base64.encodestring(uid.bytes).strip()
 
+_connection_ids = itertools.count(1)
+
+# only linux knows about MSG_MORE.
+_MSG_MORE = getattr(socket, "MSG_MORE", 0)
+
+# initial size of the buffer the receive path reads into.
+# it grows to fit bigger frames and shrinks back once they are consumed.
+_RECV_BUFFER_SIZE = 1 << 16
+
 _HEADERS_TO_CHECK = {
     "upgrade": "websocket",
     "connection": "upgrade",
@@ -189,8 +338,19 @@ class _SSLSocketWrapper(object):
     def recv(self, bufsize):
         return self.ssl.read(bufsize)
 
+    def recv_into(self, buffer):
+        data = self.ssl.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
     def send(self, payload):
-        return self.ssl.write(payload)
+        return self.ssl.write(_tobytes(payload))
+
+
+def _tobytes(data):
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    return data
 
 
 _BOOL_VALUES = (0, 1)
@@ -210,6 +370,7 @@ class ABNF(object):
     """
 
     # operation code values.
+    OPCODE_CONT   = 0x0
     OPCODE_TEXT   = 0x1
     OPCODE_BINARY = 0x2
     OPCODE_CLOSE  = 0x8
@@ -217,11 +378,12 @@ class ABNF(object):
     OPCODE_PONG   = 0xa
 
     # available operation code value tuple
-    OPCODES = (OPCODE_TEXT, OPCODE_BINARY, OPCODE_CLOSE,
+    OPCODES = (OPCODE_CONT, OPCODE_TEXT, OPCODE_BINARY, OPCODE_CLOSE,
                 OPCODE_PING, OPCODE_PONG)
 
     # opcode human readable string
     OPCODE_MAP = {
+        OPCODE_CONT: "cont",
         OPCODE_TEXT: "text",
         OPCODE_BINARY: "binary",
         OPCODE_CLOSE: "close",
@@ -269,6 +431,18 @@ class ABNF(object):
         """
         format this object to string(byte array) to send data to server.
         """
+        header, payload = self.format_parts()
+        return header + str(payload)
+
+    def format_parts(self):
+        """
+        format this object to send data to server, without joining the
+        header to the payload.
+
+        return value: tuple of header and payload. The payload is a
+          bytearray if it had to be masked. The mask key, if any, is
+          part of the header.
+        """
         if not _is_bool(self.fin, self.rsv1, self.rsv2, self.rsv3):
             raise ValueError("not 0 or 1")
         if self.opcode not in ABNF.OPCODES:
@@ -290,30 +464,141 @@ class ABNF(object):
             frame_header += struct.pack("!Q", length)
 
         if not self.mask:
-            return frame_header + self.data
+            return frame_header, self.data
         else:
             mask_key = self.get_mask_key(4)
-            return frame_header + self._get_masked(mask_key)
-
-    def _get_masked(self, mask_key):
-        s = ABNF.mask(mask_key, self.data)
-        return mask_key + "".join(s)
+            return frame_header + mask_key, _mask(mask_key, self.data)
 
     @staticmethod
     def mask(mask_key, data):
         """
         mask or unmask data. Just do xor for each byte
 
+        The xor is done in bulk rather than one python byte at a time:
+        every 4th byte shares the same key byte, so each of those 4 lanes
+        is pulled out with an extended slice, xor-ed in C through a
+        translation table and written back in place.
+
         mask_key: 4 byte string(byte).
 
-        data: data to mask/unmask.
+        data: data to mask/unmask. string, bytearray or memoryview.
+
+        return value: masked string(byte array).
+        """
+        return str(_mask(mask_key, data))
+
+
+def _mask(mask_key, data):
+    """
+    ABNF.mask, but returns the bytearray it masked in place, to save
+    copying it into a string when it is going straight to the socket.
+    """
+    masked = bytearray(data)
+    for i in range(4):
+        table = _xor_table(ord(mask_key[i]))
+        masked[i::4] = masked[i::4].translate(table)
+    return masked
+
+
+_XOR_TABLES = {}
+def _xor_table(key):
+    """
+    translation table that xors every byte with key.
+    """
+    table = _XOR_TABLES.get(key)
+    if table is None:
+        table = "".join(chr(i ^ key) for i in range(256))
+        _XOR_TABLES[key] = table
+    return table
+
+
+# deflate block trailer that permessage-deflate strips from every message.
+_DEFLATE_TAIL = "\x00\x00\xff\xff"
+
+# messages smaller than this are not worth compressing.
+_DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+
+class _PerMessageDeflate(object):
+    """
+    permessage-deflate extension.
+    see http://tools.ietf.org/html/rfc7692
+    """
+
+    # offered to the server in the handshake. client_max_window_bits
+    # isn't offered: the server could ask for an 8 bit window, and zlib
+    # can't produce raw deflate streams with one.
+    OFFER = "permessage-deflate"
+
+    def __init__(self, params, threshold = _DEFAULT_COMPRESSION_THRESHOLD,
+                 level = 1):
+        """
+        params: dict of the extension parameters the server accepted.
+
+        threshold: payloads shorter than this are sent uncompressed.
+
+        level: zlib compression level. Pushes are latency bound, so the
+          default favours speed over ratio.
+        """
+        self.threshold = threshold
+        self.level = level
+        self.client_no_context_takeover = \
+            "client_no_context_takeover" in params
+        self.server_no_context_takeover = \
+            "server_no_context_takeover" in params
+        self.client_max_window_bits = zlib.MAX_WBITS
+        self._compressor = None
+        self._decompressor = None
+
+    @staticmethod
+    def parse(header):
+        """
+        parse the Sec-WebSocket-Extensions response header.
+
+        return value: dict of permessage-deflate parameters,
+          or None if the server did not accept the extension.
+        """
+        for extension in header.split(","):
+            parts = [p.strip() for p in extension.split(";")]
+            if parts[0] != "permessage-deflate":
+                continue
+            params = {}
+            for param in parts[1:]:
+                kv = param.split("=", 1)
+                if len(kv) == 2:
+                    params[kv[0].strip()] = kv[1].strip().strip('"')
+                else:
+                    params[kv[0]] = None
+            return params
+        return None
+
+    def compress(self, data):
+        """
+        compress one message payload.
+        """
+        if self._compressor is None or self.client_no_context_takeover:
+            self._compressor = zlib.compressobj(self.level, zlib.DEFLATED,
+                                                -self.client_max_window_bits)
+        compressor = self._compressor
+        compressed = compressor.compress(data) + \
+            compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed[:-len(_DEFLATE_TAIL)]
+
+    def decompress(self, data, fin):
+        """
+        decompress one fragment of a compressed message.
+
+        fin: 1 for the final fragment of the message.
         """
-        _m = map(ord, mask_key)
-        _d = map(ord, data)
-        for i in range(len(_d)):
-            _d[i] ^= _m[i % 4]
-        s = map(chr, _d)
-        return "".join(s)
+        if self._decompressor is None:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        decompressor = self._decompressor
+        data = decompressor.decompress(_tobytes(data))
+        if fin:
+            data += decompressor.decompress(_DEFLATE_TAIL)
+            if self.server_no_context_takeover:
+                self._decompressor = None
+        return data
 
 
 class WebSocket(object):
@@ -344,6 +629,21 @@ class WebSocket(object):
         self.connected = False
         self.io_sock = self.sock = socket.socket()
         self.get_mask_key = get_mask_key
+        self.deflate = None
+        # tells this connection apart in the frame trace.
+        self.connection_id = next(_connection_ids)
+        # called with the payload of every pong from the server.
+        self.on_pong = None
+        # frames are written in pieces, don't let two threads interleave.
+        self._send_lock = threading.Lock()
+        # control frames waiting for the thread writing a data frame to
+        # finish, as (frame, on_write) tuples.
+        self._control = collections.deque()
+        self._reset_buffer()
+        # opcode and data of a fragmented message being collected.
+        self._message_opcode = None
+        self._message = None
+        self._message_compressed = False
 
     def set_mask_key(self, func):
         """
@@ -381,24 +681,31 @@ class WebSocket(object):
         >>> ws.connect("ws://echo.websocket.org/",
         ...     headers={"User-Agent": "MyProgram"})
 
-        timeout: socket timeout time. This value is integer.
-                 if you set None for this value,
-                 it means "use default_timeout value"
-
-        options: current support option is only "header".
-                 if you set header as dict value,
+        options: "header" - if you set header as dict value,
                  the custom HTTP headers are added.
+                 "timeout" - give up on connecting and on the handshake
+                 after this many seconds. The socket's own timeout is
+                 put back afterwards.
+                 "compression" - if True, offer permessage-deflate.
+                 "compression_threshold" - messages shorter than this
+                 many bytes are sent uncompressed.
+                 "compression_level" - zlib compression level.
 
         """
         hostname, port, resource, is_secure = _parse_url(url)
+        timeout = options.get("timeout")
+        if timeout is not None:
+            old_timeout = self.sock.gettimeout()
+            self.sock.settimeout(timeout)
         # TODO: we need to support proxy
         self.sock.connect((hostname, port))
         if is_secure:
             self.io_sock = _SSLSocketWrapper(self.sock)
         self._handshake(hostname, port, resource, **options)
+        if timeout is not None:
+            self.sock.settimeout(old_timeout)
 
     def _handshake(self, host, port, resource, **options):
-        sock = self.io_sock
         headers = []
         headers.append("GET %s HTTP/1.1" % resource)
         headers.append("Upgrade: websocket")
@@ -414,6 +721,9 @@ class WebSocket(object):
         headers.append("Sec-WebSocket-Key: %s" % key)
         headers.append("Sec-WebSocket-Protocol: chat, superchat")
         headers.append("Sec-WebSocket-Version: %s" % VERSION)
+        if options.get("compression"):
+            headers.append("Sec-WebSocket-Extensions: %s"
+                           % _PerMessageDeflate.OFFER)
         if "header" in options:
             headers.extend(options["header"])
 
@@ -421,9 +731,14 @@ class WebSocket(object):
         headers.append("")
 
         header_str = "\r\n".join(headers)
-        sock.send(header_str)
+        # a url from json (Chrome's page list) makes this unicode, which
+        # has no buffer to send from.
+        if isinstance(header_str, unicode):
+            header_str = header_str.encode("utf-8")
+        self._send_all(header_str)
         if traceEnabled:
-            logger.debug( "--- request header ---")
+            logger.debug("--- request header (connection %d) ---"
+                         % self.connection_id)
             logger.debug( header_str)
             logger.debug("-----------------------")
 
@@ -437,6 +752,21 @@ class WebSocket(object):
             self.close()
             raise WebSocketException("Invalid WebSocket Header")
 
+        extensions = resp_headers.get("sec-websocket-extensions")
+        if extensions:
+            params = _PerMessageDeflate.parse(extensions)
+            # client_max_window_bits wasn't offered, so the server
+            # mustn't set it.
+            if params is None or not options.get("compression") or \
+                    "client_max_window_bits" in params:
+                self.close()
+                raise WebSocketException("Unexpected extension %s"
+                                         % extensions)
+            self.deflate = _PerMessageDeflate(params,
+                options.get("compression_threshold",
+                            _DEFAULT_COMPRESSION_THRESHOLD),
+                options.get("compression_level", 1))
+
         self.connected = True
 
     def _validate_header(self, headers, key):
@@ -495,22 +825,82 @@ class WebSocket(object):
                   Otherwise, it must be string(byte array)
 
         opcode: operation code to send. Please see OPCODE_XXX.
+          control frames (ping, pong, close) never wait for a data
+          frame another thread is writing, they are written after it.
         """
+        if opcode in (ABNF.OPCODE_CLOSE, ABNF.OPCODE_PING, ABNF.OPCODE_PONG):
+            self._send_control(payload, opcode)
+            return
         frame = ABNF.create_frame(payload, opcode)
         if self.get_mask_key:
             frame.get_mask_key = self.get_mask_key
-        data = frame.format()
-        self.io_sock.send(data)
-        if traceEnabled:
-            logger.debug("send: " + repr(data))
+        with self._send_lock:
+            # compressed under the lock: with context takeover the server
+            # has to get the messages in the order they were compressed.
+            deflate = self.deflate
+            if deflate and opcode in (ABNF.OPCODE_TEXT, ABNF.OPCODE_BINARY) \
+                    and len(frame.data) >= deflate.threshold:
+                frame.data = deflate.compress(frame.data)
+                frame.rsv1 = 1
+            header, data = frame.format_parts()
+            # MSG_MORE lets the kernel put the header in the same packet
+            # as the start of the payload.
+            self._send_all(header, _MSG_MORE)
+            self._send_all(data)
+            self._trace_send(frame, header, data)
+            self._write_control()
+        self._flush_control()
+
+    def sending(self):
+        """
+        True while a thread is writing a frame.
+        """
+        return self._send_lock.locked()
+
+    def _send_control(self, payload, opcode, on_write = None):
+        frame = ABNF.create_frame(payload, opcode)
+        if self.get_mask_key:
+            frame.get_mask_key = self.get_mask_key
+        self._control.append((frame, on_write))
+        self._flush_control()
 
-    def ping(self, payload = ""):
+    def _flush_control(self):
+        """
+        write the queued control frames, unless another thread is
+        writing: it writes them as soon as its frame is out.
+        """
+        while self._control and self._send_lock.acquire(False):
+            try:
+                self._write_control()
+            finally:
+                self._send_lock.release()
+
+    def _write_control(self):
+        # call with _send_lock held.
+        while self._control:
+            frame, on_write = self._control.popleft()
+            if on_write:
+                on_write()
+            header, data = frame.format_parts()
+            self._send_all(header + str(data))
+            self._trace_send(frame, header, data)
+
+    def _trace_send(self, frame, header, data):
+        trace = frame_trace
+        if trace is not None:
+            trace.record(self.connection_id, FrameTrace.SEND, frame.opcode,
+                         ord(header[0]) & 0xf0, len(data), frame.data)
+
+    def ping(self, payload = "", on_write = None):
         """
         send ping data.
 
         payload: data payload to send server.
+
+        on_write: called just before the ping is written, which is later
+          than this if another thread is writing a data frame.
         """
-        self.send(payload, ABNF.OPCODE_PING)
+        self._send_control(payload, ABNF.OPCODE_PING, on_write)
 
     def pong(self, payload):
         """
@@ -529,25 +919,115 @@ class WebSocket(object):
         opcode, data = self.recv_data()
         return data
 
-    def recv_data(self):
+    def recv_data(self, consumer = None):
         """
         Recieve data with operation code.
+        Fragmented messages are put back together, so data is always a
+        whole message.
+
+        consumer: optional callable to stream the message instead.
+          each fragment is handed over as consumer(data, fin) as soon as
+          it arrives and nothing is collected. (opcode, None) is returned
+          once the final fragment has been passed on.
 
         return  value: tuple of operation code and string(byte array) value.
         """
         while True:
-            frame = self.recv_frame()
+            frame = self._parse_frame(copy = False)
             if not frame:
-                # handle error: 
-                # 'NoneType' object has no attribute 'opcode'
-                raise WebSocketException("Not a valid frame %s" % frame)
-            elif frame.opcode in (ABNF.OPCODE_TEXT, ABNF.OPCODE_BINARY):
-                return (frame.opcode, frame.data)
-            elif frame.opcode == ABNF.OPCODE_CLOSE:
-                self.send_close()
-                return (frame.opcode, None)
-            elif frame.opcode == ABNF.OPCODE_PING:
-                self.pong("Hi!")
+                self._fill(self._recv_needed)
+                continue
+            message = self._process_frame(frame, consumer)
+            if message:
+                return message
+
+    def fileno(self):
+        """
+        file descriptor of the underlying socket, to wait on with select.
+        """
+        return self.sock.fileno()
+
+    def pump(self, consumer = None, read = True):
+        """
+        Recieve whatever the server has sent so far, without waiting for
+        more. Meant for event loops: call it once the socket is readable.
+
+        consumer: see recv_data.
+
+        read: if False, only hand out what is already buffered.
+
+        return value: list of (operation code, data) tuples, one for
+          every message that was completed.
+        """
+        if read:
+            self._fill(max(self._recv_needed, 1))
+        messages = []
+        while True:
+            frame = self._parse_frame(copy = False)
+            if not frame:
+                return messages
+            message = self._process_frame(frame, consumer)
+            if message:
+                messages.append(message)
+                if message[0] == ABNF.OPCODE_CLOSE:
+                    return messages
+
+    def _process_frame(self, frame, consumer = None):
+        """
+        handle a received frame. Fragments of data messages are collected,
+        control frames are answered straight away.
+
+        return value: tuple of operation code and data once a message is
+          complete, None otherwise.
+        """
+        opcode = frame.opcode
+        if opcode in (ABNF.OPCODE_TEXT, ABNF.OPCODE_BINARY, ABNF.OPCODE_CONT):
+            if opcode == ABNF.OPCODE_CONT:
+                if self._message_opcode is None:
+                    raise WebSocketException("Unexpected continuation frame")
+                opcode = self._message_opcode
+            elif self._message_opcode is not None:
+                raise WebSocketException("Expected continuation frame")
+            else:
+                if frame.rsv1 and not self.deflate:
+                    raise WebSocketException("Unexpected compressed frame")
+                self._message_compressed = frame.rsv1
+
+            if self._message_compressed:
+                frame.data = self.deflate.decompress(frame.data, frame.fin)
+
+            if consumer:
+                consumer(_tobytes(frame.data), frame.fin)
+                if frame.fin:
+                    self._message_opcode = None
+                    return (opcode, None)
+                self._message_opcode = opcode
+                return None
+
+            if frame.fin:
+                if self._message is None:
+                    return (opcode, _tobytes(frame.data))
+                self._message += frame.data
+                data = str(self._message)
+                self._message = None
+                self._message_opcode = None
+                return (opcode, data)
+
+            if self._message is None:
+                self._message = bytearray(frame.data)
+                self._message_opcode = opcode
+            else:
+                self._message += frame.data
+            return None
+        elif opcode == ABNF.OPCODE_CLOSE:
+            self.send_close()
+            return (opcode, None)
+        elif opcode == ABNF.OPCODE_PING:
+            self.pong(_tobytes(frame.data))
+        elif opcode == ABNF.OPCODE_PONG:
+            if self.on_pong:
+                self.on_pong(_tobytes(frame.data))
+        return None
 
     def recv_frame(self):
         """
@@ -555,37 +1035,77 @@ class WebSocket(object):
 
         return value: ABNF frame object.
         """
-        header_bytes = self._recv(2)
-        if not header_bytes:
+        while True:
+            frame = self._parse_frame()
+            if frame:
+                return frame
+            self._fill(self._recv_needed)
+
+    def _parse_frame(self, copy = True):
+        """
+        parse one frame out of the receive buffer.
+
+        copy: if False, the data of an unmasked frame is a memoryview into
+          the receive buffer. It is only valid until the next read.
+
+        return value: ABNF frame object, or None if the buffer does not
+          hold a complete frame yet. In that case _recv_needed is set to
+          the number of buffered bytes the frame needs.
+        """
+        buf = self._buffer
+        pos = self._read_pos
+        available = self._write_pos - pos
+        if available < 2:
+            self._recv_needed = 2
             return None
-        b1 = ord(header_bytes[0])
+
+        b1 = buf[pos]
         fin = b1 >> 7 & 1
         rsv1 = b1 >> 6 & 1
         rsv2 = b1 >> 5 & 1
         rsv3 = b1 >> 4 & 1
         opcode = b1 & 0xf
-        b2 = ord(header_bytes[1])
+        b2 = buf[pos + 1]
         mask = b2 >> 7 & 1
         length = b2 & 0x7f
 
-        length_data = ""
+        header_length = 2
         if length == 0x7e:
-            length_data = self._recv(2)
-            length = struct.unpack("!H", length_data)[0]
+            header_length += 2
         elif length == 0x7f:
-            length_data = self._recv(8)
-            length = struct.unpack("!Q", length_data)[0]
-
-        mask_key = ""
+            header_length += 8
         if mask:
-            mask_key = self._recv(4)
-        data = self._recv_strict(length)
-        if traceEnabled:
-            recieved = header_bytes + length_data + mask_key + data
-            logger.debug("recv: " + repr(recieved))
+            header_length += 4
+        if available < header_length:
+            self._recv_needed = header_length
+            return None
+
+        if length == 0x7e:
+            length = struct.unpack_from("!H", buf, pos + 2)[0]
+        elif length == 0x7f:
+            length = struct.unpack_from("!Q", buf, pos + 2)[0]
+
+        frame_length = header_length + length
+        if available < frame_length:
+            self._recv_needed = frame_length
+            return None
+
+        view = self._buffer_view
+        start = pos + header_length
+        payload = view[start:start + length]
+        trace = frame_trace
+        if trace is not None:
+            trace.record(self.connection_id, FrameTrace.RECV, opcode,
+                         b1 & 0xf0, length, payload)
 
         if mask:
-            data = ABNF.mask(mask_key, data)
+            mask_key = view[start - 4:start].tobytes()
+            data = ABNF.mask(mask_key, payload)
+        elif copy:
+            data = payload.tobytes()
+        else:
+            data = payload
+        self._consume(frame_length)
 
         frame = ABNF(fin, rsv1, rsv2, rsv3, opcode, mask, data)
         return frame
@@ -603,13 +1123,15 @@ class WebSocket(object):
         self.send(struct.pack('!H', status) + reason, ABNF.OPCODE_CLOSE)
 
 
-    def close(self, status = STATUS_NORMAL, reason = ""):
+    def close(self, status = STATUS_NORMAL, reason = "", timeout = 3):
         """
         Close Websocket object
 
         status: status code to send. see STATUS_XXX.
 
         reason: the reason to close. This must be string.
+
+        timeout: how long to wait for the server to answer the close.
         """
         if self.connected:
             if status < 0 or status >= ABNF.LENGTH_16:
@@ -617,15 +1139,15 @@ class WebSocket(object):
 
             try:
                 self.send(struct.pack('!H', status) + reason, ABNF.OPCODE_CLOSE)
-                timeout = self.sock.gettimeout()
-                self.sock.settimeout(3)
+                old_timeout = self.sock.gettimeout()
+                self.sock.settimeout(timeout)
                 try:
                     frame = self.recv_frame()
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.error("close status: " + repr(frame.data))
                 except:
                     pass
-                self.sock.settimeout(timeout)
+                self.sock.settimeout(old_timeout)
                 self.sock.shutdown(socket.SHUT_RDWR)
             except:
                 pass
@@ -635,28 +1157,97 @@ class WebSocket(object):
         self.connected = False
         self.sock.close()
         self.io_sock = self.sock
+        self._reset_buffer()
+        self._message_opcode = None
+        self._message = None
+        self.deflate = None
+
+    def _reset_buffer(self):
+        self._buffer = bytearray(_RECV_BUFFER_SIZE)
+        self._buffer_view = memoryview(self._buffer)
+        self._read_pos = 0
+        self._write_pos = 0
+        self._recv_needed = 0
+
+    def _fill(self, needed):
+        """
+        read from the socket into the receive buffer.
+        Makes room for at least needed unread bytes, then does a single
+        recv_into.
+
+        return value: number of bytes read.
+        """
+        unread = self._write_pos - self._read_pos
+        if len(self._buffer) - self._write_pos < needed - unread or \
+                self._write_pos == len(self._buffer):
+            if needed > len(self._buffer):
+                # frame is bigger than the buffer - grow it.
+                buf = bytearray(max(needed, 2 * len(self._buffer)))
+                buf[:unread] = self._buffer_view[self._read_pos:self._write_pos]
+                self._buffer = buf
+                self._buffer_view = memoryview(buf)
+            elif self._read_pos:
+                # move the unread bytes to the front.
+                self._buffer[:unread] = \
+                    self._buffer[self._read_pos:self._write_pos]
+            self._read_pos = 0
+            self._write_pos = unread
+
+        received = self.io_sock.recv_into(self._buffer_view[self._write_pos:])
+        if not received:
+            raise WebSocketException("Connection is already closed.")
+        self._write_pos += received
+        return received
+
+    def _consume(self, size):
+        self._read_pos += size
+        if self._read_pos == self._write_pos:
+            if len(self._buffer) > _RECV_BUFFER_SIZE:
+                # don't hold on to the memory of a big frame
+                self._reset_buffer()
+            else:
+                self._read_pos = self._write_pos = 0
+
+    def _take(self, size):
+        start = self._read_pos
+        data = self._buffer_view[start:start + size].tobytes()
+        self._consume(size)
+        return data
+
+    def _send_all(self, data, flags = 0):
+        """
+        send all of data, however many calls to send it takes.
+        """
+        if isinstance(self.io_sock, _SSLSocketWrapper):
+            flags = 0
+        view = memoryview(data)
+        total = len(view)
+        sent = 0
+        while sent < total:
+            if flags:
+                sent += self.io_sock.send(view[sent:], flags)
+            else:
+                sent += self.io_sock.send(view[sent:])
 
     def _recv(self, bufsize):
-        bytes = self.io_sock.recv(bufsize)
-        return bytes
+        if self._read_pos == self._write_pos:
+            self._fill(1)
+        return self._take(min(bufsize, self._write_pos - self._read_pos))
 
     def _recv_strict(self, bufsize):
-        remaining = bufsize
-        bytes = ""
-        while remaining:
-            bytes += self._recv(remaining)
-            remaining = bufsize - len(bytes)
-
-        return bytes
+        while self._write_pos - self._read_pos < bufsize:
+            self._fill(bufsize)
+        return self._take(bufsize)
 
     def _recv_line(self):
-        line = []
+        searched = self._read_pos
         while True:
-            c = self._recv(1)
-            line.append(c)
-            if c == "\n":
-                break
-        return "".join(line)
+            end = self._buffer.find("\n", searched, self._write_pos)
+            if end >= 0:
+                return self._take(end + 1 - self._read_pos)
+            searched = self._write_pos - self._read_pos
+            self._fill(searched + 1)
+            searched += self._read_pos
 
 
 class WebSocketApp(object):
@@ -666,7 +1257,10 @@ class WebSocketApp(object):
     """
     def __init__(self, url,
                  on_open = None, on_message = None, on_error = None,
-                 on_close = None, keep_running = True, get_mask_key = None):
+                 on_close = None, keep_running = True, get_mask_key = None,
+                 on_fragment = None, compression = False,
+                 ping_interval = None, ping_timeout = None,
+                 connect_timeout = 10):
         """
         url: websocket url.
         on_open: callable object which is called at opening websocket.
@@ -685,6 +1279,22 @@ class WebSocketApp(object):
          keep running, defaults to True
        get_mask_key: a callable to produce new mask keys, see the WebSocket.set_mask_key's
          docstring for more information
+       on_fragment: callable object which is called for every fragment of
+         a message as it arrives, instead of on_message for whole messages.
+         on_fragment has 3 arguments.
+         The 1st arugment is this class object.
+         The 2nd arugment is the fragment data.
+         The 3rd arugment is the fin flag, 1 for the last fragment.
+       compression: a boolean flag indicating whether to negotiate
+         permessage-deflate with the server, defaults to False
+       ping_interval: send a ping every this many seconds, to measure the
+         round trip time. None disables pings.
+       ping_timeout: if a pong doesn't come back within this many seconds
+         the connection is treated as dead and shut down, which ends up
+         in on_error and on_close. None waits forever.
+       connect_timeout: give up on connecting if the server hasn't
+         finished the handshake within this many seconds. None waits
+         forever.
         """
         self.url = url
         self.on_open = on_open
@@ -693,12 +1303,30 @@ class WebSocketApp(object):
         self.on_close = on_close
         self.keep_running = keep_running
         self.get_mask_key = get_mask_key
+        self.on_fragment = on_fragment
+        self.compression = compression
+        self.ping_interval = ping_interval
+        self.ping_timeout = ping_timeout
+        self.connect_timeout = connect_timeout
+        # latest round trip time and a history of the recent ones, seconds.
+        self.rtt = None
+        self.rtt_samples = collections.deque(maxlen = 100)
         self.sock = None
+        self.loop = None
+        self._ping_timer = None
+        self._pings = {}
+        self._ping_sequence = itertools.count()
+        self._reading = threading.Event()
+        self._reading.set()
+        self._paused = False
+        self._connecting = False
 
     def send(self, data):
         """
         send message. data must be utf-8 string or unicode.
         """
+        if not self.sock:
+            raise WebSocketException("Connection is already closed.")
         self.sock.send(data)
 
     def close(self):
@@ -706,7 +1334,31 @@ class WebSocketApp(object):
         close websocket connection.
         """
         self.keep_running = False
-        self.sock.close()
+        if self.loop:
+            self.loop.call_soon(self._teardown)
+        else:
+            self._reading.set()
+            self.sock.close()
+
+    def pause_reading(self):
+        """
+        stop reading from the socket until resume_reading is called,
+        for when the messages can't be handled as fast as they arrive.
+        Safe to call from any thread. Pings aren't answered while paused.
+        """
+        if self.loop:
+            self.loop.call_soon(self._pause)
+        else:
+            self._reading.clear()
+
+    def resume_reading(self):
+        """
+        start reading from the socket again after pause_reading.
+        """
+        if self.loop:
+            self.loop.call_soon(self._resume)
+        else:
+            self._reading.set()
 
     def run_forever(self):
         """
@@ -716,21 +1368,205 @@ class WebSocketApp(object):
         if self.sock:
             raise WebSocketException("socket is already opened")
         try:
-            self.sock = WebSocket(self.get_mask_key)
-            self.sock.connect(self.url)
-            self._run_with_no_err(self.on_open)
+            self._open()
             while self.keep_running:
-                data = self.sock.recv()
-                if data is None:
+                self._reading.wait()
+                opcode, data = self.sock.recv_data(self._consumer())
+                if opcode == ABNF.OPCODE_CLOSE:
                     break
-                self._run_with_no_err(self.on_message, data)
+                if data is not None:
+                    self._run_with_no_err(self.on_message, data)
         except Exception, e:
             self._run_with_no_err(self.on_error, e)
         finally:
+            self._stop_pinging()
             self.sock.close()
             self._run_with_no_err(self.on_close)
             self.sock = None
 
+    def run_in(self, loop):
+        """
+        run this connection on an EventLoop instead of in run_forever.
+        Connects in a thread of its own, so a server that never answers
+        can't hold up the loop. All the callbacks, on_open included, are
+        made from the thread running the loop.
+
+        loop: EventLoop object.
+        """
+        if self.sock or self._connecting:
+            raise WebSocketException("socket is already opened")
+        self.loop = loop
+        self._connecting = True
+        thread = threading.Thread(target = self._connect_in_thread,
+                                  name = "websocket-connect")
+        thread.daemon = True
+        thread.start()
+
+    def _connect_in_thread(self):
+        sock = self._create_sock()
+        try:
+            self._connect(sock)
+        except Exception, e:
+            self.loop.call_soon(self._connect_failed, sock, e)
+            return
+        self.loop.call_soon(self._connected, sock)
+
+    def _connected(self, sock):
+        self._connecting = False
+        if not self.keep_running:
+            # closed while it was connecting.
+            sock.close(timeout = 0)
+            self._run_with_no_err(self.on_close)
+            return
+        self._start(sock)
+        try:
+            # the handshake may have read messages along with it.
+            if self._dispatch(sock.pump(self._consumer(), read = False)) \
+                    and not self._paused:
+                self.loop.add_reader(sock.fileno(), self._on_readable)
+        except Exception, e:
+            self._run_with_no_err(self.on_error, e)
+            self._teardown()
+
+    def _connect_failed(self, sock, e):
+        self._connecting = False
+        self.sock = sock
+        self._run_with_no_err(self.on_error, e)
+        self._teardown()
+
+    def _open(self):
+        self.sock = self._create_sock()
+        self._connect(self.sock)
+        self._start(self.sock)
+
+    def _create_sock(self):
+        sock = WebSocket(self.get_mask_key)
+        sock.on_pong = self._on_pong
+        return sock
+
+    def _connect(self, sock):
+        sock.connect(self.url, compression = self.compression,
+                     timeout = self.connect_timeout)
+
+    def _start(self, sock):
+        self.sock = sock
+        if self.ping_interval:
+            self._schedule_ping(sock)
+        self._run_with_no_err(self.on_open)
+
+    def _timers(self):
+        # connections in their own thread borrow the reactor for timers.
+        return self.loop or get_reactor()
+
+    def _schedule_ping(self, sock):
+        self._ping_timer = self._timers().call_later(self.ping_interval,
+                                                     self._ping, sock)
+
+    def _ping(self, sock):
+        if sock is not self.sock or not self.keep_running:
+            return
+        if sock.sending():
+            # a ping written after a big frame would time the frame, not
+            # the connection. skip this one.
+            self._schedule_ping(sock)
+            return
+        payload = str(next(self._ping_sequence))
+        # the time is taken when the ping is written, None until then.
+        self._pings[payload] = None
+
+        def written():
+            self._pings[payload] = time.time()
+
+        try:
+            sock.ping(payload, written)
+        except Exception:
+            # the reading side is going to find out about it.
+            return
+        if self.ping_timeout:
+            self._timers().call_later(self.ping_timeout, self._check_pong,
+                                      sock, payload)
+        self._schedule_ping(sock)
+
+    def _on_pong(self, payload):
+        sent = self._pings.pop(payload, None)
+        if sent:
+            self.rtt = time.time() - sent
+            self.rtt_samples.append(self.rtt)
+
+    def _check_pong(self, sock, payload):
+        if sock is not self.sock or payload not in self._pings:
+            return
+        if self._pings.get(payload, 0) is None:
+            # still waiting for a data frame to be written.
+            self._timers().call_later(self.ping_timeout, self._check_pong,
+                                      sock, payload)
+            return
+        logger.warning("No pong from %s within %ss, dropping the connection"
+                       % (self.url, self.ping_timeout))
+        # reading fails from here on, which tears the connection down.
+        try:
+            sock.sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+
+    def _stop_pinging(self):
+        if self._ping_timer:
+            self._ping_timer.cancel()
+            self._ping_timer = None
+        self._pings.clear()
+
+    def _consumer(self):
+        if self.on_fragment:
+            return self._consume_fragment
+        return None
+
+    def _pause(self):
+        if self.sock and self.sock.connected and not self._paused:
+            self.loop.remove_reader(self.sock.fileno())
+        self._paused = True
+
+    def _resume(self):
+        if self.sock and self.sock.connected and self._paused:
+            self.loop.add_reader(self.sock.fileno(), self._on_readable)
+        self._paused = False
+
+    def _on_readable(self):
+        try:
+            messages = self.sock.pump(self._consumer())
+        except Exception, e:
+            self._run_with_no_err(self.on_error, e)
+            self._teardown()
+            return
+        self._dispatch(messages)
+
+    def _dispatch(self, messages):
+        """
+        hand messages to on_message.
+
+        return value: False if the connection has been torn down.
+        """
+        for opcode, data in messages:
+            if opcode == ABNF.OPCODE_CLOSE or not self.keep_running:
+                self._teardown()
+                return False
+            if data is not None:
+                self._run_with_no_err(self.on_message, data)
+        return True
+
+    def _teardown(self):
+        if not self.sock:
+            return
+        self._stop_pinging()
+        if self.sock.connected:
+            self.loop.remove_reader(self.sock.fileno())
+        # the loop can't wait around for the server to answer.
+        self.sock.close(timeout = 0)
+        self.sock = None
+        self._run_with_no_err(self.on_close)
+
+    def _consume_fragment(self, data, fin):
+        self._run_with_no_err(self.on_fragment, data, fin)
+
     def _run_with_no_err(self, callback, *args):
         if callback:
             try:
@@ -740,6 +1576,242 @@ class WebSocketApp(object):
                     logger.error(e)
 
 
+class _Timer(object):
+    """
+    handle for a call scheduled with EventLoop.call_later.
+    """
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _SelectPoller(object):
+    """
+    waits on file descriptors with select. Works everywhere.
+    """
+    def __init__(self):
+        self._fds = set()
+
+    def register(self, fd):
+        self._fds.add(fd)
+
+    def unregister(self, fd):
+        self._fds.discard(fd)
+
+    def poll(self, timeout):
+        return select.select(list(self._fds), [], [], timeout)[0]
+
+
+class _EpollPoller(object):
+    """
+    waits on file descriptors with epoll, so the cost of a wait doesn't
+    grow with the number of sockets. Linux only.
+    """
+    def __init__(self):
+        self._epoll = select.epoll()
+
+    def register(self, fd):
+        try:
+            self._epoll.register(fd, select.EPOLLIN)
+        except IOError, e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def unregister(self, fd):
+        try:
+            self._epoll.unregister(fd)
+        except (IOError, ValueError):
+            # closing the fd already removed it
+            pass
+
+    def poll(self, timeout):
+        if timeout is None:
+            timeout = -1
+        return [fd for fd, event in self._epoll.poll(timeout)]
+
+
+class EventLoop(object):
+    """
+    Minimal event loop, to run many WebSocketApp connections on one
+    thread instead of a thread each. Uses epoll where there is one.
+
+    >>> loop = websocket.EventLoop()
+    >>> app = websocket.WebSocketApp("ws://echo.websocket.org/",
+    ...     on_message = on_message)
+    >>> app.run_in(loop)
+    >>> loop.run()
+
+    All the methods, except run, may be called from any thread.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._readers = {}
+        self._timers = []
+        self._sequence = itertools.count()
+        self._running = False
+        if hasattr(select, "epoll"):
+            self._poller = _EpollPoller()
+        else:
+            self._poller = _SelectPoller()
+        self._wakeup_fd, self._waker_fd = os.pipe()
+        for fd in (self._wakeup_fd, self._waker_fd):
+            flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+            fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        self._poller.register(self._wakeup_fd)
+
+    def add_reader(self, fd, callback, *args):
+        """
+        call callback(*args) whenever fd is readable.
+        """
+        with self._lock:
+            self._readers[fd] = (callback, args)
+            self._poller.register(fd)
+        self._wakeup()
+
+    def remove_reader(self, fd):
+        """
+        stop watching fd. Do this before the fd is closed.
+        """
+        with self._lock:
+            self._readers.pop(fd, None)
+            self._poller.unregister(fd)
+        self._wakeup()
+
+    def reader_count(self):
+        """
+        number of file descriptors being watched.
+        """
+        return len(self._readers)
+
+    def call_soon(self, callback, *args):
+        """
+        call callback(*args) from the loop as soon as possible.
+
+        return value: handle with a cancel method.
+        """
+        return self.call_later(0, callback, *args)
+
+    def call_later(self, delay, callback, *args):
+        """
+        call callback(*args) from the loop after delay seconds.
+
+        return value: handle with a cancel method.
+        """
+        timer = _Timer(time.time() + delay, callback, args)
+        with self._lock:
+            heapq.heappush(self._timers,
+                           (timer.when, next(self._sequence), timer))
+        self._wakeup()
+        return timer
+
+    def run(self):
+        """
+        run the loop in the calling thread until stop is called.
+        """
+        self._running = True
+        while self._running:
+            self._run_once()
+
+    def stop(self):
+        """
+        make run return.
+        """
+        self._running = False
+        self._wakeup()
+
+    def _run_once(self):
+        with self._lock:
+            timeout = None
+            if self._timers:
+                timeout = max(0, self._timers[0][0] - time.time())
+
+        try:
+            readable = self._poller.poll(timeout)
+        except (select.error, IOError), e:
+            if e.args[0] != errno.EINTR:
+                raise
+            readable = []
+
+        for fd in readable:
+            if fd == self._wakeup_fd:
+                self._drain_wakeup()
+                continue
+            with self._lock:
+                reader = self._readers.get(fd)
+            if reader:
+                self._run(reader[0], reader[1])
+
+        now = time.time()
+        while True:
+            with self._lock:
+                if not self._timers or self._timers[0][0] > now:
+                    break
+                timer = heapq.heappop(self._timers)[2]
+            if not timer.cancelled:
+                self._run(timer.callback, timer.args)
+
+    def _run(self, callback, args):
+        try:
+            callback(*args)
+        except Exception, e:
+            logger.exception(e)
+
+    def _wakeup(self):
+        try:
+            os.write(self._waker_fd, "x")
+        except OSError:
+            # pipe is full, the loop is going to wake up anyway
+            pass
+
+    def _drain_wakeup(self):
+        try:
+            while os.read(self._wakeup_fd, 4096):
+                pass
+        except OSError:
+            pass
+
+
+class Reactor(EventLoop):
+    """
+    EventLoop that runs in a background thread of its own.
+    """
+    def __init__(self):
+        EventLoop.__init__(self)
+        self.thread = None
+
+    def start(self):
+        """
+        start the reactor thread, if it isn't running yet.
+        """
+        with self._lock:
+            if self.thread and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run,
+                                           name="websocket-reactor")
+            self.thread.daemon = True
+            self.thread.start()
+
+
+_reactor = None
+_reactor_lock = threading.Lock()
+def get_reactor():
+    """
+    Return the process wide Reactor, starting it if need be.
+    Connections run on it share one thread, however many there are.
+    """
+    global _reactor
+    with _reactor_lock:
+        if _reactor is None:
+            _reactor = Reactor()
+        _reactor.start()
+        return _reactor
+
+
 if __name__ == "__main__":
     enableTrace(True)
     ws = create_connection("ws://echo.websocket.org/")
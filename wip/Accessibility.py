@@ -0,0 +1,244 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Accessibility.disable
+def disable():
+    params = {}
+    command = Command('Accessibility.disable', params)
+    return command
+
+
+### Accessibility.enable
+def enable():
+    params = {}
+    command = Command('Accessibility.enable', params)
+    return command
+
+
+### Accessibility.getPartialAXTree
+def getPartialAXTree(nodeId=None, backendNodeId=None, objectId=None, fetchRelatives=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    if fetchRelatives is not None:
+        params['fetchRelatives'] = fetchRelatives
+    command = Command('Accessibility.getPartialAXTree', params)
+    return command
+
+
+def getPartialAXTree_parser(result):
+    return GetPartialAXTreeResult(result)
+
+
+### Accessibility.getFullAXTree
+def getFullAXTree(depth=None, frameId=None):
+    params = {}
+    if depth is not None:
+        params['depth'] = depth
+    if frameId is not None:
+        params['frameId'] = frameId
+    command = Command('Accessibility.getFullAXTree', params)
+    return command
+
+
+def getFullAXTree_parser(result):
+    return GetFullAXTreeResult(result)
+
+
+### Accessibility.getRootAXNode
+def getRootAXNode(frameId=None):
+    params = {}
+    if frameId is not None:
+        params['frameId'] = frameId
+    command = Command('Accessibility.getRootAXNode', params)
+    return command
+
+
+def getRootAXNode_parser(result):
+    return GetRootAXNodeResult(result)
+
+
+### Accessibility.getAXNodeAndAncestors
+def getAXNodeAndAncestors(nodeId=None, backendNodeId=None, objectId=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    command = Command('Accessibility.getAXNodeAndAncestors', params)
+    return command
+
+
+def getAXNodeAndAncestors_parser(result):
+    return GetAXNodeAndAncestorsResult(result)
+
+
+### Accessibility.getChildAXNodes
+def getChildAXNodes(id, frameId=None):
+    params = {'id': id}
+    if frameId is not None:
+        params['frameId'] = frameId
+    command = Command('Accessibility.getChildAXNodes', params)
+    return command
+
+
+def getChildAXNodes_parser(result):
+    return GetChildAXNodesResult(result)
+
+
+### Accessibility.queryAXTree
+def queryAXTree(nodeId=None, backendNodeId=None, objectId=None, accessibleName=None, role=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    if accessibleName is not None:
+        params['accessibleName'] = accessibleName
+    if role is not None:
+        params['role'] = role
+    command = Command('Accessibility.queryAXTree', params)
+    return command
+
+
+def queryAXTree_parser(result):
+    return QueryAXTreeResult(result)
+
+
+### Accessibility.loadComplete
+def loadComplete():
+    notification = Notification('Accessibility.loadComplete')
+    return notification
+
+
+def loadComplete_parser(params):
+    return LoadComplete(params)
+
+
+### Accessibility.nodesUpdated
+def nodesUpdated():
+    notification = Notification('Accessibility.nodesUpdated')
+    return notification
+
+
+def nodesUpdated_parser(params):
+    return NodesUpdated(params)
+
+
+class AXRelatedNode(WIPObject):
+    fields = (
+        ('backendDOMNodeId',),
+        ('idref',),
+        ('text',),
+    )
+
+
+class AXValue(WIPObject):
+    fields = (
+        ('type',),
+        ('value',),
+        ('relatedNodes', list_of(AXRelatedNode)),
+        ('sources', list_of(lambda value: AXValueSource(value))),
+    )
+
+
+class AXValueSource(WIPObject):
+    fields = (
+        ('type',),
+        ('value', AXValue),
+        ('attribute',),
+        ('attributeValue', AXValue),
+        ('superseded',),
+        ('nativeSource',),
+        ('nativeSourceValue', AXValue),
+        ('invalid',),
+        ('invalidReason',),
+    )
+
+
+class AXProperty(WIPObject):
+    fields = (
+        ('name',),
+        ('value', AXValue),
+    )
+
+
+class AXNode(WIPObject):
+    fields = (
+        ('nodeId',),
+        ('ignored',),
+        ('ignoredReasons', list_of(AXProperty)),
+        ('role', AXValue),
+        ('chromeRole', AXValue),
+        ('name', AXValue),
+        ('description', AXValue),
+        ('value', AXValue),
+        ('properties', list_of(AXProperty)),
+        ('parentId',),
+        ('childIds',),
+        ('backendDOMNodeId',),
+        ('frameId',),
+    )
+
+
+class GetPartialAXTreeResult(LazyView):
+    fields = (
+        ('nodes', list_of(AXNode)),
+    )
+
+
+class GetFullAXTreeResult(LazyView):
+    fields = (
+        ('nodes', list_of(AXNode)),
+    )
+
+
+class GetRootAXNodeResult(LazyView):
+    fields = (
+        ('node', AXNode),
+    )
+
+
+class GetAXNodeAndAncestorsResult(LazyView):
+    fields = (
+        ('nodes', list_of(AXNode)),
+    )
+
+
+class GetChildAXNodesResult(LazyView):
+    fields = (
+        ('nodes', list_of(AXNode)),
+    )
+
+
+class QueryAXTreeResult(LazyView):
+    fields = (
+        ('nodes', list_of(AXNode)),
+    )
+
+
+class LoadComplete(LazyView):
+    fields = (
+        ('root', AXNode),
+    )
+
+
+class NodesUpdated(LazyView):
+    fields = (
+        ('nodes', list_of(AXNode)),
+    )
+
+
+register_parsers('Accessibility', globals())
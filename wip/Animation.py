@@ -0,0 +1,196 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Runtime import RemoteObject
+
+
+### Animation.disable
+def disable():
+    params = {}
+    command = Command('Animation.disable', params)
+    return command
+
+
+### Animation.enable
+def enable():
+    params = {}
+    command = Command('Animation.enable', params)
+    return command
+
+
+### Animation.getCurrentTime
+def getCurrentTime(id):
+    params = {'id': id}
+    command = Command('Animation.getCurrentTime', params)
+    return command
+
+
+### Animation.getPlaybackRate
+def getPlaybackRate():
+    params = {}
+    command = Command('Animation.getPlaybackRate', params)
+    return command
+
+
+### Animation.releaseAnimations
+def releaseAnimations(animations):
+    params = {'animations': animations}
+    command = Command('Animation.releaseAnimations', params)
+    return command
+
+
+### Animation.resolveAnimation
+def resolveAnimation(animationId):
+    params = {'animationId': animationId}
+    command = Command('Animation.resolveAnimation', params)
+    return command
+
+
+def resolveAnimation_parser(result):
+    return ResolveAnimationResult(result)
+
+
+### Animation.seekAnimations
+def seekAnimations(animations, currentTime):
+    params = {'animations': animations, 'currentTime': currentTime}
+    command = Command('Animation.seekAnimations', params)
+    return command
+
+
+### Animation.setPaused
+def setPaused(animations, paused):
+    params = {'animations': animations, 'paused': paused}
+    command = Command('Animation.setPaused', params)
+    return command
+
+
+### Animation.setPlaybackRate
+def setPlaybackRate(playbackRate):
+    params = {'playbackRate': playbackRate}
+    command = Command('Animation.setPlaybackRate', params)
+    return command
+
+
+### Animation.setTiming
+def setTiming(animationId, duration, delay):
+    params = {'animationId': animationId, 'duration': duration, 'delay': delay}
+    command = Command('Animation.setTiming', params)
+    return command
+
+
+### Animation.animationCanceled
+def animationCanceled():
+    notification = Notification('Animation.animationCanceled')
+    return notification
+
+
+def animationCanceled_parser(params):
+    return params
+
+
+### Animation.animationCreated
+def animationCreated():
+    notification = Notification('Animation.animationCreated')
+    return notification
+
+
+def animationCreated_parser(params):
+    return params
+
+
+### Animation.animationStarted
+def animationStarted():
+    notification = Notification('Animation.animationStarted')
+    return notification
+
+
+def animationStarted_parser(params):
+    return AnimationStarted(params)
+
+
+### Animation.animationUpdated
+def animationUpdated():
+    notification = Notification('Animation.animationUpdated')
+    return notification
+
+
+def animationUpdated_parser(params):
+    return AnimationUpdated(params)
+
+
+class KeyframeStyle(WIPObject):
+    fields = (
+        ('offset',),
+        ('easing',),
+    )
+
+
+class KeyframesRule(WIPObject):
+    fields = (
+        ('name',),
+        ('keyframes', list_of(KeyframeStyle)),
+    )
+
+
+class AnimationEffect(WIPObject):
+    fields = (
+        ('delay',),
+        ('endDelay',),
+        ('iterationStart',),
+        ('iterations',),
+        ('duration',),
+        ('direction',),
+        ('fill',),
+        ('backendNodeId',),
+        ('keyframesRule', KeyframesRule),
+        ('easing',),
+    )
+
+
+class ViewOrScrollTimeline(WIPObject):
+    fields = (
+        ('sourceNodeId',),
+        ('startOffset',),
+        ('endOffset',),
+        ('subjectNodeId',),
+        ('axis',),
+    )
+
+
+class Animation(WIPObject):
+    fields = (
+        ('id',),
+        ('name',),
+        ('pausedState',),
+        ('playState',),
+        ('playbackRate',),
+        ('startTime',),
+        ('currentTime',),
+        ('type',),
+        ('source', AnimationEffect),
+        ('cssId',),
+        ('viewOrScrollTimeline', ViewOrScrollTimeline),
+    )
+
+
+class ResolveAnimationResult(LazyView):
+    fields = (
+        ('remoteObject', RemoteObject),
+    )
+
+
+class AnimationStarted(LazyView):
+    fields = (
+        ('animation', Animation),
+    )
+
+
+class AnimationUpdated(LazyView):
+    fields = (
+        ('animation', Animation),
+    )
+
+
+register_parsers('Animation', globals())
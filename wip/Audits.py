@@ -0,0 +1,391 @@
+"""
+Audits domain. Audits domain allows investigation of page violations and
+possible improvements.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Network import RequestId
+
+
+### Audits.getEncodedResponse
+def getEncodedResponse(requestId, encoding, quality=None, sizeOnly=None):
+    params = {'requestId': requestId, 'encoding': encoding}
+    if quality is not None:
+        params['quality'] = quality
+    if sizeOnly is not None:
+        params['sizeOnly'] = sizeOnly
+    command = Command('Audits.getEncodedResponse', params)
+    return command
+
+
+### Audits.disable
+def disable():
+    params = {}
+    command = Command('Audits.disable', params)
+    return command
+
+
+### Audits.enable
+def enable():
+    params = {}
+    command = Command('Audits.enable', params)
+    return command
+
+
+### Audits.checkContrast
+def checkContrast(reportAAA=None):
+    params = {}
+    if reportAAA is not None:
+        params['reportAAA'] = reportAAA
+    command = Command('Audits.checkContrast', params)
+    return command
+
+
+### Audits.checkFormsIssues
+def checkFormsIssues():
+    params = {}
+    command = Command('Audits.checkFormsIssues', params)
+    return command
+
+
+def checkFormsIssues_parser(result):
+    return CheckFormsIssuesResult(result)
+
+
+### Audits.issueAdded
+def issueAdded():
+    notification = Notification('Audits.issueAdded')
+    return notification
+
+
+def issueAdded_parser(params):
+    return IssueAdded(params)
+
+
+class AffectedCookie(WIPObject):
+    fields = (
+        ('name',),
+        ('path',),
+        ('domain',),
+    )
+
+
+class AffectedRequest(WIPObject):
+    fields = (
+        ('requestId', RequestId),
+        ('url',),
+    )
+
+
+class AffectedFrame(WIPObject):
+    fields = (
+        ('frameId',),
+    )
+
+
+class CookieIssueInsight(WIPObject):
+    fields = (
+        ('type',),
+        ('tableEntryUrl',),
+    )
+
+
+class CookieIssueDetails(WIPObject):
+    fields = (
+        ('cookie', AffectedCookie),
+        ('rawCookieLine',),
+        ('cookieWarningReasons',),
+        ('cookieExclusionReasons',),
+        ('operation',),
+        ('siteForCookies',),
+        ('cookieUrl',),
+        ('request', AffectedRequest),
+        ('insight', CookieIssueInsight),
+    )
+
+
+class MixedContentIssueDetails(WIPObject):
+    fields = (
+        ('resourceType',),
+        ('resolutionStatus',),
+        ('insecureURL',),
+        ('mainResourceURL',),
+        ('request', AffectedRequest),
+        ('frame', AffectedFrame),
+    )
+
+
+class BlockedByResponseIssueDetails(WIPObject):
+    fields = (
+        ('request', AffectedRequest),
+        ('parentFrame', AffectedFrame),
+        ('blockedFrame', AffectedFrame),
+        ('reason',),
+    )
+
+
+class HeavyAdIssueDetails(WIPObject):
+    fields = (
+        ('resolution',),
+        ('reason',),
+        ('frame', AffectedFrame),
+    )
+
+
+class SourceCodeLocation(WIPObject):
+    fields = (
+        ('scriptId',),
+        ('url',),
+        ('lineNumber',),
+        ('columnNumber',),
+    )
+
+
+class ContentSecurityPolicyIssueDetails(WIPObject):
+    fields = (
+        ('blockedURL',),
+        ('violatedDirective',),
+        ('isReportOnly',),
+        ('contentSecurityPolicyViolationType',),
+        ('frameAncestor', AffectedFrame),
+        ('sourceCodeLocation', SourceCodeLocation),
+        ('violatingNodeId',),
+    )
+
+
+class SharedArrayBufferIssueDetails(WIPObject):
+    fields = (
+        ('sourceCodeLocation', SourceCodeLocation),
+        ('isWarning',),
+        ('type',),
+    )
+
+
+class LowTextContrastIssueDetails(WIPObject):
+    fields = (
+        ('violatingNodeId',),
+        ('violatingNodeSelector',),
+        ('contrastRatio',),
+        ('thresholdAA',),
+        ('thresholdAAA',),
+        ('fontSize',),
+        ('fontWeight',),
+    )
+
+
+class CorsIssueDetails(WIPObject):
+    fields = (
+        ('corsErrorStatus',),
+        ('isWarning',),
+        ('request', AffectedRequest),
+        ('location', SourceCodeLocation),
+        ('initiatorOrigin',),
+        ('resourceIPAddressSpace',),
+        ('clientSecurityState',),
+    )
+
+
+class AttributionReportingIssueDetails(WIPObject):
+    fields = (
+        ('violationType',),
+        ('request', AffectedRequest),
+        ('violatingNodeId',),
+        ('invalidParameter',),
+    )
+
+
+class QuirksModeIssueDetails(WIPObject):
+    fields = (
+        ('isLimitedQuirksMode',),
+        ('documentNodeId',),
+        ('url',),
+        ('frameId',),
+        ('loaderId',),
+    )
+
+
+class NavigatorUserAgentIssueDetails(WIPObject):
+    fields = (
+        ('url',),
+        ('location', SourceCodeLocation),
+    )
+
+
+class SharedDictionaryIssueDetails(WIPObject):
+    fields = (
+        ('sharedDictionaryError',),
+        ('request', AffectedRequest),
+    )
+
+
+class SRIMessageSignatureIssueDetails(WIPObject):
+    fields = (
+        ('error',),
+        ('signatureBase',),
+        ('integrityAssertions',),
+        ('request', AffectedRequest),
+    )
+
+
+class UnencodedDigestIssueDetails(WIPObject):
+    fields = (
+        ('error',),
+        ('request', AffectedRequest),
+    )
+
+
+class GenericIssueDetails(WIPObject):
+    fields = (
+        ('errorType',),
+        ('frameId',),
+        ('violatingNodeId',),
+        ('violatingNodeAttribute',),
+        ('request', AffectedRequest),
+    )
+
+
+class DeprecationIssueDetails(WIPObject):
+    fields = (
+        ('affectedFrame', AffectedFrame),
+        ('sourceCodeLocation', SourceCodeLocation),
+        ('type',),
+    )
+
+
+class BounceTrackingIssueDetails(WIPObject):
+    fields = (
+        ('trackingSites',),
+    )
+
+
+class CookieDeprecationMetadataIssueDetails(WIPObject):
+    fields = (
+        ('allowedSites',),
+        ('optOutPercentage',),
+        ('isOptOutTopLevel',),
+        ('operation',),
+    )
+
+
+class FederatedAuthRequestIssueDetails(WIPObject):
+    fields = (
+        ('federatedAuthRequestIssueReason',),
+    )
+
+
+class FederatedAuthUserInfoRequestIssueDetails(WIPObject):
+    fields = (
+        ('federatedAuthUserInfoRequestIssueReason',),
+    )
+
+
+class ClientHintIssueDetails(WIPObject):
+    fields = (
+        ('sourceCodeLocation', SourceCodeLocation),
+        ('clientHintIssueReason',),
+    )
+
+
+class FailedRequestInfo(WIPObject):
+    fields = (
+        ('url',),
+        ('failureMessage',),
+        ('requestId', RequestId),
+    )
+
+
+class PartitioningBlobURLIssueDetails(WIPObject):
+    fields = (
+        ('url',),
+        ('partitioningBlobURLInfo',),
+    )
+
+
+class ElementAccessibilityIssueDetails(WIPObject):
+    fields = (
+        ('nodeId',),
+        ('elementAccessibilityIssueReason',),
+        ('hasDisallowedAttributes',),
+    )
+
+
+class StylesheetLoadingIssueDetails(WIPObject):
+    fields = (
+        ('sourceCodeLocation', SourceCodeLocation),
+        ('styleSheetLoadingIssueReason',),
+        ('failedRequestInfo', FailedRequestInfo),
+    )
+
+
+class PropertyRuleIssueDetails(WIPObject):
+    fields = (
+        ('sourceCodeLocation', SourceCodeLocation),
+        ('propertyRuleIssueReason',),
+        ('propertyValue',),
+    )
+
+
+class UserReidentificationIssueDetails(WIPObject):
+    fields = (
+        ('type',),
+        ('request', AffectedRequest),
+        ('sourceCodeLocation', SourceCodeLocation),
+    )
+
+
+class InspectorIssueDetails(WIPObject):
+    fields = (
+        ('cookieIssueDetails', CookieIssueDetails),
+        ('mixedContentIssueDetails', MixedContentIssueDetails),
+        ('blockedByResponseIssueDetails', BlockedByResponseIssueDetails),
+        ('heavyAdIssueDetails', HeavyAdIssueDetails),
+        ('contentSecurityPolicyIssueDetails', ContentSecurityPolicyIssueDetails),
+        ('sharedArrayBufferIssueDetails', SharedArrayBufferIssueDetails),
+        ('lowTextContrastIssueDetails', LowTextContrastIssueDetails),
+        ('corsIssueDetails', CorsIssueDetails),
+        ('attributionReportingIssueDetails', AttributionReportingIssueDetails),
+        ('quirksModeIssueDetails', QuirksModeIssueDetails),
+        ('partitioningBlobURLIssueDetails', PartitioningBlobURLIssueDetails),
+        ('navigatorUserAgentIssueDetails', NavigatorUserAgentIssueDetails),
+        ('genericIssueDetails', GenericIssueDetails),
+        ('deprecationIssueDetails', DeprecationIssueDetails),
+        ('clientHintIssueDetails', ClientHintIssueDetails),
+        ('federatedAuthRequestIssueDetails', FederatedAuthRequestIssueDetails),
+        ('bounceTrackingIssueDetails', BounceTrackingIssueDetails),
+        ('cookieDeprecationMetadataIssueDetails', CookieDeprecationMetadataIssueDetails),
+        ('stylesheetLoadingIssueDetails', StylesheetLoadingIssueDetails),
+        ('propertyRuleIssueDetails', PropertyRuleIssueDetails),
+        ('federatedAuthUserInfoRequestIssueDetails', FederatedAuthUserInfoRequestIssueDetails),
+        ('sharedDictionaryIssueDetails', SharedDictionaryIssueDetails),
+        ('elementAccessibilityIssueDetails', ElementAccessibilityIssueDetails),
+        ('sriMessageSignatureIssueDetails', SRIMessageSignatureIssueDetails),
+        ('unencodedDigestIssueDetails', UnencodedDigestIssueDetails),
+        ('userReidentificationIssueDetails', UserReidentificationIssueDetails),
+    )
+
+
+class InspectorIssue(WIPObject):
+    fields = (
+        ('code',),
+        ('details', InspectorIssueDetails),
+        ('issueId',),
+    )
+
+
+class CheckFormsIssuesResult(LazyView):
+    fields = (
+        ('formIssues', list_of(GenericIssueDetails)),
+    )
+
+
+class IssueAdded(LazyView):
+    fields = (
+        ('issue', InspectorIssue),
+    )
+
+
+register_parsers('Audits', globals())
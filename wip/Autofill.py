@@ -0,0 +1,107 @@
+"""
+Autofill domain. Defines commands and events for Autofill.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Autofill.trigger
+def trigger(fieldId, card, frameId=None):
+    params = {'fieldId': fieldId, 'card': card}
+    if frameId is not None:
+        params['frameId'] = frameId
+    command = Command('Autofill.trigger', params)
+    return command
+
+
+### Autofill.setAddresses
+def setAddresses(addresses):
+    params = {'addresses': addresses}
+    command = Command('Autofill.setAddresses', params)
+    return command
+
+
+### Autofill.disable
+def disable():
+    params = {}
+    command = Command('Autofill.disable', params)
+    return command
+
+
+### Autofill.enable
+def enable():
+    params = {}
+    command = Command('Autofill.enable', params)
+    return command
+
+
+### Autofill.addressFormFilled
+def addressFormFilled():
+    notification = Notification('Autofill.addressFormFilled')
+    return notification
+
+
+def addressFormFilled_parser(params):
+    return AddressFormFilled(params)
+
+
+class CreditCard(WIPObject):
+    fields = (
+        ('number',),
+        ('name',),
+        ('expiryMonth',),
+        ('expiryYear',),
+        ('cvc',),
+    )
+
+
+class AddressField(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class AddressFields(WIPObject):
+    fields = (
+        ('fields', list_of(AddressField)),
+    )
+
+
+class Address(WIPObject):
+    fields = (
+        ('fields', list_of(AddressField)),
+    )
+
+
+class AddressUI(WIPObject):
+    fields = (
+        ('addressFields', list_of(AddressFields)),
+    )
+
+
+class FilledField(WIPObject):
+    fields = (
+        ('htmlType',),
+        ('id',),
+        ('name',),
+        ('value',),
+        ('autofillType',),
+        ('fillingStrategy',),
+        ('frameId',),
+        ('fieldId',),
+    )
+
+
+class AddressFormFilled(LazyView):
+    fields = (
+        ('filledFields', list_of(FilledField)),
+        ('addressUi', AddressUI),
+    )
+
+
+register_parsers('Autofill', globals())
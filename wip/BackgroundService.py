@@ -0,0 +1,87 @@
+"""
+BackgroundService domain. Defines events for background web platform
+features.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### BackgroundService.startObserving
+def startObserving(service):
+    params = {'service': service}
+    command = Command('BackgroundService.startObserving', params)
+    return command
+
+
+### BackgroundService.stopObserving
+def stopObserving(service):
+    params = {'service': service}
+    command = Command('BackgroundService.stopObserving', params)
+    return command
+
+
+### BackgroundService.setRecording
+def setRecording(shouldRecord, service):
+    params = {'shouldRecord': shouldRecord, 'service': service}
+    command = Command('BackgroundService.setRecording', params)
+    return command
+
+
+### BackgroundService.clearEvents
+def clearEvents(service):
+    params = {'service': service}
+    command = Command('BackgroundService.clearEvents', params)
+    return command
+
+
+### BackgroundService.recordingStateChanged
+def recordingStateChanged():
+    notification = Notification('BackgroundService.recordingStateChanged')
+    return notification
+
+
+def recordingStateChanged_parser(params):
+    return params
+
+
+### BackgroundService.backgroundServiceEventReceived
+def backgroundServiceEventReceived():
+    notification = Notification('BackgroundService.backgroundServiceEventReceived')
+    return notification
+
+
+def backgroundServiceEventReceived_parser(params):
+    return BackgroundServiceEventReceived(params)
+
+
+class EventMetadata(WIPObject):
+    fields = (
+        ('key',),
+        ('value',),
+    )
+
+
+class BackgroundServiceEvent(WIPObject):
+    fields = (
+        ('timestamp',),
+        ('origin',),
+        ('serviceWorkerRegistrationId',),
+        ('service',),
+        ('eventName',),
+        ('instanceId',),
+        ('eventMetadata', list_of(EventMetadata)),
+        ('storageKey',),
+    )
+
+
+class BackgroundServiceEventReceived(LazyView):
+    fields = (
+        ('backgroundServiceEvent', BackgroundServiceEvent),
+    )
+
+
+register_parsers('BackgroundService', globals())
@@ -0,0 +1,190 @@
+"""
+BluetoothEmulation domain. This domain allows configuring virtual
+Bluetooth devices to test the web-bluetooth API.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, list_of, register_parsers
+
+
+### BluetoothEmulation.enable
+def enable(state, leSupported):
+    params = {'state': state, 'leSupported': leSupported}
+    command = Command('BluetoothEmulation.enable', params)
+    return command
+
+
+### BluetoothEmulation.setSimulatedCentralState
+def setSimulatedCentralState(state):
+    params = {'state': state}
+    command = Command('BluetoothEmulation.setSimulatedCentralState', params)
+    return command
+
+
+### BluetoothEmulation.disable
+def disable():
+    params = {}
+    command = Command('BluetoothEmulation.disable', params)
+    return command
+
+
+### BluetoothEmulation.simulatePreconnectedPeripheral
+def simulatePreconnectedPeripheral(address, name, manufacturerData, knownServiceUuids):
+    params = {'address': address, 'name': name, 'manufacturerData': manufacturerData, 'knownServiceUuids': knownServiceUuids}
+    command = Command('BluetoothEmulation.simulatePreconnectedPeripheral', params)
+    return command
+
+
+### BluetoothEmulation.simulateAdvertisement
+def simulateAdvertisement(entry):
+    params = {'entry': entry}
+    command = Command('BluetoothEmulation.simulateAdvertisement', params)
+    return command
+
+
+### BluetoothEmulation.simulateGATTOperationResponse
+def simulateGATTOperationResponse(address, type, code):
+    params = {'address': address, 'type': type, 'code': code}
+    command = Command('BluetoothEmulation.simulateGATTOperationResponse', params)
+    return command
+
+
+### BluetoothEmulation.simulateCharacteristicOperationResponse
+def simulateCharacteristicOperationResponse(characteristicId, type, code, data=None):
+    params = {'characteristicId': characteristicId, 'type': type, 'code': code}
+    if data is not None:
+        params['data'] = data
+    command = Command('BluetoothEmulation.simulateCharacteristicOperationResponse', params)
+    return command
+
+
+### BluetoothEmulation.simulateDescriptorOperationResponse
+def simulateDescriptorOperationResponse(descriptorId, type, code, data=None):
+    params = {'descriptorId': descriptorId, 'type': type, 'code': code}
+    if data is not None:
+        params['data'] = data
+    command = Command('BluetoothEmulation.simulateDescriptorOperationResponse', params)
+    return command
+
+
+### BluetoothEmulation.addService
+def addService(address, serviceUuid):
+    params = {'address': address, 'serviceUuid': serviceUuid}
+    command = Command('BluetoothEmulation.addService', params)
+    return command
+
+
+### BluetoothEmulation.removeService
+def removeService(serviceId):
+    params = {'serviceId': serviceId}
+    command = Command('BluetoothEmulation.removeService', params)
+    return command
+
+
+### BluetoothEmulation.addCharacteristic
+def addCharacteristic(serviceId, characteristicUuid, properties):
+    params = {'serviceId': serviceId, 'characteristicUuid': characteristicUuid, 'properties': properties}
+    command = Command('BluetoothEmulation.addCharacteristic', params)
+    return command
+
+
+### BluetoothEmulation.removeCharacteristic
+def removeCharacteristic(characteristicId):
+    params = {'characteristicId': characteristicId}
+    command = Command('BluetoothEmulation.removeCharacteristic', params)
+    return command
+
+
+### BluetoothEmulation.addDescriptor
+def addDescriptor(characteristicId, descriptorUuid):
+    params = {'characteristicId': characteristicId, 'descriptorUuid': descriptorUuid}
+    command = Command('BluetoothEmulation.addDescriptor', params)
+    return command
+
+
+### BluetoothEmulation.removeDescriptor
+def removeDescriptor(descriptorId):
+    params = {'descriptorId': descriptorId}
+    command = Command('BluetoothEmulation.removeDescriptor', params)
+    return command
+
+
+### BluetoothEmulation.simulateGATTDisconnection
+def simulateGATTDisconnection(address):
+    params = {'address': address}
+    command = Command('BluetoothEmulation.simulateGATTDisconnection', params)
+    return command
+
+
+### BluetoothEmulation.gattOperationReceived
+def gattOperationReceived():
+    notification = Notification('BluetoothEmulation.gattOperationReceived')
+    return notification
+
+
+def gattOperationReceived_parser(params):
+    return params
+
+
+### BluetoothEmulation.characteristicOperationReceived
+def characteristicOperationReceived():
+    notification = Notification('BluetoothEmulation.characteristicOperationReceived')
+    return notification
+
+
+def characteristicOperationReceived_parser(params):
+    return params
+
+
+### BluetoothEmulation.descriptorOperationReceived
+def descriptorOperationReceived():
+    notification = Notification('BluetoothEmulation.descriptorOperationReceived')
+    return notification
+
+
+def descriptorOperationReceived_parser(params):
+    return params
+
+
+class ManufacturerData(WIPObject):
+    fields = (
+        ('key',),
+        ('data',),
+    )
+
+
+class ScanRecord(WIPObject):
+    fields = (
+        ('name',),
+        ('uuids',),
+        ('appearance',),
+        ('txPower',),
+        ('manufacturerData', list_of(ManufacturerData)),
+    )
+
+
+class ScanEntry(WIPObject):
+    fields = (
+        ('deviceAddress',),
+        ('rssi',),
+        ('scanRecord', ScanRecord),
+    )
+
+
+class CharacteristicProperties(WIPObject):
+    fields = (
+        ('broadcast',),
+        ('read',),
+        ('writeWithoutResponse',),
+        ('write',),
+        ('notify',),
+        ('indicate',),
+        ('authenticatedSignedWrites',),
+        ('extendedProperties',),
+    )
+
+
+register_parsers('BluetoothEmulation', globals())
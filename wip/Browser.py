@@ -0,0 +1,290 @@
+"""
+Browser domain. The Browser domain defines methods and events for
+browser managing.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Browser.setPermission
+def setPermission(permission, setting, origin=None, embeddingOrigin=None, browserContextId=None):
+    params = {'permission': permission, 'setting': setting}
+    if origin is not None:
+        params['origin'] = origin
+    if embeddingOrigin is not None:
+        params['embeddingOrigin'] = embeddingOrigin
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Browser.setPermission', params)
+    return command
+
+
+### Browser.grantPermissions
+def grantPermissions(permissions, origin=None, browserContextId=None):
+    params = {'permissions': permissions}
+    if origin is not None:
+        params['origin'] = origin
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Browser.grantPermissions', params)
+    return command
+
+
+### Browser.resetPermissions
+def resetPermissions(browserContextId=None):
+    params = {}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Browser.resetPermissions', params)
+    return command
+
+
+### Browser.setDownloadBehavior
+def setDownloadBehavior(behavior, browserContextId=None, downloadPath=None, eventsEnabled=None):
+    params = {'behavior': behavior}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    if downloadPath is not None:
+        params['downloadPath'] = downloadPath
+    if eventsEnabled is not None:
+        params['eventsEnabled'] = eventsEnabled
+    command = Command('Browser.setDownloadBehavior', params)
+    return command
+
+
+### Browser.cancelDownload
+def cancelDownload(guid, browserContextId=None):
+    params = {'guid': guid}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Browser.cancelDownload', params)
+    return command
+
+
+### Browser.close
+def close():
+    params = {}
+    command = Command('Browser.close', params)
+    return command
+
+
+### Browser.crash
+def crash():
+    params = {}
+    command = Command('Browser.crash', params)
+    return command
+
+
+### Browser.crashGpuProcess
+def crashGpuProcess():
+    params = {}
+    command = Command('Browser.crashGpuProcess', params)
+    return command
+
+
+### Browser.getVersion
+def getVersion():
+    params = {}
+    command = Command('Browser.getVersion', params)
+    return command
+
+
+### Browser.getBrowserCommandLine
+def getBrowserCommandLine():
+    params = {}
+    command = Command('Browser.getBrowserCommandLine', params)
+    return command
+
+
+### Browser.getHistograms
+def getHistograms(query=None, delta=None):
+    params = {}
+    if query is not None:
+        params['query'] = query
+    if delta is not None:
+        params['delta'] = delta
+    command = Command('Browser.getHistograms', params)
+    return command
+
+
+def getHistograms_parser(result):
+    return GetHistogramsResult(result)
+
+
+### Browser.getHistogram
+def getHistogram(name, delta=None):
+    params = {'name': name}
+    if delta is not None:
+        params['delta'] = delta
+    command = Command('Browser.getHistogram', params)
+    return command
+
+
+def getHistogram_parser(result):
+    return GetHistogramResult(result)
+
+
+### Browser.getWindowBounds
+def getWindowBounds(windowId):
+    params = {'windowId': windowId}
+    command = Command('Browser.getWindowBounds', params)
+    return command
+
+
+def getWindowBounds_parser(result):
+    return GetWindowBoundsResult(result)
+
+
+### Browser.getWindowForTarget
+def getWindowForTarget(targetId=None):
+    params = {}
+    if targetId is not None:
+        params['targetId'] = targetId
+    command = Command('Browser.getWindowForTarget', params)
+    return command
+
+
+def getWindowForTarget_parser(result):
+    return GetWindowForTargetResult(result)
+
+
+### Browser.setWindowBounds
+def setWindowBounds(windowId, bounds):
+    params = {'windowId': windowId, 'bounds': bounds}
+    command = Command('Browser.setWindowBounds', params)
+    return command
+
+
+### Browser.setContentsSize
+def setContentsSize(windowId, width=None, height=None):
+    params = {'windowId': windowId}
+    if width is not None:
+        params['width'] = width
+    if height is not None:
+        params['height'] = height
+    command = Command('Browser.setContentsSize', params)
+    return command
+
+
+### Browser.setDockTile
+def setDockTile(badgeLabel=None, image=None):
+    params = {}
+    if badgeLabel is not None:
+        params['badgeLabel'] = badgeLabel
+    if image is not None:
+        params['image'] = image
+    command = Command('Browser.setDockTile', params)
+    return command
+
+
+### Browser.executeBrowserCommand
+def executeBrowserCommand(commandId):
+    params = {'commandId': commandId}
+    command = Command('Browser.executeBrowserCommand', params)
+    return command
+
+
+### Browser.addPrivacySandboxEnrollmentOverride
+def addPrivacySandboxEnrollmentOverride(url):
+    params = {'url': url}
+    command = Command('Browser.addPrivacySandboxEnrollmentOverride', params)
+    return command
+
+
+### Browser.addPrivacySandboxCoordinatorKeyConfig
+def addPrivacySandboxCoordinatorKeyConfig(api, coordinatorOrigin, keyConfig, browserContextId=None):
+    params = {'api': api, 'coordinatorOrigin': coordinatorOrigin, 'keyConfig': keyConfig}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Browser.addPrivacySandboxCoordinatorKeyConfig', params)
+    return command
+
+
+### Browser.downloadWillBegin
+def downloadWillBegin():
+    notification = Notification('Browser.downloadWillBegin')
+    return notification
+
+
+def downloadWillBegin_parser(params):
+    return params
+
+
+### Browser.downloadProgress
+def downloadProgress():
+    notification = Notification('Browser.downloadProgress')
+    return notification
+
+
+def downloadProgress_parser(params):
+    return params
+
+
+class Bounds(WIPObject):
+    fields = (
+        ('left',),
+        ('top',),
+        ('width',),
+        ('height',),
+        ('windowState',),
+    )
+
+
+class PermissionDescriptor(WIPObject):
+    fields = (
+        ('name',),
+        ('sysex',),
+        ('userVisibleOnly',),
+        ('allowWithoutSanitization',),
+        ('allowWithoutGesture',),
+        ('panTiltZoom',),
+    )
+
+
+class Bucket(WIPObject):
+    fields = (
+        ('low',),
+        ('high',),
+        ('count',),
+    )
+
+
+class Histogram(WIPObject):
+    fields = (
+        ('name',),
+        ('sum',),
+        ('count',),
+        ('buckets', list_of(Bucket)),
+    )
+
+
+class GetHistogramsResult(LazyView):
+    fields = (
+        ('histograms', list_of(Histogram)),
+    )
+
+
+class GetHistogramResult(LazyView):
+    fields = (
+        ('histogram', Histogram),
+    )
+
+
+class GetWindowBoundsResult(LazyView):
+    fields = (
+        ('bounds', Bounds),
+    )
+
+
+class GetWindowForTargetResult(LazyView):
+    fields = (
+        ('windowId',),
+        ('bounds', Bounds),
+    )
+
+
+register_parsers('Browser', globals())
@@ -0,0 +1,965 @@
+"""
+CSS domain. This domain exposes CSS read/write operations. All CSS
+objects (stylesheets, rules, and styles) have an associated `id` used in
+subsequent operations on the related object. Each object type has a
+specific `id` structure, and those are not interchangeable between
+objects of different kinds. CSS objects can be loaded using the
+`get*ForNode()` calls (which accept a DOM node id). A client can also
+keep track of stylesheets via the `styleSheetAdded`/`styleSheetRemoved`
+events and subsequently load the required stylesheet contents using the
+`getStyleSheet[Text]()` methods.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### CSS.addRule
+def addRule(styleSheetId, ruleText, location, nodeForPropertySyntaxValidation=None):
+    params = {'styleSheetId': styleSheetId, 'ruleText': ruleText, 'location': location}
+    if nodeForPropertySyntaxValidation is not None:
+        params['nodeForPropertySyntaxValidation'] = nodeForPropertySyntaxValidation
+    command = Command('CSS.addRule', params)
+    return command
+
+
+def addRule_parser(result):
+    return AddRuleResult(result)
+
+
+### CSS.collectClassNames
+def collectClassNames(styleSheetId):
+    params = {'styleSheetId': styleSheetId}
+    command = Command('CSS.collectClassNames', params)
+    return command
+
+
+### CSS.createStyleSheet
+def createStyleSheet(frameId, force=None):
+    params = {'frameId': frameId}
+    if force is not None:
+        params['force'] = force
+    command = Command('CSS.createStyleSheet', params)
+    return command
+
+
+### CSS.disable
+def disable():
+    params = {}
+    command = Command('CSS.disable', params)
+    return command
+
+
+### CSS.enable
+def enable():
+    params = {}
+    command = Command('CSS.enable', params)
+    return command
+
+
+### CSS.forcePseudoState
+def forcePseudoState(nodeId, forcedPseudoClasses):
+    params = {'nodeId': nodeId, 'forcedPseudoClasses': forcedPseudoClasses}
+    command = Command('CSS.forcePseudoState', params)
+    return command
+
+
+### CSS.forceStartingStyle
+def forceStartingStyle(nodeId, forced):
+    params = {'nodeId': nodeId, 'forced': forced}
+    command = Command('CSS.forceStartingStyle', params)
+    return command
+
+
+### CSS.getBackgroundColors
+def getBackgroundColors(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getBackgroundColors', params)
+    return command
+
+
+### CSS.getComputedStyleForNode
+def getComputedStyleForNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getComputedStyleForNode', params)
+    return command
+
+
+def getComputedStyleForNode_parser(result):
+    return GetComputedStyleForNodeResult(result)
+
+
+### CSS.resolveValues
+def resolveValues(values, nodeId, propertyName=None, pseudoType=None, pseudoIdentifier=None):
+    params = {'values': values, 'nodeId': nodeId}
+    if propertyName is not None:
+        params['propertyName'] = propertyName
+    if pseudoType is not None:
+        params['pseudoType'] = pseudoType
+    if pseudoIdentifier is not None:
+        params['pseudoIdentifier'] = pseudoIdentifier
+    command = Command('CSS.resolveValues', params)
+    return command
+
+
+### CSS.getLonghandProperties
+def getLonghandProperties(shorthandName, value):
+    params = {'shorthandName': shorthandName, 'value': value}
+    command = Command('CSS.getLonghandProperties', params)
+    return command
+
+
+def getLonghandProperties_parser(result):
+    return GetLonghandPropertiesResult(result)
+
+
+### CSS.getInlineStylesForNode
+def getInlineStylesForNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getInlineStylesForNode', params)
+    return command
+
+
+def getInlineStylesForNode_parser(result):
+    return GetInlineStylesForNodeResult(result)
+
+
+### CSS.getAnimatedStylesForNode
+def getAnimatedStylesForNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getAnimatedStylesForNode', params)
+    return command
+
+
+def getAnimatedStylesForNode_parser(result):
+    return GetAnimatedStylesForNodeResult(result)
+
+
+### CSS.getMatchedStylesForNode
+def getMatchedStylesForNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getMatchedStylesForNode', params)
+    return command
+
+
+def getMatchedStylesForNode_parser(result):
+    return GetMatchedStylesForNodeResult(result)
+
+
+### CSS.getEnvironmentVariables
+def getEnvironmentVariables():
+    params = {}
+    command = Command('CSS.getEnvironmentVariables', params)
+    return command
+
+
+### CSS.getMediaQueries
+def getMediaQueries():
+    params = {}
+    command = Command('CSS.getMediaQueries', params)
+    return command
+
+
+def getMediaQueries_parser(result):
+    return GetMediaQueriesResult(result)
+
+
+### CSS.getPlatformFontsForNode
+def getPlatformFontsForNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getPlatformFontsForNode', params)
+    return command
+
+
+def getPlatformFontsForNode_parser(result):
+    return GetPlatformFontsForNodeResult(result)
+
+
+### CSS.getStyleSheetText
+def getStyleSheetText(styleSheetId):
+    params = {'styleSheetId': styleSheetId}
+    command = Command('CSS.getStyleSheetText', params)
+    return command
+
+
+### CSS.getLayersForNode
+def getLayersForNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('CSS.getLayersForNode', params)
+    return command
+
+
+def getLayersForNode_parser(result):
+    return GetLayersForNodeResult(result)
+
+
+### CSS.getLocationForSelector
+def getLocationForSelector(styleSheetId, selectorText):
+    params = {'styleSheetId': styleSheetId, 'selectorText': selectorText}
+    command = Command('CSS.getLocationForSelector', params)
+    return command
+
+
+def getLocationForSelector_parser(result):
+    return GetLocationForSelectorResult(result)
+
+
+### CSS.trackComputedStyleUpdatesForNode
+def trackComputedStyleUpdatesForNode(nodeId=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    command = Command('CSS.trackComputedStyleUpdatesForNode', params)
+    return command
+
+
+### CSS.trackComputedStyleUpdates
+def trackComputedStyleUpdates(propertiesToTrack):
+    params = {'propertiesToTrack': propertiesToTrack}
+    command = Command('CSS.trackComputedStyleUpdates', params)
+    return command
+
+
+### CSS.takeComputedStyleUpdates
+def takeComputedStyleUpdates():
+    params = {}
+    command = Command('CSS.takeComputedStyleUpdates', params)
+    return command
+
+
+### CSS.setEffectivePropertyValueForNode
+def setEffectivePropertyValueForNode(nodeId, propertyName, value):
+    params = {'nodeId': nodeId, 'propertyName': propertyName, 'value': value}
+    command = Command('CSS.setEffectivePropertyValueForNode', params)
+    return command
+
+
+### CSS.setPropertyRulePropertyName
+def setPropertyRulePropertyName(styleSheetId, range, propertyName):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'propertyName': propertyName}
+    command = Command('CSS.setPropertyRulePropertyName', params)
+    return command
+
+
+def setPropertyRulePropertyName_parser(result):
+    return SetPropertyRulePropertyNameResult(result)
+
+
+### CSS.setKeyframeKey
+def setKeyframeKey(styleSheetId, range, keyText):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'keyText': keyText}
+    command = Command('CSS.setKeyframeKey', params)
+    return command
+
+
+def setKeyframeKey_parser(result):
+    return SetKeyframeKeyResult(result)
+
+
+### CSS.setMediaText
+def setMediaText(styleSheetId, range, text):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'text': text}
+    command = Command('CSS.setMediaText', params)
+    return command
+
+
+def setMediaText_parser(result):
+    return SetMediaTextResult(result)
+
+
+### CSS.setContainerQueryText
+def setContainerQueryText(styleSheetId, range, text):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'text': text}
+    command = Command('CSS.setContainerQueryText', params)
+    return command
+
+
+def setContainerQueryText_parser(result):
+    return SetContainerQueryTextResult(result)
+
+
+### CSS.setSupportsText
+def setSupportsText(styleSheetId, range, text):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'text': text}
+    command = Command('CSS.setSupportsText', params)
+    return command
+
+
+def setSupportsText_parser(result):
+    return SetSupportsTextResult(result)
+
+
+### CSS.setScopeText
+def setScopeText(styleSheetId, range, text):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'text': text}
+    command = Command('CSS.setScopeText', params)
+    return command
+
+
+def setScopeText_parser(result):
+    return SetScopeTextResult(result)
+
+
+### CSS.setRuleSelector
+def setRuleSelector(styleSheetId, range, selector):
+    params = {'styleSheetId': styleSheetId, 'range': range, 'selector': selector}
+    command = Command('CSS.setRuleSelector', params)
+    return command
+
+
+def setRuleSelector_parser(result):
+    return SetRuleSelectorResult(result)
+
+
+### CSS.setStyleSheetText
+def setStyleSheetText(styleSheetId, text):
+    params = {'styleSheetId': styleSheetId, 'text': text}
+    command = Command('CSS.setStyleSheetText', params)
+    return command
+
+
+### CSS.setStyleTexts
+def setStyleTexts(edits, nodeForPropertySyntaxValidation=None):
+    params = {'edits': edits}
+    if nodeForPropertySyntaxValidation is not None:
+        params['nodeForPropertySyntaxValidation'] = nodeForPropertySyntaxValidation
+    command = Command('CSS.setStyleTexts', params)
+    return command
+
+
+def setStyleTexts_parser(result):
+    return SetStyleTextsResult(result)
+
+
+### CSS.startRuleUsageTracking
+def startRuleUsageTracking():
+    params = {}
+    command = Command('CSS.startRuleUsageTracking', params)
+    return command
+
+
+### CSS.stopRuleUsageTracking
+def stopRuleUsageTracking():
+    params = {}
+    command = Command('CSS.stopRuleUsageTracking', params)
+    return command
+
+
+def stopRuleUsageTracking_parser(result):
+    return StopRuleUsageTrackingResult(result)
+
+
+### CSS.takeCoverageDelta
+def takeCoverageDelta():
+    params = {}
+    command = Command('CSS.takeCoverageDelta', params)
+    return command
+
+
+def takeCoverageDelta_parser(result):
+    return TakeCoverageDeltaResult(result)
+
+
+### CSS.setLocalFontsEnabled
+def setLocalFontsEnabled(enabled):
+    params = {'enabled': enabled}
+    command = Command('CSS.setLocalFontsEnabled', params)
+    return command
+
+
+### CSS.fontsUpdated
+def fontsUpdated():
+    notification = Notification('CSS.fontsUpdated')
+    return notification
+
+
+def fontsUpdated_parser(params):
+    return FontsUpdated(params)
+
+
+### CSS.mediaQueryResultChanged
+def mediaQueryResultChanged():
+    notification = Notification('CSS.mediaQueryResultChanged')
+    return notification
+
+
+### CSS.styleSheetAdded
+def styleSheetAdded():
+    notification = Notification('CSS.styleSheetAdded')
+    return notification
+
+
+def styleSheetAdded_parser(params):
+    return StyleSheetAdded(params)
+
+
+### CSS.styleSheetChanged
+def styleSheetChanged():
+    notification = Notification('CSS.styleSheetChanged')
+    return notification
+
+
+def styleSheetChanged_parser(params):
+    return params
+
+
+### CSS.styleSheetRemoved
+def styleSheetRemoved():
+    notification = Notification('CSS.styleSheetRemoved')
+    return notification
+
+
+def styleSheetRemoved_parser(params):
+    return params
+
+
+### CSS.computedStyleUpdated
+def computedStyleUpdated():
+    notification = Notification('CSS.computedStyleUpdated')
+    return notification
+
+
+def computedStyleUpdated_parser(params):
+    return params
+
+
+class SourceRange(WIPObject):
+    fields = (
+        ('startLine',),
+        ('startColumn',),
+        ('endLine',),
+        ('endColumn',),
+    )
+
+
+class Specificity(WIPObject):
+    fields = (
+        ('a',),
+        ('b',),
+        ('c',),
+    )
+
+
+class Value(WIPObject):
+    fields = (
+        ('text',),
+        ('range', SourceRange),
+        ('specificity', Specificity),
+    )
+
+
+class SelectorList(WIPObject):
+    fields = (
+        ('selectors', list_of(Value)),
+        ('text',),
+    )
+
+
+class CSSProperty(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+        ('important',),
+        ('implicit',),
+        ('text',),
+        ('parsedOk',),
+        ('disabled',),
+        ('range', SourceRange),
+        ('longhandProperties', list_of(lambda value: CSSProperty(value))),
+    )
+
+
+class ShorthandEntry(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+        ('important',),
+    )
+
+
+class CSSStyle(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('cssProperties', list_of(CSSProperty)),
+        ('shorthandEntries', list_of(ShorthandEntry)),
+        ('cssText',),
+        ('range', SourceRange),
+    )
+
+
+class MediaQueryExpression(WIPObject):
+    fields = (
+        ('value',),
+        ('unit',),
+        ('feature',),
+        ('valueRange', SourceRange),
+        ('computedLength',),
+    )
+
+
+class MediaQuery(WIPObject):
+    fields = (
+        ('expressions', list_of(MediaQueryExpression)),
+        ('active',),
+    )
+
+
+class CSSMedia(WIPObject):
+    fields = (
+        ('text',),
+        ('source',),
+        ('sourceURL',),
+        ('range', SourceRange),
+        ('styleSheetId',),
+        ('mediaList', list_of(MediaQuery)),
+    )
+
+
+class CSSContainerQuery(WIPObject):
+    fields = (
+        ('text',),
+        ('range', SourceRange),
+        ('styleSheetId',),
+        ('name',),
+        ('physicalAxes',),
+        ('logicalAxes',),
+        ('queriesScrollState',),
+        ('queriesAnchored',),
+    )
+
+
+class CSSSupports(WIPObject):
+    fields = (
+        ('text',),
+        ('active',),
+        ('range', SourceRange),
+        ('styleSheetId',),
+    )
+
+
+class CSSLayer(WIPObject):
+    fields = (
+        ('text',),
+        ('range', SourceRange),
+        ('styleSheetId',),
+    )
+
+
+class CSSScope(WIPObject):
+    fields = (
+        ('text',),
+        ('range', SourceRange),
+        ('styleSheetId',),
+    )
+
+
+class CSSStartingStyle(WIPObject):
+    fields = (
+        ('range', SourceRange),
+        ('styleSheetId',),
+    )
+
+
+class CSSRule(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('selectorList', SelectorList),
+        ('nestingSelectors',),
+        ('origin',),
+        ('style', CSSStyle),
+        ('media', list_of(CSSMedia)),
+        ('containerQueries', list_of(CSSContainerQuery)),
+        ('supports', list_of(CSSSupports)),
+        ('layers', list_of(CSSLayer)),
+        ('scopes', list_of(CSSScope)),
+        ('ruleTypes',),
+        ('startingStyles', list_of(CSSStartingStyle)),
+    )
+
+
+class RuleMatch(WIPObject):
+    fields = (
+        ('rule', CSSRule),
+        ('matchingSelectors',),
+    )
+
+
+class PseudoElementMatches(WIPObject):
+    fields = (
+        ('pseudoType',),
+        ('pseudoIdentifier',),
+        ('matches', list_of(RuleMatch)),
+    )
+
+
+class CSSAnimationStyle(WIPObject):
+    fields = (
+        ('name',),
+        ('style', CSSStyle),
+    )
+
+
+class InheritedStyleEntry(WIPObject):
+    fields = (
+        ('inlineStyle', CSSStyle),
+        ('matchedCSSRules', list_of(RuleMatch)),
+    )
+
+
+class InheritedAnimatedStyleEntry(WIPObject):
+    fields = (
+        ('animationStyles', list_of(CSSAnimationStyle)),
+        ('transitionsStyle', CSSStyle),
+    )
+
+
+class InheritedPseudoElementMatches(WIPObject):
+    fields = (
+        ('pseudoElements', list_of(PseudoElementMatches)),
+    )
+
+
+class CSSStyleSheetHeader(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('frameId',),
+        ('sourceURL',),
+        ('sourceMapURL',),
+        ('origin',),
+        ('title',),
+        ('ownerNode',),
+        ('disabled',),
+        ('hasSourceURL',),
+        ('isInline',),
+        ('isMutable',),
+        ('isConstructed',),
+        ('startLine',),
+        ('startColumn',),
+        ('length',),
+        ('endLine',),
+        ('endColumn',),
+        ('loadingFailed',),
+    )
+
+
+class RuleUsage(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('startOffset',),
+        ('endOffset',),
+        ('used',),
+    )
+
+
+class CSSComputedStyleProperty(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class ComputedStyleExtraFields(WIPObject):
+    fields = (
+        ('isAppearanceBase',),
+    )
+
+
+class CSSLayerData(WIPObject):
+    fields = (
+        ('name',),
+        ('subLayers', list_of(lambda value: CSSLayerData(value))),
+        ('order',),
+    )
+
+
+class PlatformFontUsage(WIPObject):
+    fields = (
+        ('familyName',),
+        ('postScriptName',),
+        ('isCustomFont',),
+        ('glyphCount',),
+    )
+
+
+class FontVariationAxis(WIPObject):
+    fields = (
+        ('tag',),
+        ('name',),
+        ('minValue',),
+        ('maxValue',),
+        ('defaultValue',),
+    )
+
+
+class FontFace(WIPObject):
+    fields = (
+        ('fontFamily',),
+        ('fontStyle',),
+        ('fontVariant',),
+        ('fontWeight',),
+        ('fontStretch',),
+        ('fontDisplay',),
+        ('unicodeRange',),
+        ('src',),
+        ('platformFontFamily',),
+        ('fontVariationAxes', list_of(FontVariationAxis)),
+    )
+
+
+class CSSTryRule(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('origin',),
+        ('style', CSSStyle),
+    )
+
+
+class CSSPositionTryRule(WIPObject):
+    fields = (
+        ('name', Value),
+        ('styleSheetId',),
+        ('origin',),
+        ('style', CSSStyle),
+        ('active',),
+    )
+
+
+class CSSKeyframeRule(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('origin',),
+        ('keyText', Value),
+        ('style', CSSStyle),
+    )
+
+
+class CSSKeyframesRule(WIPObject):
+    fields = (
+        ('animationName', Value),
+        ('keyframes', list_of(CSSKeyframeRule)),
+    )
+
+
+class CSSPropertyRegistration(WIPObject):
+    fields = (
+        ('propertyName',),
+        ('initialValue', Value),
+        ('inherits',),
+        ('syntax',),
+    )
+
+
+class CSSFontPaletteValuesRule(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('origin',),
+        ('fontPaletteName', Value),
+        ('style', CSSStyle),
+    )
+
+
+class CSSPropertyRule(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('origin',),
+        ('propertyName', Value),
+        ('style', CSSStyle),
+    )
+
+
+class CSSFunctionParameter(WIPObject):
+    fields = (
+        ('name',),
+        ('type',),
+    )
+
+
+class CSSFunctionNode(WIPObject):
+    fields = (
+        ('condition', lambda value: CSSFunctionConditionNode(value)),
+        ('style', CSSStyle),
+    )
+
+
+class CSSFunctionConditionNode(WIPObject):
+    fields = (
+        ('media', CSSMedia),
+        ('containerQueries', CSSContainerQuery),
+        ('supports', CSSSupports),
+        ('children', list_of(CSSFunctionNode)),
+        ('conditionText',),
+    )
+
+
+class CSSFunctionRule(WIPObject):
+    fields = (
+        ('name', Value),
+        ('styleSheetId',),
+        ('origin',),
+        ('parameters', list_of(CSSFunctionParameter)),
+        ('children', list_of(CSSFunctionNode)),
+    )
+
+
+class StyleDeclarationEdit(WIPObject):
+    fields = (
+        ('styleSheetId',),
+        ('range', SourceRange),
+        ('text',),
+    )
+
+
+class AddRuleResult(LazyView):
+    fields = (
+        ('rule', CSSRule),
+    )
+
+
+class GetComputedStyleForNodeResult(LazyView):
+    fields = (
+        ('computedStyle', list_of(CSSComputedStyleProperty)),
+        ('extraFields', ComputedStyleExtraFields),
+    )
+
+
+class GetLonghandPropertiesResult(LazyView):
+    fields = (
+        ('longhandProperties', list_of(CSSProperty)),
+    )
+
+
+class GetInlineStylesForNodeResult(LazyView):
+    fields = (
+        ('inlineStyle', CSSStyle),
+        ('attributesStyle', CSSStyle),
+    )
+
+
+class GetAnimatedStylesForNodeResult(LazyView):
+    fields = (
+        ('animationStyles', list_of(CSSAnimationStyle)),
+        ('transitionsStyle', CSSStyle),
+        ('inherited', list_of(InheritedAnimatedStyleEntry)),
+    )
+
+
+class GetMatchedStylesForNodeResult(LazyView):
+    fields = (
+        ('inlineStyle', CSSStyle),
+        ('attributesStyle', CSSStyle),
+        ('matchedCSSRules', list_of(RuleMatch)),
+        ('pseudoElements', list_of(PseudoElementMatches)),
+        ('inherited', list_of(InheritedStyleEntry)),
+        ('inheritedPseudoElements', list_of(InheritedPseudoElementMatches)),
+        ('cssKeyframesRules', list_of(CSSKeyframesRule)),
+        ('cssPositionTryRules', list_of(CSSPositionTryRule)),
+        ('activePositionFallbackIndex',),
+        ('cssPropertyRules', list_of(CSSPropertyRule)),
+        ('cssPropertyRegistrations', list_of(CSSPropertyRegistration)),
+        ('cssFontPaletteValuesRule', CSSFontPaletteValuesRule),
+        ('parentLayoutNodeId',),
+        ('cssFunctionRules', list_of(CSSFunctionRule)),
+    )
+
+
+class GetMediaQueriesResult(LazyView):
+    fields = (
+        ('medias', list_of(CSSMedia)),
+    )
+
+
+class GetPlatformFontsForNodeResult(LazyView):
+    fields = (
+        ('fonts', list_of(PlatformFontUsage)),
+    )
+
+
+class GetLayersForNodeResult(LazyView):
+    fields = (
+        ('rootLayer', CSSLayerData),
+    )
+
+
+class GetLocationForSelectorResult(LazyView):
+    fields = (
+        ('ranges', list_of(SourceRange)),
+    )
+
+
+class SetPropertyRulePropertyNameResult(LazyView):
+    fields = (
+        ('propertyName', Value),
+    )
+
+
+class SetKeyframeKeyResult(LazyView):
+    fields = (
+        ('keyText', Value),
+    )
+
+
+class SetMediaTextResult(LazyView):
+    fields = (
+        ('media', CSSMedia),
+    )
+
+
+class SetContainerQueryTextResult(LazyView):
+    fields = (
+        ('containerQuery', CSSContainerQuery),
+    )
+
+
+class SetSupportsTextResult(LazyView):
+    fields = (
+        ('supports', CSSSupports),
+    )
+
+
+class SetScopeTextResult(LazyView):
+    fields = (
+        ('scope', CSSScope),
+    )
+
+
+class SetRuleSelectorResult(LazyView):
+    fields = (
+        ('selectorList', SelectorList),
+    )
+
+
+class SetStyleTextsResult(LazyView):
+    fields = (
+        ('styles', list_of(CSSStyle)),
+    )
+
+
+class StopRuleUsageTrackingResult(LazyView):
+    fields = (
+        ('ruleUsage', list_of(RuleUsage)),
+    )
+
+
+class TakeCoverageDeltaResult(LazyView):
+    fields = (
+        ('coverage', list_of(RuleUsage)),
+        ('timestamp',),
+    )
+
+
+class FontsUpdated(LazyView):
+    fields = (
+        ('font', FontFace),
+    )
+
+
+class StyleSheetAdded(LazyView):
+    fields = (
+        ('header', CSSStyleSheetHeader),
+    )
+
+
+register_parsers('CSS', globals())
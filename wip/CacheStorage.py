@@ -0,0 +1,123 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+import Storage
+
+
+### CacheStorage.deleteCache
+def deleteCache(cacheId):
+    params = {'cacheId': cacheId}
+    command = Command('CacheStorage.deleteCache', params)
+    return command
+
+
+### CacheStorage.deleteEntry
+def deleteEntry(cacheId, request):
+    params = {'cacheId': cacheId, 'request': request}
+    command = Command('CacheStorage.deleteEntry', params)
+    return command
+
+
+### CacheStorage.requestCacheNames
+def requestCacheNames(securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('CacheStorage.requestCacheNames', params)
+    return command
+
+
+def requestCacheNames_parser(result):
+    return RequestCacheNamesResult(result)
+
+
+### CacheStorage.requestCachedResponse
+def requestCachedResponse(cacheId, requestURL, requestHeaders):
+    params = {'cacheId': cacheId, 'requestURL': requestURL, 'requestHeaders': requestHeaders}
+    command = Command('CacheStorage.requestCachedResponse', params)
+    return command
+
+
+def requestCachedResponse_parser(result):
+    return RequestCachedResponseResult(result)
+
+
+### CacheStorage.requestEntries
+def requestEntries(cacheId, skipCount=None, pageSize=None, pathFilter=None):
+    params = {'cacheId': cacheId}
+    if skipCount is not None:
+        params['skipCount'] = skipCount
+    if pageSize is not None:
+        params['pageSize'] = pageSize
+    if pathFilter is not None:
+        params['pathFilter'] = pathFilter
+    command = Command('CacheStorage.requestEntries', params)
+    return command
+
+
+def requestEntries_parser(result):
+    return RequestEntriesResult(result)
+
+
+class Header(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class DataEntry(WIPObject):
+    fields = (
+        ('requestURL',),
+        ('requestMethod',),
+        ('requestHeaders', list_of(Header)),
+        ('responseTime',),
+        ('responseStatus',),
+        ('responseStatusText',),
+        ('responseType',),
+        ('responseHeaders', list_of(Header)),
+    )
+
+
+class Cache(WIPObject):
+    fields = (
+        ('cacheId',),
+        ('securityOrigin',),
+        ('storageKey',),
+        ('storageBucket', lambda value: Storage.StorageBucket(value)),
+        ('cacheName',),
+    )
+
+
+class CachedResponse(WIPObject):
+    fields = (
+        ('body',),
+    )
+
+
+class RequestCacheNamesResult(LazyView):
+    fields = (
+        ('caches', list_of(Cache)),
+    )
+
+
+class RequestCachedResponseResult(LazyView):
+    fields = (
+        ('response', CachedResponse),
+    )
+
+
+class RequestEntriesResult(LazyView):
+    fields = (
+        ('cacheDataEntries', list_of(DataEntry)),
+        ('returnCount',),
+    )
+
+
+register_parsers('CacheStorage', globals())
@@ -0,0 +1,91 @@
+"""
+Cast domain. A domain for interacting with Cast, Presentation API, and
+Remote Playback API functionalities.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Cast.enable
+def enable(presentationUrl=None):
+    params = {}
+    if presentationUrl is not None:
+        params['presentationUrl'] = presentationUrl
+    command = Command('Cast.enable', params)
+    return command
+
+
+### Cast.disable
+def disable():
+    params = {}
+    command = Command('Cast.disable', params)
+    return command
+
+
+### Cast.setSinkToUse
+def setSinkToUse(sinkName):
+    params = {'sinkName': sinkName}
+    command = Command('Cast.setSinkToUse', params)
+    return command
+
+
+### Cast.startDesktopMirroring
+def startDesktopMirroring(sinkName):
+    params = {'sinkName': sinkName}
+    command = Command('Cast.startDesktopMirroring', params)
+    return command
+
+
+### Cast.startTabMirroring
+def startTabMirroring(sinkName):
+    params = {'sinkName': sinkName}
+    command = Command('Cast.startTabMirroring', params)
+    return command
+
+
+### Cast.stopCasting
+def stopCasting(sinkName):
+    params = {'sinkName': sinkName}
+    command = Command('Cast.stopCasting', params)
+    return command
+
+
+### Cast.sinksUpdated
+def sinksUpdated():
+    notification = Notification('Cast.sinksUpdated')
+    return notification
+
+
+def sinksUpdated_parser(params):
+    return SinksUpdated(params)
+
+
+### Cast.issueUpdated
+def issueUpdated():
+    notification = Notification('Cast.issueUpdated')
+    return notification
+
+
+def issueUpdated_parser(params):
+    return params
+
+
+class Sink(WIPObject):
+    fields = (
+        ('name',),
+        ('id',),
+        ('session',),
+    )
+
+
+class SinksUpdated(LazyView):
+    fields = (
+        ('sinks', list_of(Sink)),
+    )
+
+
+register_parsers('Cast', globals())
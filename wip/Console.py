@@ -1,4 +1,4 @@
-from utils import Command, Notification, WIPObject
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
 from Runtime import RemoteObject
 from Network import RequestId
 
@@ -28,7 +28,7 @@ def messageAdded():
 
 
 def messageAdded_parser(params):
-    result = ConsoleMessage(params['message'])
+    result = LazyConsoleMessage(params['message'])
     return result
 
 
@@ -38,7 +38,7 @@ def messageRepeatCountUpdated():
     return notification
 
 
-def messageRepeatCountUpdate_parser(params):
+def messageRepeatCountUpdated_parser(params):
     return params['count']
 
 
@@ -49,29 +49,36 @@ def messagesCleared():
 
 
 class CallFrame(WIPObject):
-    def __init__(self, value):
-        self.set(value, 'columnNumber')
-        self.set(value, 'functionName')
-        self.set(value, 'lineNumber')
-        self.set(value, 'url')
-
-
-class ConsoleMessage(WIPObject):
-    def __init__(self, value):
-        self.set(value, 'level')
-        self.set(value, 'line')
-        self.set_class(value, 'networkRequestId', RequestId)
-        self.parameters = []
-        if 'parameters' in value:
-            for param in value['parameters']:
-                self.parameters.append(RemoteObject(param))
-        self.set(value, 'repeatCount', 1)
-        self.set_class(value, 'stackTrace', StackTrace)
-        self.set(value, 'text')
-        self.set(value, 'url')
+    fields = (
+        ('columnNumber',),
+        ('functionName',),
+        ('lineNumber',),
+        ('url',),
+    )
 
 
 class StackTrace(list):
     def __init__(self, value):
         for callFrame in value:
             self.append(CallFrame(callFrame))
+
+
+class ConsoleMessage(WIPObject):
+    fields = (
+        ('level',),
+        ('line',),
+        ('networkRequestId', RequestId),
+        ('parameters', list_of(RemoteObject), list),
+        ('repeatCount', None, 1),
+        ('stackTrace', StackTrace),
+        ('text',),
+        ('url',),
+    )
+
+
+# ConsoleMessage, converted as it is read
+class LazyConsoleMessage(LazyView):
+    fields = ConsoleMessage.fields
+
+
+register_parsers('Console', globals())
@@ -1 +1,836 @@
-# not implemented now
+"""
+DOM domain. This domain exposes DOM read/write operations. Each DOM Node
+is represented with its mirror object that has an `id`. This `id` can be
+used to get additional information on the Node, resolve it into the
+JavaScript object wrapper, etc. It is important that client receives DOM
+events only for the nodes that are known to the client. Backend keeps
+track of the nodes that were sent to the client and never sends the same
+node twice. It is client's responsibility to collect information about
+the nodes that were sent to the client. Note that `iframe` owner
+elements will return corresponding document elements as their child
+nodes.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Runtime import RemoteObject
+
+
+### DOM.collectClassNamesFromSubtree
+def collectClassNamesFromSubtree(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.collectClassNamesFromSubtree', params)
+    return command
+
+
+### DOM.copyTo
+def copyTo(nodeId, targetNodeId, insertBeforeNodeId=None):
+    params = {'nodeId': nodeId, 'targetNodeId': targetNodeId}
+    if insertBeforeNodeId is not None:
+        params['insertBeforeNodeId'] = insertBeforeNodeId
+    command = Command('DOM.copyTo', params)
+    return command
+
+
+### DOM.describeNode
+def describeNode(nodeId=None, backendNodeId=None, objectId=None, depth=None, pierce=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    command = Command('DOM.describeNode', params)
+    return command
+
+
+def describeNode_parser(result):
+    return DescribeNodeResult(result)
+
+
+### DOM.scrollIntoViewIfNeeded
+def scrollIntoViewIfNeeded(nodeId=None, backendNodeId=None, objectId=None, rect=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    if rect is not None:
+        params['rect'] = rect
+    command = Command('DOM.scrollIntoViewIfNeeded', params)
+    return command
+
+
+### DOM.disable
+def disable():
+    params = {}
+    command = Command('DOM.disable', params)
+    return command
+
+
+### DOM.discardSearchResults
+def discardSearchResults(searchId):
+    params = {'searchId': searchId}
+    command = Command('DOM.discardSearchResults', params)
+    return command
+
+
+### DOM.enable
+def enable(includeWhitespace=None):
+    params = {}
+    if includeWhitespace is not None:
+        params['includeWhitespace'] = includeWhitespace
+    command = Command('DOM.enable', params)
+    return command
+
+
+### DOM.focus
+def focus(nodeId=None, backendNodeId=None, objectId=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    command = Command('DOM.focus', params)
+    return command
+
+
+### DOM.getAttributes
+def getAttributes(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.getAttributes', params)
+    return command
+
+
+### DOM.getBoxModel
+def getBoxModel(nodeId=None, backendNodeId=None, objectId=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    command = Command('DOM.getBoxModel', params)
+    return command
+
+
+def getBoxModel_parser(result):
+    return GetBoxModelResult(result)
+
+
+### DOM.getContentQuads
+def getContentQuads(nodeId=None, backendNodeId=None, objectId=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    command = Command('DOM.getContentQuads', params)
+    return command
+
+
+### DOM.getDocument
+def getDocument(depth=None, pierce=None):
+    params = {}
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    command = Command('DOM.getDocument', params)
+    return command
+
+
+def getDocument_parser(result):
+    return GetDocumentResult(result)
+
+
+### DOM.getFlattenedDocument
+def getFlattenedDocument(depth=None, pierce=None):
+    params = {}
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    command = Command('DOM.getFlattenedDocument', params)
+    return command
+
+
+def getFlattenedDocument_parser(result):
+    return GetFlattenedDocumentResult(result)
+
+
+### DOM.getNodesForSubtreeByStyle
+def getNodesForSubtreeByStyle(nodeId, computedStyles, pierce=None):
+    params = {'nodeId': nodeId, 'computedStyles': computedStyles}
+    if pierce is not None:
+        params['pierce'] = pierce
+    command = Command('DOM.getNodesForSubtreeByStyle', params)
+    return command
+
+
+### DOM.getNodeForLocation
+def getNodeForLocation(x, y, includeUserAgentShadowDOM=None, ignorePointerEventsNone=None):
+    params = {'x': x, 'y': y}
+    if includeUserAgentShadowDOM is not None:
+        params['includeUserAgentShadowDOM'] = includeUserAgentShadowDOM
+    if ignorePointerEventsNone is not None:
+        params['ignorePointerEventsNone'] = ignorePointerEventsNone
+    command = Command('DOM.getNodeForLocation', params)
+    return command
+
+
+### DOM.getOuterHTML
+def getOuterHTML(nodeId=None, backendNodeId=None, objectId=None, includeShadowDOM=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    if includeShadowDOM is not None:
+        params['includeShadowDOM'] = includeShadowDOM
+    command = Command('DOM.getOuterHTML', params)
+    return command
+
+
+### DOM.getRelayoutBoundary
+def getRelayoutBoundary(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.getRelayoutBoundary', params)
+    return command
+
+
+### DOM.getSearchResults
+def getSearchResults(searchId, fromIndex, toIndex):
+    params = {'searchId': searchId, 'fromIndex': fromIndex, 'toIndex': toIndex}
+    command = Command('DOM.getSearchResults', params)
+    return command
+
+
+### DOM.hideHighlight
+def hideHighlight():
+    params = {}
+    command = Command('DOM.hideHighlight', params)
+    return command
+
+
+### DOM.highlightNode
+def highlightNode():
+    params = {}
+    command = Command('DOM.highlightNode', params)
+    return command
+
+
+### DOM.highlightRect
+def highlightRect():
+    params = {}
+    command = Command('DOM.highlightRect', params)
+    return command
+
+
+### DOM.markUndoableState
+def markUndoableState():
+    params = {}
+    command = Command('DOM.markUndoableState', params)
+    return command
+
+
+### DOM.moveTo
+def moveTo(nodeId, targetNodeId, insertBeforeNodeId=None):
+    params = {'nodeId': nodeId, 'targetNodeId': targetNodeId}
+    if insertBeforeNodeId is not None:
+        params['insertBeforeNodeId'] = insertBeforeNodeId
+    command = Command('DOM.moveTo', params)
+    return command
+
+
+### DOM.performSearch
+def performSearch(query, includeUserAgentShadowDOM=None):
+    params = {'query': query}
+    if includeUserAgentShadowDOM is not None:
+        params['includeUserAgentShadowDOM'] = includeUserAgentShadowDOM
+    command = Command('DOM.performSearch', params)
+    return command
+
+
+### DOM.pushNodeByPathToFrontend
+def pushNodeByPathToFrontend(path):
+    params = {'path': path}
+    command = Command('DOM.pushNodeByPathToFrontend', params)
+    return command
+
+
+### DOM.pushNodesByBackendIdsToFrontend
+def pushNodesByBackendIdsToFrontend(backendNodeIds):
+    params = {'backendNodeIds': backendNodeIds}
+    command = Command('DOM.pushNodesByBackendIdsToFrontend', params)
+    return command
+
+
+### DOM.querySelector
+def querySelector(nodeId, selector):
+    params = {'nodeId': nodeId, 'selector': selector}
+    command = Command('DOM.querySelector', params)
+    return command
+
+
+### DOM.querySelectorAll
+def querySelectorAll(nodeId, selector):
+    params = {'nodeId': nodeId, 'selector': selector}
+    command = Command('DOM.querySelectorAll', params)
+    return command
+
+
+### DOM.getTopLayerElements
+def getTopLayerElements():
+    params = {}
+    command = Command('DOM.getTopLayerElements', params)
+    return command
+
+
+### DOM.getElementByRelation
+def getElementByRelation(nodeId, relation):
+    params = {'nodeId': nodeId, 'relation': relation}
+    command = Command('DOM.getElementByRelation', params)
+    return command
+
+
+### DOM.redo
+def redo():
+    params = {}
+    command = Command('DOM.redo', params)
+    return command
+
+
+### DOM.removeAttribute
+def removeAttribute(nodeId, name):
+    params = {'nodeId': nodeId, 'name': name}
+    command = Command('DOM.removeAttribute', params)
+    return command
+
+
+### DOM.removeNode
+def removeNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.removeNode', params)
+    return command
+
+
+### DOM.requestChildNodes
+def requestChildNodes(nodeId, depth=None, pierce=None):
+    params = {'nodeId': nodeId}
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    command = Command('DOM.requestChildNodes', params)
+    return command
+
+
+### DOM.requestNode
+def requestNode(objectId):
+    params = {'objectId': objectId}
+    command = Command('DOM.requestNode', params)
+    return command
+
+
+### DOM.resolveNode
+def resolveNode(nodeId=None, backendNodeId=None, objectGroup=None, executionContextId=None):
+    params = {}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectGroup is not None:
+        params['objectGroup'] = objectGroup
+    if executionContextId is not None:
+        params['executionContextId'] = executionContextId
+    command = Command('DOM.resolveNode', params)
+    return command
+
+
+def resolveNode_parser(result):
+    return ResolveNodeResult(result)
+
+
+### DOM.setAttributeValue
+def setAttributeValue(nodeId, name, value):
+    params = {'nodeId': nodeId, 'name': name, 'value': value}
+    command = Command('DOM.setAttributeValue', params)
+    return command
+
+
+### DOM.setAttributesAsText
+def setAttributesAsText(nodeId, text, name=None):
+    params = {'nodeId': nodeId, 'text': text}
+    if name is not None:
+        params['name'] = name
+    command = Command('DOM.setAttributesAsText', params)
+    return command
+
+
+### DOM.setFileInputFiles
+def setFileInputFiles(files, nodeId=None, backendNodeId=None, objectId=None):
+    params = {'files': files}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    command = Command('DOM.setFileInputFiles', params)
+    return command
+
+
+### DOM.setNodeStackTracesEnabled
+def setNodeStackTracesEnabled(enable):
+    params = {'enable': enable}
+    command = Command('DOM.setNodeStackTracesEnabled', params)
+    return command
+
+
+### DOM.getNodeStackTraces
+def getNodeStackTraces(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.getNodeStackTraces', params)
+    return command
+
+
+### DOM.getFileInfo
+def getFileInfo(objectId):
+    params = {'objectId': objectId}
+    command = Command('DOM.getFileInfo', params)
+    return command
+
+
+### DOM.getDetachedDomNodes
+def getDetachedDomNodes():
+    params = {}
+    command = Command('DOM.getDetachedDomNodes', params)
+    return command
+
+
+def getDetachedDomNodes_parser(result):
+    return GetDetachedDomNodesResult(result)
+
+
+### DOM.setInspectedNode
+def setInspectedNode(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.setInspectedNode', params)
+    return command
+
+
+### DOM.setNodeName
+def setNodeName(nodeId, name):
+    params = {'nodeId': nodeId, 'name': name}
+    command = Command('DOM.setNodeName', params)
+    return command
+
+
+### DOM.setNodeValue
+def setNodeValue(nodeId, value):
+    params = {'nodeId': nodeId, 'value': value}
+    command = Command('DOM.setNodeValue', params)
+    return command
+
+
+### DOM.setOuterHTML
+def setOuterHTML(nodeId, outerHTML):
+    params = {'nodeId': nodeId, 'outerHTML': outerHTML}
+    command = Command('DOM.setOuterHTML', params)
+    return command
+
+
+### DOM.undo
+def undo():
+    params = {}
+    command = Command('DOM.undo', params)
+    return command
+
+
+### DOM.getFrameOwner
+def getFrameOwner(frameId):
+    params = {'frameId': frameId}
+    command = Command('DOM.getFrameOwner', params)
+    return command
+
+
+### DOM.getContainerForNode
+def getContainerForNode(nodeId, containerName=None, physicalAxes=None, logicalAxes=None, queriesScrollState=None, queriesAnchored=None):
+    params = {'nodeId': nodeId}
+    if containerName is not None:
+        params['containerName'] = containerName
+    if physicalAxes is not None:
+        params['physicalAxes'] = physicalAxes
+    if logicalAxes is not None:
+        params['logicalAxes'] = logicalAxes
+    if queriesScrollState is not None:
+        params['queriesScrollState'] = queriesScrollState
+    if queriesAnchored is not None:
+        params['queriesAnchored'] = queriesAnchored
+    command = Command('DOM.getContainerForNode', params)
+    return command
+
+
+### DOM.getQueryingDescendantsForContainer
+def getQueryingDescendantsForContainer(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('DOM.getQueryingDescendantsForContainer', params)
+    return command
+
+
+### DOM.getAnchorElement
+def getAnchorElement(nodeId, anchorSpecifier=None):
+    params = {'nodeId': nodeId}
+    if anchorSpecifier is not None:
+        params['anchorSpecifier'] = anchorSpecifier
+    command = Command('DOM.getAnchorElement', params)
+    return command
+
+
+### DOM.forceShowPopover
+def forceShowPopover(nodeId, enable):
+    params = {'nodeId': nodeId, 'enable': enable}
+    command = Command('DOM.forceShowPopover', params)
+    return command
+
+
+### DOM.attributeModified
+def attributeModified():
+    notification = Notification('DOM.attributeModified')
+    return notification
+
+
+def attributeModified_parser(params):
+    return params
+
+
+### DOM.attributeRemoved
+def attributeRemoved():
+    notification = Notification('DOM.attributeRemoved')
+    return notification
+
+
+def attributeRemoved_parser(params):
+    return params
+
+
+### DOM.characterDataModified
+def characterDataModified():
+    notification = Notification('DOM.characterDataModified')
+    return notification
+
+
+def characterDataModified_parser(params):
+    return params
+
+
+### DOM.childNodeCountUpdated
+def childNodeCountUpdated():
+    notification = Notification('DOM.childNodeCountUpdated')
+    return notification
+
+
+def childNodeCountUpdated_parser(params):
+    return params
+
+
+### DOM.childNodeInserted
+def childNodeInserted():
+    notification = Notification('DOM.childNodeInserted')
+    return notification
+
+
+def childNodeInserted_parser(params):
+    return ChildNodeInserted(params)
+
+
+### DOM.childNodeRemoved
+def childNodeRemoved():
+    notification = Notification('DOM.childNodeRemoved')
+    return notification
+
+
+def childNodeRemoved_parser(params):
+    return params
+
+
+### DOM.distributedNodesUpdated
+def distributedNodesUpdated():
+    notification = Notification('DOM.distributedNodesUpdated')
+    return notification
+
+
+def distributedNodesUpdated_parser(params):
+    return DistributedNodesUpdated(params)
+
+
+### DOM.documentUpdated
+def documentUpdated():
+    notification = Notification('DOM.documentUpdated')
+    return notification
+
+
+### DOM.inlineStyleInvalidated
+def inlineStyleInvalidated():
+    notification = Notification('DOM.inlineStyleInvalidated')
+    return notification
+
+
+def inlineStyleInvalidated_parser(params):
+    return params
+
+
+### DOM.pseudoElementAdded
+def pseudoElementAdded():
+    notification = Notification('DOM.pseudoElementAdded')
+    return notification
+
+
+def pseudoElementAdded_parser(params):
+    return PseudoElementAdded(params)
+
+
+### DOM.topLayerElementsUpdated
+def topLayerElementsUpdated():
+    notification = Notification('DOM.topLayerElementsUpdated')
+    return notification
+
+
+### DOM.scrollableFlagUpdated
+def scrollableFlagUpdated():
+    notification = Notification('DOM.scrollableFlagUpdated')
+    return notification
+
+
+def scrollableFlagUpdated_parser(params):
+    return params
+
+
+### DOM.pseudoElementRemoved
+def pseudoElementRemoved():
+    notification = Notification('DOM.pseudoElementRemoved')
+    return notification
+
+
+def pseudoElementRemoved_parser(params):
+    return params
+
+
+### DOM.setChildNodes
+def setChildNodes():
+    notification = Notification('DOM.setChildNodes')
+    return notification
+
+
+def setChildNodes_parser(params):
+    return SetChildNodes(params)
+
+
+### DOM.shadowRootPopped
+def shadowRootPopped():
+    notification = Notification('DOM.shadowRootPopped')
+    return notification
+
+
+def shadowRootPopped_parser(params):
+    return params
+
+
+### DOM.shadowRootPushed
+def shadowRootPushed():
+    notification = Notification('DOM.shadowRootPushed')
+    return notification
+
+
+def shadowRootPushed_parser(params):
+    return ShadowRootPushed(params)
+
+
+class BackendNode(WIPObject):
+    fields = (
+        ('nodeType',),
+        ('nodeName',),
+        ('backendNodeId',),
+    )
+
+
+class Node(WIPObject):
+    fields = (
+        ('nodeId',),
+        ('parentId',),
+        ('backendNodeId',),
+        ('nodeType',),
+        ('nodeName',),
+        ('localName',),
+        ('nodeValue',),
+        ('childNodeCount',),
+        ('children', list_of(lambda value: Node(value))),
+        ('attributes',),
+        ('documentURL',),
+        ('baseURL',),
+        ('publicId',),
+        ('systemId',),
+        ('internalSubset',),
+        ('xmlVersion',),
+        ('name',),
+        ('value',),
+        ('pseudoType',),
+        ('pseudoIdentifier',),
+        ('shadowRootType',),
+        ('frameId',),
+        ('contentDocument', lambda value: Node(value)),
+        ('shadowRoots', list_of(lambda value: Node(value))),
+        ('templateContent', lambda value: Node(value)),
+        ('pseudoElements', list_of(lambda value: Node(value))),
+        ('importedDocument', lambda value: Node(value)),
+        ('distributedNodes', list_of(BackendNode)),
+        ('isSVG',),
+        ('compatibilityMode',),
+        ('assignedSlot', BackendNode),
+        ('isScrollable',),
+    )
+
+
+class DetachedElementInfo(WIPObject):
+    fields = (
+        ('treeNode', Node),
+        ('retainedNodeIds',),
+    )
+
+
+class RGBA(WIPObject):
+    fields = (
+        ('r',),
+        ('g',),
+        ('b',),
+        ('a',),
+    )
+
+
+class ShapeOutsideInfo(WIPObject):
+    fields = (
+        ('bounds',),
+        ('shape',),
+        ('marginShape',),
+    )
+
+
+class BoxModel(WIPObject):
+    fields = (
+        ('content',),
+        ('padding',),
+        ('border',),
+        ('margin',),
+        ('width',),
+        ('height',),
+        ('shapeOutside', ShapeOutsideInfo),
+    )
+
+
+class Rect(WIPObject):
+    fields = (
+        ('x',),
+        ('y',),
+        ('width',),
+        ('height',),
+    )
+
+
+class CSSComputedStyleProperty(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class DescribeNodeResult(LazyView):
+    fields = (
+        ('node', Node),
+    )
+
+
+class GetBoxModelResult(LazyView):
+    fields = (
+        ('model', BoxModel),
+    )
+
+
+class GetDocumentResult(LazyView):
+    fields = (
+        ('root', Node),
+    )
+
+
+class GetFlattenedDocumentResult(LazyView):
+    fields = (
+        ('nodes', list_of(Node)),
+    )
+
+
+class ResolveNodeResult(LazyView):
+    fields = (
+        ('object', RemoteObject),
+    )
+
+
+class GetDetachedDomNodesResult(LazyView):
+    fields = (
+        ('detachedNodes', list_of(DetachedElementInfo)),
+    )
+
+
+class ChildNodeInserted(LazyView):
+    fields = (
+        ('parentNodeId',),
+        ('previousNodeId',),
+        ('node', Node),
+    )
+
+
+class DistributedNodesUpdated(LazyView):
+    fields = (
+        ('insertionPointId',),
+        ('distributedNodes', list_of(BackendNode)),
+    )
+
+
+class PseudoElementAdded(LazyView):
+    fields = (
+        ('parentId',),
+        ('pseudoElement', Node),
+    )
+
+
+class SetChildNodes(LazyView):
+    fields = (
+        ('parentId',),
+        ('nodes', list_of(Node)),
+    )
+
+
+class ShadowRootPushed(LazyView):
+    fields = (
+        ('hostId',),
+        ('root', Node),
+    )
+
+
+register_parsers('DOM', globals())
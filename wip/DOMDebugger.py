@@ -1 +1,118 @@
-# not implemented now
+"""
+DOMDebugger domain. DOM debugging allows setting breakpoints on
+particular DOM operations and events. JavaScript execution will stop on
+these operations as if there was a regular breakpoint set.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+from Runtime import RemoteObject
+
+
+### DOMDebugger.getEventListeners
+def getEventListeners(objectId, depth=None, pierce=None):
+    params = {'objectId': objectId}
+    if depth is not None:
+        params['depth'] = depth
+    if pierce is not None:
+        params['pierce'] = pierce
+    command = Command('DOMDebugger.getEventListeners', params)
+    return command
+
+
+def getEventListeners_parser(result):
+    return GetEventListenersResult(result)
+
+
+### DOMDebugger.removeDOMBreakpoint
+def removeDOMBreakpoint(nodeId, type):
+    params = {'nodeId': nodeId, 'type': type}
+    command = Command('DOMDebugger.removeDOMBreakpoint', params)
+    return command
+
+
+### DOMDebugger.removeEventListenerBreakpoint
+def removeEventListenerBreakpoint(eventName, targetName=None):
+    params = {'eventName': eventName}
+    if targetName is not None:
+        params['targetName'] = targetName
+    command = Command('DOMDebugger.removeEventListenerBreakpoint', params)
+    return command
+
+
+### DOMDebugger.removeInstrumentationBreakpoint
+def removeInstrumentationBreakpoint(eventName):
+    params = {'eventName': eventName}
+    command = Command('DOMDebugger.removeInstrumentationBreakpoint', params)
+    return command
+
+
+### DOMDebugger.removeXHRBreakpoint
+def removeXHRBreakpoint(url):
+    params = {'url': url}
+    command = Command('DOMDebugger.removeXHRBreakpoint', params)
+    return command
+
+
+### DOMDebugger.setBreakOnCSPViolation
+def setBreakOnCSPViolation(violationTypes):
+    params = {'violationTypes': violationTypes}
+    command = Command('DOMDebugger.setBreakOnCSPViolation', params)
+    return command
+
+
+### DOMDebugger.setDOMBreakpoint
+def setDOMBreakpoint(nodeId, type):
+    params = {'nodeId': nodeId, 'type': type}
+    command = Command('DOMDebugger.setDOMBreakpoint', params)
+    return command
+
+
+### DOMDebugger.setEventListenerBreakpoint
+def setEventListenerBreakpoint(eventName, targetName=None):
+    params = {'eventName': eventName}
+    if targetName is not None:
+        params['targetName'] = targetName
+    command = Command('DOMDebugger.setEventListenerBreakpoint', params)
+    return command
+
+
+### DOMDebugger.setInstrumentationBreakpoint
+def setInstrumentationBreakpoint(eventName):
+    params = {'eventName': eventName}
+    command = Command('DOMDebugger.setInstrumentationBreakpoint', params)
+    return command
+
+
+### DOMDebugger.setXHRBreakpoint
+def setXHRBreakpoint(url):
+    params = {'url': url}
+    command = Command('DOMDebugger.setXHRBreakpoint', params)
+    return command
+
+
+class EventListener(WIPObject):
+    fields = (
+        ('type',),
+        ('useCapture',),
+        ('passive',),
+        ('once',),
+        ('scriptId',),
+        ('lineNumber',),
+        ('columnNumber',),
+        ('handler', RemoteObject),
+        ('originalHandler', RemoteObject),
+        ('backendNodeId',),
+    )
+
+
+class GetEventListenersResult(LazyView):
+    fields = (
+        ('listeners', list_of(EventListener)),
+    )
+
+
+register_parsers('DOMDebugger', globals())
@@ -0,0 +1,233 @@
+"""
+DOMSnapshot domain. This domain facilitates obtaining document snapshots
+with DOM, layout, and style information.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+import DOM
+import DOMDebugger
+
+
+### DOMSnapshot.disable
+def disable():
+    params = {}
+    command = Command('DOMSnapshot.disable', params)
+    return command
+
+
+### DOMSnapshot.enable
+def enable():
+    params = {}
+    command = Command('DOMSnapshot.enable', params)
+    return command
+
+
+### DOMSnapshot.getSnapshot
+def getSnapshot(computedStyleWhitelist, includeEventListeners=None, includePaintOrder=None, includeUserAgentShadowTree=None):
+    params = {'computedStyleWhitelist': computedStyleWhitelist}
+    if includeEventListeners is not None:
+        params['includeEventListeners'] = includeEventListeners
+    if includePaintOrder is not None:
+        params['includePaintOrder'] = includePaintOrder
+    if includeUserAgentShadowTree is not None:
+        params['includeUserAgentShadowTree'] = includeUserAgentShadowTree
+    command = Command('DOMSnapshot.getSnapshot', params)
+    return command
+
+
+def getSnapshot_parser(result):
+    return GetSnapshotResult(result)
+
+
+### DOMSnapshot.captureSnapshot
+def captureSnapshot(computedStyles, includePaintOrder=None, includeDOMRects=None, includeBlendedBackgroundColors=None, includeTextColorOpacities=None):
+    params = {'computedStyles': computedStyles}
+    if includePaintOrder is not None:
+        params['includePaintOrder'] = includePaintOrder
+    if includeDOMRects is not None:
+        params['includeDOMRects'] = includeDOMRects
+    if includeBlendedBackgroundColors is not None:
+        params['includeBlendedBackgroundColors'] = includeBlendedBackgroundColors
+    if includeTextColorOpacities is not None:
+        params['includeTextColorOpacities'] = includeTextColorOpacities
+    command = Command('DOMSnapshot.captureSnapshot', params)
+    return command
+
+
+def captureSnapshot_parser(result):
+    return CaptureSnapshotResult(result)
+
+
+class NameValue(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class DOMNode(WIPObject):
+    fields = (
+        ('nodeType',),
+        ('nodeName',),
+        ('nodeValue',),
+        ('textValue',),
+        ('inputValue',),
+        ('inputChecked',),
+        ('optionSelected',),
+        ('backendNodeId',),
+        ('childNodeIndexes',),
+        ('attributes', list_of(NameValue)),
+        ('pseudoElementIndexes',),
+        ('layoutNodeIndex',),
+        ('documentURL',),
+        ('baseURL',),
+        ('contentLanguage',),
+        ('documentEncoding',),
+        ('publicId',),
+        ('systemId',),
+        ('frameId',),
+        ('contentDocumentIndex',),
+        ('pseudoType',),
+        ('shadowRootType',),
+        ('isClickable',),
+        ('eventListeners', list_of(lambda value: DOMDebugger.EventListener(value))),
+        ('currentSourceURL',),
+        ('originURL',),
+        ('scrollOffsetX',),
+        ('scrollOffsetY',),
+    )
+
+
+class InlineTextBox(WIPObject):
+    fields = (
+        ('boundingBox', lambda value: DOM.Rect(value)),
+        ('startCharacterIndex',),
+        ('numCharacters',),
+    )
+
+
+class LayoutTreeNode(WIPObject):
+    fields = (
+        ('domNodeIndex',),
+        ('boundingBox', lambda value: DOM.Rect(value)),
+        ('layoutText',),
+        ('inlineTextNodes', list_of(InlineTextBox)),
+        ('styleIndex',),
+        ('paintOrder',),
+        ('isStackingContext',),
+    )
+
+
+class ComputedStyle(WIPObject):
+    fields = (
+        ('properties', list_of(NameValue)),
+    )
+
+
+class RareStringData(WIPObject):
+    fields = (
+        ('index',),
+        ('value',),
+    )
+
+
+class RareBooleanData(WIPObject):
+    fields = (
+        ('index',),
+    )
+
+
+class RareIntegerData(WIPObject):
+    fields = (
+        ('index',),
+        ('value',),
+    )
+
+
+class NodeTreeSnapshot(WIPObject):
+    fields = (
+        ('parentIndex',),
+        ('nodeType',),
+        ('shadowRootType', RareStringData),
+        ('nodeName',),
+        ('nodeValue',),
+        ('backendNodeId',),
+        ('attributes',),
+        ('textValue', RareStringData),
+        ('inputValue', RareStringData),
+        ('inputChecked', RareBooleanData),
+        ('optionSelected', RareBooleanData),
+        ('contentDocumentIndex', RareIntegerData),
+        ('pseudoType', RareStringData),
+        ('pseudoIdentifier', RareStringData),
+        ('isClickable', RareBooleanData),
+        ('currentSourceURL', RareStringData),
+        ('originURL', RareStringData),
+    )
+
+
+class LayoutTreeSnapshot(WIPObject):
+    fields = (
+        ('nodeIndex',),
+        ('styles',),
+        ('bounds',),
+        ('text',),
+        ('stackingContexts', RareBooleanData),
+        ('paintOrders',),
+        ('offsetRects',),
+        ('scrollRects',),
+        ('clientRects',),
+        ('blendedBackgroundColors',),
+        ('textColorOpacities',),
+    )
+
+
+class TextBoxSnapshot(WIPObject):
+    fields = (
+        ('layoutIndex',),
+        ('bounds',),
+        ('start',),
+        ('length',),
+    )
+
+
+class DocumentSnapshot(WIPObject):
+    fields = (
+        ('documentURL',),
+        ('title',),
+        ('baseURL',),
+        ('contentLanguage',),
+        ('encodingName',),
+        ('publicId',),
+        ('systemId',),
+        ('frameId',),
+        ('nodes', NodeTreeSnapshot),
+        ('layout', LayoutTreeSnapshot),
+        ('textBoxes', TextBoxSnapshot),
+        ('scrollOffsetX',),
+        ('scrollOffsetY',),
+        ('contentWidth',),
+        ('contentHeight',),
+    )
+
+
+class GetSnapshotResult(LazyView):
+    fields = (
+        ('domNodes', list_of(DOMNode)),
+        ('layoutTreeNodes', list_of(LayoutTreeNode)),
+        ('computedStyles', list_of(ComputedStyle)),
+    )
+
+
+class CaptureSnapshotResult(LazyView):
+    fields = (
+        ('documents', list_of(DocumentSnapshot)),
+        ('strings',),
+    )
+
+
+register_parsers('DOMSnapshot', globals())
@@ -0,0 +1,132 @@
+"""
+DOMStorage domain. Query and modify DOM storage.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, register_parsers
+
+
+### DOMStorage.clear
+def clear(storageId):
+    params = {'storageId': storageId}
+    command = Command('DOMStorage.clear', params)
+    return command
+
+
+### DOMStorage.disable
+def disable():
+    params = {}
+    command = Command('DOMStorage.disable', params)
+    return command
+
+
+### DOMStorage.enable
+def enable():
+    params = {}
+    command = Command('DOMStorage.enable', params)
+    return command
+
+
+### DOMStorage.getDOMStorageItems
+def getDOMStorageItems(storageId):
+    params = {'storageId': storageId}
+    command = Command('DOMStorage.getDOMStorageItems', params)
+    return command
+
+
+### DOMStorage.removeDOMStorageItem
+def removeDOMStorageItem(storageId, key):
+    params = {'storageId': storageId, 'key': key}
+    command = Command('DOMStorage.removeDOMStorageItem', params)
+    return command
+
+
+### DOMStorage.setDOMStorageItem
+def setDOMStorageItem(storageId, key, value):
+    params = {'storageId': storageId, 'key': key, 'value': value}
+    command = Command('DOMStorage.setDOMStorageItem', params)
+    return command
+
+
+### DOMStorage.domStorageItemAdded
+def domStorageItemAdded():
+    notification = Notification('DOMStorage.domStorageItemAdded')
+    return notification
+
+
+def domStorageItemAdded_parser(params):
+    return DomStorageItemAdded(params)
+
+
+### DOMStorage.domStorageItemRemoved
+def domStorageItemRemoved():
+    notification = Notification('DOMStorage.domStorageItemRemoved')
+    return notification
+
+
+def domStorageItemRemoved_parser(params):
+    return DomStorageItemRemoved(params)
+
+
+### DOMStorage.domStorageItemUpdated
+def domStorageItemUpdated():
+    notification = Notification('DOMStorage.domStorageItemUpdated')
+    return notification
+
+
+def domStorageItemUpdated_parser(params):
+    return DomStorageItemUpdated(params)
+
+
+### DOMStorage.domStorageItemsCleared
+def domStorageItemsCleared():
+    notification = Notification('DOMStorage.domStorageItemsCleared')
+    return notification
+
+
+def domStorageItemsCleared_parser(params):
+    return DomStorageItemsCleared(params)
+
+
+class StorageId(WIPObject):
+    fields = (
+        ('securityOrigin',),
+        ('storageKey',),
+        ('isLocalStorage',),
+    )
+
+
+class DomStorageItemAdded(LazyView):
+    fields = (
+        ('storageId', StorageId),
+        ('key',),
+        ('newValue',),
+    )
+
+
+class DomStorageItemRemoved(LazyView):
+    fields = (
+        ('storageId', StorageId),
+        ('key',),
+    )
+
+
+class DomStorageItemUpdated(LazyView):
+    fields = (
+        ('storageId', StorageId),
+        ('key',),
+        ('oldValue',),
+        ('newValue',),
+    )
+
+
+class DomStorageItemsCleared(LazyView):
+    fields = (
+        ('storageId', StorageId),
+    )
+
+
+register_parsers('DOMStorage', globals())
@@ -1,6 +1,5 @@
-from utils import Command, Notification, WIPObject
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
 from Runtime import RemoteObject
-import json
 
 
 ### Console.clearMessages
@@ -77,6 +76,13 @@ def setBreakpoint_parser(result):
     return data
 
 
+def getScriptSource(scriptId):
+    params = {}
+    params['scriptId'] = scriptId
+    command = Command('Debugger.getScriptSource', params)
+    return command
+
+
 def setScriptSource(scriptId, scriptSource):
     params = {}
     params['scriptId'] = scriptId
@@ -89,8 +95,14 @@ def setScriptSource(scriptId, scriptSource):
 def setScriptSource_parser(result):
     data = {}
     data['callFrames'] = []
-    for callFrame in result['callFrames']:
+    # only there when the new source was applied
+    for callFrame in result.get('callFrames', ()):
         data['callFrames'].append(CallFrame(callFrame))
+    # Ok, CompileError or BlockedBy..., older versions failed the
+    # command instead of answering with a status
+    data['status'] = result.get('status', 'Ok')
+    if 'exceptionDetails' in result:
+        data['exceptionDetails'] = result['exceptionDetails']
     return data
 
 
@@ -133,7 +145,7 @@ def scriptParsed():
 
 
 def scriptParsed_parser(params):
-    return {'scriptId': ScriptId(params['scriptId']), 'url': params['url']}
+    return ScriptParsed(params)
 
 
 def paused():
@@ -142,12 +154,7 @@ def paused():
 
 
 def paused_parser(params):
-    data = {}
-    data['callFrames'] = []
-    for callFrame in params['callFrames']:
-        data['callFrames'].append(CallFrame(callFrame))
-    data['reason'] = params['reason']
-    return data
+    return Paused(params)
 
 
 def resumed():
@@ -156,6 +163,8 @@ def resumed():
 
 
 class BreakpointId(WIPObject):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -167,6 +176,8 @@ class BreakpointId(WIPObject):
 
 
 class CallFrameId(WIPObject):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -178,6 +189,8 @@ class CallFrameId(WIPObject):
 
 
 class ScriptId(WIPObject):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -189,16 +202,18 @@ class ScriptId(WIPObject):
 
 
 class Scope(WIPObject):
-    def __init__(self, value):
-        self.set_class(value, 'object', RemoteObject)
-        self.set(value, 'type')
+    fields = (
+        ('object', RemoteObject),
+        ('type',),
+    )
 
 
 class Location(WIPObject):
-    def __init__(self, value):
-        self.set(value, 'columnNumber')
-        self.set(value, 'lineNumber')
-        self.set_class(value, 'scriptId', ScriptId)
+    fields = (
+        ('columnNumber',),
+        ('lineNumber',),
+        ('scriptId', ScriptId),
+    )
 
     def __call__(self):
         obj = {}
@@ -210,15 +225,30 @@ class Location(WIPObject):
 
 
 class CallFrame(WIPObject):
-    def __init__(self, value):
-        self.set_class(value, 'callFrameId', CallFrameId)
-        self.set(value, 'functionName')
-        self.set_class(value, 'location', Location)
-        self.scopeChain = []
-        if 'scopeChain' in value:
-            for scope in value['scopeChain']:
-                self.scopeChain.append(Scope(scope))
-        self.set_class(value, 'this', RemoteObject)
+    fields = (
+        ('callFrameId', CallFrameId),
+        ('functionName',),
+        ('location', Location),
+        ('scopeChain', list_of(Scope), list),
+        ('this', RemoteObject),
+    )
 
     def __str__(self):
         return "%s:%d %s" % (self.location.scriptId, self.location.lineNumber, self.functionName)
+
+
+class ScriptParsed(LazyView):
+    fields = (
+        ('scriptId', ScriptId),
+        ('url',),
+    )
+
+
+class Paused(LazyView):
+    fields = (
+        ('callFrames', list_of(CallFrame), list),
+        ('reason',),
+    )
+
+
+register_parsers('Debugger', globals())
@@ -0,0 +1,60 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### DeviceAccess.enable
+def enable():
+    params = {}
+    command = Command('DeviceAccess.enable', params)
+    return command
+
+
+### DeviceAccess.disable
+def disable():
+    params = {}
+    command = Command('DeviceAccess.disable', params)
+    return command
+
+
+### DeviceAccess.selectPrompt
+def selectPrompt(id, deviceId):
+    params = {'id': id, 'deviceId': deviceId}
+    command = Command('DeviceAccess.selectPrompt', params)
+    return command
+
+
+### DeviceAccess.cancelPrompt
+def cancelPrompt(id):
+    params = {'id': id}
+    command = Command('DeviceAccess.cancelPrompt', params)
+    return command
+
+
+### DeviceAccess.deviceRequestPrompted
+def deviceRequestPrompted():
+    notification = Notification('DeviceAccess.deviceRequestPrompted')
+    return notification
+
+
+def deviceRequestPrompted_parser(params):
+    return DeviceRequestPrompted(params)
+
+
+class PromptDevice(WIPObject):
+    fields = (
+        ('id',),
+        ('name',),
+    )
+
+
+class DeviceRequestPrompted(LazyView):
+    fields = (
+        ('id',),
+        ('devices', list_of(PromptDevice)),
+    )
+
+
+register_parsers('DeviceAccess', globals())
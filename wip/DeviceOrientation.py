@@ -0,0 +1,22 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, register_parsers
+
+
+### DeviceOrientation.clearDeviceOrientationOverride
+def clearDeviceOrientationOverride():
+    params = {}
+    command = Command('DeviceOrientation.clearDeviceOrientationOverride', params)
+    return command
+
+
+### DeviceOrientation.setDeviceOrientationOverride
+def setDeviceOrientationOverride(alpha, beta, gamma):
+    params = {'alpha': alpha, 'beta': beta, 'gamma': gamma}
+    command = Command('DeviceOrientation.setDeviceOrientationOverride', params)
+    return command
+
+
+register_parsers('DeviceOrientation', globals())
@@ -0,0 +1,582 @@
+"""
+Emulation domain. This domain emulates different environments for the
+page.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Emulation.canEmulate
+def canEmulate():
+    params = {}
+    command = Command('Emulation.canEmulate', params)
+    return command
+
+
+### Emulation.clearDeviceMetricsOverride
+def clearDeviceMetricsOverride():
+    params = {}
+    command = Command('Emulation.clearDeviceMetricsOverride', params)
+    return command
+
+
+### Emulation.clearGeolocationOverride
+def clearGeolocationOverride():
+    params = {}
+    command = Command('Emulation.clearGeolocationOverride', params)
+    return command
+
+
+### Emulation.resetPageScaleFactor
+def resetPageScaleFactor():
+    params = {}
+    command = Command('Emulation.resetPageScaleFactor', params)
+    return command
+
+
+### Emulation.setFocusEmulationEnabled
+def setFocusEmulationEnabled(enabled):
+    params = {'enabled': enabled}
+    command = Command('Emulation.setFocusEmulationEnabled', params)
+    return command
+
+
+### Emulation.setAutoDarkModeOverride
+def setAutoDarkModeOverride(enabled=None):
+    params = {}
+    if enabled is not None:
+        params['enabled'] = enabled
+    command = Command('Emulation.setAutoDarkModeOverride', params)
+    return command
+
+
+### Emulation.setCPUThrottlingRate
+def setCPUThrottlingRate(rate):
+    params = {'rate': rate}
+    command = Command('Emulation.setCPUThrottlingRate', params)
+    return command
+
+
+### Emulation.setDefaultBackgroundColorOverride
+def setDefaultBackgroundColorOverride(color=None):
+    params = {}
+    if color is not None:
+        params['color'] = color
+    command = Command('Emulation.setDefaultBackgroundColorOverride', params)
+    return command
+
+
+### Emulation.setSafeAreaInsetsOverride
+def setSafeAreaInsetsOverride(insets):
+    params = {'insets': insets}
+    command = Command('Emulation.setSafeAreaInsetsOverride', params)
+    return command
+
+
+### Emulation.setDeviceMetricsOverride
+def setDeviceMetricsOverride(width, height, deviceScaleFactor, mobile, scale=None, screenWidth=None, screenHeight=None, positionX=None, positionY=None, dontSetVisibleSize=None, screenOrientation=None, viewport=None, displayFeature=None, devicePosture=None):
+    params = {'width': width, 'height': height, 'deviceScaleFactor': deviceScaleFactor, 'mobile': mobile}
+    if scale is not None:
+        params['scale'] = scale
+    if screenWidth is not None:
+        params['screenWidth'] = screenWidth
+    if screenHeight is not None:
+        params['screenHeight'] = screenHeight
+    if positionX is not None:
+        params['positionX'] = positionX
+    if positionY is not None:
+        params['positionY'] = positionY
+    if dontSetVisibleSize is not None:
+        params['dontSetVisibleSize'] = dontSetVisibleSize
+    if screenOrientation is not None:
+        params['screenOrientation'] = screenOrientation
+    if viewport is not None:
+        params['viewport'] = viewport
+    if displayFeature is not None:
+        params['displayFeature'] = displayFeature
+    if devicePosture is not None:
+        params['devicePosture'] = devicePosture
+    command = Command('Emulation.setDeviceMetricsOverride', params)
+    return command
+
+
+### Emulation.setDevicePostureOverride
+def setDevicePostureOverride(posture):
+    params = {'posture': posture}
+    command = Command('Emulation.setDevicePostureOverride', params)
+    return command
+
+
+### Emulation.clearDevicePostureOverride
+def clearDevicePostureOverride():
+    params = {}
+    command = Command('Emulation.clearDevicePostureOverride', params)
+    return command
+
+
+### Emulation.setDisplayFeaturesOverride
+def setDisplayFeaturesOverride(features):
+    params = {'features': features}
+    command = Command('Emulation.setDisplayFeaturesOverride', params)
+    return command
+
+
+### Emulation.clearDisplayFeaturesOverride
+def clearDisplayFeaturesOverride():
+    params = {}
+    command = Command('Emulation.clearDisplayFeaturesOverride', params)
+    return command
+
+
+### Emulation.setScrollbarsHidden
+def setScrollbarsHidden(hidden):
+    params = {'hidden': hidden}
+    command = Command('Emulation.setScrollbarsHidden', params)
+    return command
+
+
+### Emulation.setDocumentCookieDisabled
+def setDocumentCookieDisabled(disabled):
+    params = {'disabled': disabled}
+    command = Command('Emulation.setDocumentCookieDisabled', params)
+    return command
+
+
+### Emulation.setEmitTouchEventsForMouse
+def setEmitTouchEventsForMouse(enabled, configuration=None):
+    params = {'enabled': enabled}
+    if configuration is not None:
+        params['configuration'] = configuration
+    command = Command('Emulation.setEmitTouchEventsForMouse', params)
+    return command
+
+
+### Emulation.setEmulatedMedia
+def setEmulatedMedia(media=None, features=None):
+    params = {}
+    if media is not None:
+        params['media'] = media
+    if features is not None:
+        params['features'] = features
+    command = Command('Emulation.setEmulatedMedia', params)
+    return command
+
+
+### Emulation.setEmulatedVisionDeficiency
+def setEmulatedVisionDeficiency(type):
+    params = {'type': type}
+    command = Command('Emulation.setEmulatedVisionDeficiency', params)
+    return command
+
+
+### Emulation.setEmulatedOSTextScale
+def setEmulatedOSTextScale(scale=None):
+    params = {}
+    if scale is not None:
+        params['scale'] = scale
+    command = Command('Emulation.setEmulatedOSTextScale', params)
+    return command
+
+
+### Emulation.setGeolocationOverride
+def setGeolocationOverride(latitude=None, longitude=None, accuracy=None, altitude=None, altitudeAccuracy=None, heading=None, speed=None):
+    params = {}
+    if latitude is not None:
+        params['latitude'] = latitude
+    if longitude is not None:
+        params['longitude'] = longitude
+    if accuracy is not None:
+        params['accuracy'] = accuracy
+    if altitude is not None:
+        params['altitude'] = altitude
+    if altitudeAccuracy is not None:
+        params['altitudeAccuracy'] = altitudeAccuracy
+    if heading is not None:
+        params['heading'] = heading
+    if speed is not None:
+        params['speed'] = speed
+    command = Command('Emulation.setGeolocationOverride', params)
+    return command
+
+
+### Emulation.getOverriddenSensorInformation
+def getOverriddenSensorInformation(type):
+    params = {'type': type}
+    command = Command('Emulation.getOverriddenSensorInformation', params)
+    return command
+
+
+### Emulation.setSensorOverrideEnabled
+def setSensorOverrideEnabled(enabled, type, metadata=None):
+    params = {'enabled': enabled, 'type': type}
+    if metadata is not None:
+        params['metadata'] = metadata
+    command = Command('Emulation.setSensorOverrideEnabled', params)
+    return command
+
+
+### Emulation.setSensorOverrideReadings
+def setSensorOverrideReadings(type, reading):
+    params = {'type': type, 'reading': reading}
+    command = Command('Emulation.setSensorOverrideReadings', params)
+    return command
+
+
+### Emulation.setPressureSourceOverrideEnabled
+def setPressureSourceOverrideEnabled(enabled, source, metadata=None):
+    params = {'enabled': enabled, 'source': source}
+    if metadata is not None:
+        params['metadata'] = metadata
+    command = Command('Emulation.setPressureSourceOverrideEnabled', params)
+    return command
+
+
+### Emulation.setPressureStateOverride
+def setPressureStateOverride(source, state):
+    params = {'source': source, 'state': state}
+    command = Command('Emulation.setPressureStateOverride', params)
+    return command
+
+
+### Emulation.setPressureDataOverride
+def setPressureDataOverride(source, state, ownContributionEstimate=None):
+    params = {'source': source, 'state': state}
+    if ownContributionEstimate is not None:
+        params['ownContributionEstimate'] = ownContributionEstimate
+    command = Command('Emulation.setPressureDataOverride', params)
+    return command
+
+
+### Emulation.setIdleOverride
+def setIdleOverride(isUserActive, isScreenUnlocked):
+    params = {'isUserActive': isUserActive, 'isScreenUnlocked': isScreenUnlocked}
+    command = Command('Emulation.setIdleOverride', params)
+    return command
+
+
+### Emulation.clearIdleOverride
+def clearIdleOverride():
+    params = {}
+    command = Command('Emulation.clearIdleOverride', params)
+    return command
+
+
+### Emulation.setNavigatorOverrides
+def setNavigatorOverrides(platform):
+    params = {'platform': platform}
+    command = Command('Emulation.setNavigatorOverrides', params)
+    return command
+
+
+### Emulation.setPageScaleFactor
+def setPageScaleFactor(pageScaleFactor):
+    params = {'pageScaleFactor': pageScaleFactor}
+    command = Command('Emulation.setPageScaleFactor', params)
+    return command
+
+
+### Emulation.setScriptExecutionDisabled
+def setScriptExecutionDisabled(value):
+    params = {'value': value}
+    command = Command('Emulation.setScriptExecutionDisabled', params)
+    return command
+
+
+### Emulation.setTouchEmulationEnabled
+def setTouchEmulationEnabled(enabled, maxTouchPoints=None):
+    params = {'enabled': enabled}
+    if maxTouchPoints is not None:
+        params['maxTouchPoints'] = maxTouchPoints
+    command = Command('Emulation.setTouchEmulationEnabled', params)
+    return command
+
+
+### Emulation.setVirtualTimePolicy
+def setVirtualTimePolicy(policy, budget=None, maxVirtualTimeTaskStarvationCount=None, initialVirtualTime=None):
+    params = {'policy': policy}
+    if budget is not None:
+        params['budget'] = budget
+    if maxVirtualTimeTaskStarvationCount is not None:
+        params['maxVirtualTimeTaskStarvationCount'] = maxVirtualTimeTaskStarvationCount
+    if initialVirtualTime is not None:
+        params['initialVirtualTime'] = initialVirtualTime
+    command = Command('Emulation.setVirtualTimePolicy', params)
+    return command
+
+
+### Emulation.setLocaleOverride
+def setLocaleOverride(locale=None):
+    params = {}
+    if locale is not None:
+        params['locale'] = locale
+    command = Command('Emulation.setLocaleOverride', params)
+    return command
+
+
+### Emulation.setTimezoneOverride
+def setTimezoneOverride(timezoneId):
+    params = {'timezoneId': timezoneId}
+    command = Command('Emulation.setTimezoneOverride', params)
+    return command
+
+
+### Emulation.setVisibleSize
+def setVisibleSize(width, height):
+    params = {'width': width, 'height': height}
+    command = Command('Emulation.setVisibleSize', params)
+    return command
+
+
+### Emulation.setDisabledImageTypes
+def setDisabledImageTypes(imageTypes):
+    params = {'imageTypes': imageTypes}
+    command = Command('Emulation.setDisabledImageTypes', params)
+    return command
+
+
+### Emulation.setDataSaverOverride
+def setDataSaverOverride(dataSaverEnabled=None):
+    params = {}
+    if dataSaverEnabled is not None:
+        params['dataSaverEnabled'] = dataSaverEnabled
+    command = Command('Emulation.setDataSaverOverride', params)
+    return command
+
+
+### Emulation.setHardwareConcurrencyOverride
+def setHardwareConcurrencyOverride(hardwareConcurrency):
+    params = {'hardwareConcurrency': hardwareConcurrency}
+    command = Command('Emulation.setHardwareConcurrencyOverride', params)
+    return command
+
+
+### Emulation.setUserAgentOverride
+def setUserAgentOverride(userAgent, acceptLanguage=None, platform=None, userAgentMetadata=None):
+    params = {'userAgent': userAgent}
+    if acceptLanguage is not None:
+        params['acceptLanguage'] = acceptLanguage
+    if platform is not None:
+        params['platform'] = platform
+    if userAgentMetadata is not None:
+        params['userAgentMetadata'] = userAgentMetadata
+    command = Command('Emulation.setUserAgentOverride', params)
+    return command
+
+
+### Emulation.setAutomationOverride
+def setAutomationOverride(enabled):
+    params = {'enabled': enabled}
+    command = Command('Emulation.setAutomationOverride', params)
+    return command
+
+
+### Emulation.setSmallViewportHeightDifferenceOverride
+def setSmallViewportHeightDifferenceOverride(difference):
+    params = {'difference': difference}
+    command = Command('Emulation.setSmallViewportHeightDifferenceOverride', params)
+    return command
+
+
+### Emulation.getScreenInfos
+def getScreenInfos():
+    params = {}
+    command = Command('Emulation.getScreenInfos', params)
+    return command
+
+
+def getScreenInfos_parser(result):
+    return GetScreenInfosResult(result)
+
+
+### Emulation.addScreen
+def addScreen(left, top, width, height, workAreaInsets=None, devicePixelRatio=None, rotation=None, colorDepth=None, label=None, isInternal=None):
+    params = {'left': left, 'top': top, 'width': width, 'height': height}
+    if workAreaInsets is not None:
+        params['workAreaInsets'] = workAreaInsets
+    if devicePixelRatio is not None:
+        params['devicePixelRatio'] = devicePixelRatio
+    if rotation is not None:
+        params['rotation'] = rotation
+    if colorDepth is not None:
+        params['colorDepth'] = colorDepth
+    if label is not None:
+        params['label'] = label
+    if isInternal is not None:
+        params['isInternal'] = isInternal
+    command = Command('Emulation.addScreen', params)
+    return command
+
+
+def addScreen_parser(result):
+    return AddScreenResult(result)
+
+
+### Emulation.removeScreen
+def removeScreen(screenId):
+    params = {'screenId': screenId}
+    command = Command('Emulation.removeScreen', params)
+    return command
+
+
+### Emulation.virtualTimeBudgetExpired
+def virtualTimeBudgetExpired():
+    notification = Notification('Emulation.virtualTimeBudgetExpired')
+    return notification
+
+
+class SafeAreaInsets(WIPObject):
+    fields = (
+        ('top',),
+        ('topMax',),
+        ('left',),
+        ('leftMax',),
+        ('bottom',),
+        ('bottomMax',),
+        ('right',),
+        ('rightMax',),
+    )
+
+
+class ScreenOrientation(WIPObject):
+    fields = (
+        ('type',),
+        ('angle',),
+    )
+
+
+class DisplayFeature(WIPObject):
+    fields = (
+        ('orientation',),
+        ('offset',),
+        ('maskLength',),
+    )
+
+
+class DevicePosture(WIPObject):
+    fields = (
+        ('type',),
+    )
+
+
+class MediaFeature(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class UserAgentBrandVersion(WIPObject):
+    fields = (
+        ('brand',),
+        ('version',),
+    )
+
+
+class UserAgentMetadata(WIPObject):
+    fields = (
+        ('brands', list_of(UserAgentBrandVersion)),
+        ('fullVersionList', list_of(UserAgentBrandVersion)),
+        ('fullVersion',),
+        ('platform',),
+        ('platformVersion',),
+        ('architecture',),
+        ('model',),
+        ('mobile',),
+        ('bitness',),
+        ('wow64',),
+        ('formFactors',),
+    )
+
+
+class SensorMetadata(WIPObject):
+    fields = (
+        ('available',),
+        ('minimumFrequency',),
+        ('maximumFrequency',),
+    )
+
+
+class SensorReadingSingle(WIPObject):
+    fields = (
+        ('value',),
+    )
+
+
+class SensorReadingXYZ(WIPObject):
+    fields = (
+        ('x',),
+        ('y',),
+        ('z',),
+    )
+
+
+class SensorReadingQuaternion(WIPObject):
+    fields = (
+        ('x',),
+        ('y',),
+        ('z',),
+        ('w',),
+    )
+
+
+class SensorReading(WIPObject):
+    fields = (
+        ('single', SensorReadingSingle),
+        ('xyz', SensorReadingXYZ),
+        ('quaternion', SensorReadingQuaternion),
+    )
+
+
+class PressureMetadata(WIPObject):
+    fields = (
+        ('available',),
+    )
+
+
+class WorkAreaInsets(WIPObject):
+    fields = (
+        ('top',),
+        ('left',),
+        ('bottom',),
+        ('right',),
+    )
+
+
+class ScreenInfo(WIPObject):
+    fields = (
+        ('left',),
+        ('top',),
+        ('width',),
+        ('height',),
+        ('availLeft',),
+        ('availTop',),
+        ('availWidth',),
+        ('availHeight',),
+        ('devicePixelRatio',),
+        ('orientation', ScreenOrientation),
+        ('colorDepth',),
+        ('isExtended',),
+        ('isInternal',),
+        ('isPrimary',),
+        ('label',),
+        ('id',),
+    )
+
+
+class GetScreenInfosResult(LazyView):
+    fields = (
+        ('screenInfos', list_of(ScreenInfo)),
+    )
+
+
+class AddScreenResult(LazyView):
+    fields = (
+        ('screenInfo', ScreenInfo),
+    )
+
+
+register_parsers('Emulation', globals())
@@ -0,0 +1,36 @@
+"""
+EventBreakpoints domain. EventBreakpoints permits setting JavaScript
+breakpoints on operations and events occurring in native code invoked
+from JavaScript. Once breakpoint is hit, it is reported through Debugger
+domain, similarly to regular breakpoints being hit.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, register_parsers
+
+
+### EventBreakpoints.setInstrumentationBreakpoint
+def setInstrumentationBreakpoint(eventName):
+    params = {'eventName': eventName}
+    command = Command('EventBreakpoints.setInstrumentationBreakpoint', params)
+    return command
+
+
+### EventBreakpoints.removeInstrumentationBreakpoint
+def removeInstrumentationBreakpoint(eventName):
+    params = {'eventName': eventName}
+    command = Command('EventBreakpoints.removeInstrumentationBreakpoint', params)
+    return command
+
+
+### EventBreakpoints.disable
+def disable():
+    params = {}
+    command = Command('EventBreakpoints.disable', params)
+    return command
+
+
+register_parsers('EventBreakpoints', globals())
@@ -0,0 +1,56 @@
+"""
+Extensions domain. Defines commands and events for browser extensions.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, register_parsers
+
+
+### Extensions.loadUnpacked
+def loadUnpacked(path):
+    params = {'path': path}
+    command = Command('Extensions.loadUnpacked', params)
+    return command
+
+
+### Extensions.uninstall
+def uninstall(id):
+    params = {'id': id}
+    command = Command('Extensions.uninstall', params)
+    return command
+
+
+### Extensions.getStorageItems
+def getStorageItems(id, storageArea, keys=None):
+    params = {'id': id, 'storageArea': storageArea}
+    if keys is not None:
+        params['keys'] = keys
+    command = Command('Extensions.getStorageItems', params)
+    return command
+
+
+### Extensions.removeStorageItems
+def removeStorageItems(id, storageArea, keys):
+    params = {'id': id, 'storageArea': storageArea, 'keys': keys}
+    command = Command('Extensions.removeStorageItems', params)
+    return command
+
+
+### Extensions.clearStorageItems
+def clearStorageItems(id, storageArea):
+    params = {'id': id, 'storageArea': storageArea}
+    command = Command('Extensions.clearStorageItems', params)
+    return command
+
+
+### Extensions.setStorageItems
+def setStorageItems(id, storageArea, values):
+    params = {'id': id, 'storageArea': storageArea, 'values': values}
+    command = Command('Extensions.setStorageItems', params)
+    return command
+
+
+register_parsers('Extensions', globals())
@@ -0,0 +1,110 @@
+"""
+FedCm domain. This domain allows interacting with the FedCM dialog.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### FedCm.enable
+def enable(disableRejectionDelay=None):
+    params = {}
+    if disableRejectionDelay is not None:
+        params['disableRejectionDelay'] = disableRejectionDelay
+    command = Command('FedCm.enable', params)
+    return command
+
+
+### FedCm.disable
+def disable():
+    params = {}
+    command = Command('FedCm.disable', params)
+    return command
+
+
+### FedCm.selectAccount
+def selectAccount(dialogId, accountIndex):
+    params = {'dialogId': dialogId, 'accountIndex': accountIndex}
+    command = Command('FedCm.selectAccount', params)
+    return command
+
+
+### FedCm.clickDialogButton
+def clickDialogButton(dialogId, dialogButton):
+    params = {'dialogId': dialogId, 'dialogButton': dialogButton}
+    command = Command('FedCm.clickDialogButton', params)
+    return command
+
+
+### FedCm.openUrl
+def openUrl(dialogId, accountIndex, accountUrlType):
+    params = {'dialogId': dialogId, 'accountIndex': accountIndex, 'accountUrlType': accountUrlType}
+    command = Command('FedCm.openUrl', params)
+    return command
+
+
+### FedCm.dismissDialog
+def dismissDialog(dialogId, triggerCooldown=None):
+    params = {'dialogId': dialogId}
+    if triggerCooldown is not None:
+        params['triggerCooldown'] = triggerCooldown
+    command = Command('FedCm.dismissDialog', params)
+    return command
+
+
+### FedCm.resetCooldown
+def resetCooldown():
+    params = {}
+    command = Command('FedCm.resetCooldown', params)
+    return command
+
+
+### FedCm.dialogShown
+def dialogShown():
+    notification = Notification('FedCm.dialogShown')
+    return notification
+
+
+def dialogShown_parser(params):
+    return DialogShown(params)
+
+
+### FedCm.dialogClosed
+def dialogClosed():
+    notification = Notification('FedCm.dialogClosed')
+    return notification
+
+
+def dialogClosed_parser(params):
+    return params
+
+
+class Account(WIPObject):
+    fields = (
+        ('accountId',),
+        ('email',),
+        ('name',),
+        ('givenName',),
+        ('pictureUrl',),
+        ('idpConfigUrl',),
+        ('idpLoginUrl',),
+        ('loginState',),
+        ('termsOfServiceUrl',),
+        ('privacyPolicyUrl',),
+    )
+
+
+class DialogShown(LazyView):
+    fields = (
+        ('dialogId',),
+        ('dialogType',),
+        ('accounts', list_of(Account)),
+        ('title',),
+        ('subtitle',),
+    )
+
+
+register_parsers('FedCm', globals())
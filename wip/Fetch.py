@@ -0,0 +1,184 @@
+"""
+Fetch domain. A domain for letting clients substitute browser's network
+layer with client code.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Network import RequestId
+
+
+### Fetch.disable
+def disable():
+    params = {}
+    command = Command('Fetch.disable', params)
+    return command
+
+
+### Fetch.enable
+def enable(patterns=None, handleAuthRequests=None):
+    params = {}
+    if patterns is not None:
+        params['patterns'] = patterns
+    if handleAuthRequests is not None:
+        params['handleAuthRequests'] = handleAuthRequests
+    command = Command('Fetch.enable', params)
+    return command
+
+
+### Fetch.failRequest
+def failRequest(requestId, errorReason):
+    params = {'requestId': requestId, 'errorReason': errorReason}
+    command = Command('Fetch.failRequest', params)
+    return command
+
+
+### Fetch.fulfillRequest
+def fulfillRequest(requestId, responseCode, responseHeaders=None, binaryResponseHeaders=None, body=None, responsePhrase=None):
+    params = {'requestId': requestId, 'responseCode': responseCode}
+    if responseHeaders is not None:
+        params['responseHeaders'] = responseHeaders
+    if binaryResponseHeaders is not None:
+        params['binaryResponseHeaders'] = binaryResponseHeaders
+    if body is not None:
+        params['body'] = body
+    if responsePhrase is not None:
+        params['responsePhrase'] = responsePhrase
+    command = Command('Fetch.fulfillRequest', params)
+    return command
+
+
+### Fetch.continueRequest
+def continueRequest(requestId, url=None, method=None, postData=None, headers=None, interceptResponse=None):
+    params = {'requestId': requestId}
+    if url is not None:
+        params['url'] = url
+    if method is not None:
+        params['method'] = method
+    if postData is not None:
+        params['postData'] = postData
+    if headers is not None:
+        params['headers'] = headers
+    if interceptResponse is not None:
+        params['interceptResponse'] = interceptResponse
+    command = Command('Fetch.continueRequest', params)
+    return command
+
+
+### Fetch.continueWithAuth
+def continueWithAuth(requestId, authChallengeResponse):
+    params = {'requestId': requestId, 'authChallengeResponse': authChallengeResponse}
+    command = Command('Fetch.continueWithAuth', params)
+    return command
+
+
+### Fetch.continueResponse
+def continueResponse(requestId, responseCode=None, responsePhrase=None, responseHeaders=None, binaryResponseHeaders=None):
+    params = {'requestId': requestId}
+    if responseCode is not None:
+        params['responseCode'] = responseCode
+    if responsePhrase is not None:
+        params['responsePhrase'] = responsePhrase
+    if responseHeaders is not None:
+        params['responseHeaders'] = responseHeaders
+    if binaryResponseHeaders is not None:
+        params['binaryResponseHeaders'] = binaryResponseHeaders
+    command = Command('Fetch.continueResponse', params)
+    return command
+
+
+### Fetch.getResponseBody
+def getResponseBody(requestId):
+    params = {'requestId': requestId}
+    command = Command('Fetch.getResponseBody', params)
+    return command
+
+
+### Fetch.takeResponseBodyAsStream
+def takeResponseBodyAsStream(requestId):
+    params = {'requestId': requestId}
+    command = Command('Fetch.takeResponseBodyAsStream', params)
+    return command
+
+
+### Fetch.requestPaused
+def requestPaused():
+    notification = Notification('Fetch.requestPaused')
+    return notification
+
+
+def requestPaused_parser(params):
+    return RequestPaused(params)
+
+
+### Fetch.authRequired
+def authRequired():
+    notification = Notification('Fetch.authRequired')
+    return notification
+
+
+def authRequired_parser(params):
+    return AuthRequired(params)
+
+
+class RequestPattern(WIPObject):
+    fields = (
+        ('urlPattern',),
+        ('resourceType',),
+        ('requestStage',),
+    )
+
+
+class HeaderEntry(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class AuthChallenge(WIPObject):
+    fields = (
+        ('source',),
+        ('origin',),
+        ('scheme',),
+        ('realm',),
+    )
+
+
+class AuthChallengeResponse(WIPObject):
+    fields = (
+        ('response',),
+        ('username',),
+        ('password',),
+    )
+
+
+class RequestPaused(LazyView):
+    fields = (
+        ('requestId',),
+        ('request',),
+        ('frameId',),
+        ('resourceType',),
+        ('responseErrorReason',),
+        ('responseStatusCode',),
+        ('responseStatusText',),
+        ('responseHeaders', list_of(HeaderEntry)),
+        ('networkId', RequestId),
+        ('redirectedRequestId',),
+    )
+
+
+class AuthRequired(LazyView):
+    fields = (
+        ('requestId',),
+        ('request',),
+        ('frameId',),
+        ('resourceType',),
+        ('authChallenge', AuthChallenge),
+    )
+
+
+register_parsers('Fetch', globals())
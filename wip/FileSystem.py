@@ -0,0 +1,50 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+
+
+### FileSystem.getDirectory
+def getDirectory(bucketFileSystemLocator):
+    params = {'bucketFileSystemLocator': bucketFileSystemLocator}
+    command = Command('FileSystem.getDirectory', params)
+    return command
+
+
+def getDirectory_parser(result):
+    return GetDirectoryResult(result)
+
+
+class File(WIPObject):
+    fields = (
+        ('name',),
+        ('lastModified',),
+        ('size',),
+        ('type',),
+    )
+
+
+class Directory(WIPObject):
+    fields = (
+        ('name',),
+        ('nestedDirectories',),
+        ('nestedFiles', list_of(File)),
+    )
+
+
+class BucketFileSystemLocator(WIPObject):
+    fields = (
+        ('storageKey',),
+        ('bucketName',),
+        ('pathComponents',),
+    )
+
+
+class GetDirectoryResult(LazyView):
+    fields = (
+        ('directory', Directory),
+    )
+
+
+register_parsers('FileSystem', globals())
@@ -0,0 +1,50 @@
+"""
+HeadlessExperimental domain. This domain provides experimental commands
+only supported in headless mode.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, register_parsers
+
+
+### HeadlessExperimental.beginFrame
+def beginFrame(frameTimeTicks=None, interval=None, noDisplayUpdates=None, screenshot=None):
+    params = {}
+    if frameTimeTicks is not None:
+        params['frameTimeTicks'] = frameTimeTicks
+    if interval is not None:
+        params['interval'] = interval
+    if noDisplayUpdates is not None:
+        params['noDisplayUpdates'] = noDisplayUpdates
+    if screenshot is not None:
+        params['screenshot'] = screenshot
+    command = Command('HeadlessExperimental.beginFrame', params)
+    return command
+
+
+### HeadlessExperimental.disable
+def disable():
+    params = {}
+    command = Command('HeadlessExperimental.disable', params)
+    return command
+
+
+### HeadlessExperimental.enable
+def enable():
+    params = {}
+    command = Command('HeadlessExperimental.enable', params)
+    return command
+
+
+class ScreenshotParams(WIPObject):
+    fields = (
+        ('format',),
+        ('quality',),
+        ('optimizeForSpeed',),
+    )
+
+
+register_parsers('HeadlessExperimental', globals())
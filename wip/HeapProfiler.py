@@ -0,0 +1,219 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Runtime import RemoteObject
+
+
+### HeapProfiler.addInspectedHeapObject
+def addInspectedHeapObject(heapObjectId):
+    params = {'heapObjectId': heapObjectId}
+    command = Command('HeapProfiler.addInspectedHeapObject', params)
+    return command
+
+
+### HeapProfiler.collectGarbage
+def collectGarbage():
+    params = {}
+    command = Command('HeapProfiler.collectGarbage', params)
+    return command
+
+
+### HeapProfiler.disable
+def disable():
+    params = {}
+    command = Command('HeapProfiler.disable', params)
+    return command
+
+
+### HeapProfiler.enable
+def enable():
+    params = {}
+    command = Command('HeapProfiler.enable', params)
+    return command
+
+
+### HeapProfiler.getHeapObjectId
+def getHeapObjectId(objectId):
+    params = {'objectId': objectId}
+    command = Command('HeapProfiler.getHeapObjectId', params)
+    return command
+
+
+### HeapProfiler.getObjectByHeapObjectId
+def getObjectByHeapObjectId(objectId, objectGroup=None):
+    params = {'objectId': objectId}
+    if objectGroup is not None:
+        params['objectGroup'] = objectGroup
+    command = Command('HeapProfiler.getObjectByHeapObjectId', params)
+    return command
+
+
+def getObjectByHeapObjectId_parser(result):
+    return GetObjectByHeapObjectIdResult(result)
+
+
+### HeapProfiler.getSamplingProfile
+def getSamplingProfile():
+    params = {}
+    command = Command('HeapProfiler.getSamplingProfile', params)
+    return command
+
+
+def getSamplingProfile_parser(result):
+    return GetSamplingProfileResult(result)
+
+
+### HeapProfiler.startSampling
+def startSampling(samplingInterval=None, includeObjectsCollectedByMajorGC=None, includeObjectsCollectedByMinorGC=None):
+    params = {}
+    if samplingInterval is not None:
+        params['samplingInterval'] = samplingInterval
+    if includeObjectsCollectedByMajorGC is not None:
+        params['includeObjectsCollectedByMajorGC'] = includeObjectsCollectedByMajorGC
+    if includeObjectsCollectedByMinorGC is not None:
+        params['includeObjectsCollectedByMinorGC'] = includeObjectsCollectedByMinorGC
+    command = Command('HeapProfiler.startSampling', params)
+    return command
+
+
+### HeapProfiler.startTrackingHeapObjects
+def startTrackingHeapObjects(trackAllocations=None):
+    params = {}
+    if trackAllocations is not None:
+        params['trackAllocations'] = trackAllocations
+    command = Command('HeapProfiler.startTrackingHeapObjects', params)
+    return command
+
+
+### HeapProfiler.stopSampling
+def stopSampling():
+    params = {}
+    command = Command('HeapProfiler.stopSampling', params)
+    return command
+
+
+def stopSampling_parser(result):
+    return StopSamplingResult(result)
+
+
+### HeapProfiler.stopTrackingHeapObjects
+def stopTrackingHeapObjects(reportProgress=None, treatGlobalObjectsAsRoots=None, captureNumericValue=None, exposeInternals=None):
+    params = {}
+    if reportProgress is not None:
+        params['reportProgress'] = reportProgress
+    if treatGlobalObjectsAsRoots is not None:
+        params['treatGlobalObjectsAsRoots'] = treatGlobalObjectsAsRoots
+    if captureNumericValue is not None:
+        params['captureNumericValue'] = captureNumericValue
+    if exposeInternals is not None:
+        params['exposeInternals'] = exposeInternals
+    command = Command('HeapProfiler.stopTrackingHeapObjects', params)
+    return command
+
+
+### HeapProfiler.takeHeapSnapshot
+def takeHeapSnapshot(reportProgress=None, treatGlobalObjectsAsRoots=None, captureNumericValue=None, exposeInternals=None):
+    params = {}
+    if reportProgress is not None:
+        params['reportProgress'] = reportProgress
+    if treatGlobalObjectsAsRoots is not None:
+        params['treatGlobalObjectsAsRoots'] = treatGlobalObjectsAsRoots
+    if captureNumericValue is not None:
+        params['captureNumericValue'] = captureNumericValue
+    if exposeInternals is not None:
+        params['exposeInternals'] = exposeInternals
+    command = Command('HeapProfiler.takeHeapSnapshot', params)
+    return command
+
+
+### HeapProfiler.addHeapSnapshotChunk
+def addHeapSnapshotChunk():
+    notification = Notification('HeapProfiler.addHeapSnapshotChunk')
+    return notification
+
+
+def addHeapSnapshotChunk_parser(params):
+    return params
+
+
+### HeapProfiler.heapStatsUpdate
+def heapStatsUpdate():
+    notification = Notification('HeapProfiler.heapStatsUpdate')
+    return notification
+
+
+def heapStatsUpdate_parser(params):
+    return params
+
+
+### HeapProfiler.lastSeenObjectId
+def lastSeenObjectId():
+    notification = Notification('HeapProfiler.lastSeenObjectId')
+    return notification
+
+
+def lastSeenObjectId_parser(params):
+    return params
+
+
+### HeapProfiler.reportHeapSnapshotProgress
+def reportHeapSnapshotProgress():
+    notification = Notification('HeapProfiler.reportHeapSnapshotProgress')
+    return notification
+
+
+def reportHeapSnapshotProgress_parser(params):
+    return params
+
+
+### HeapProfiler.resetProfiles
+def resetProfiles():
+    notification = Notification('HeapProfiler.resetProfiles')
+    return notification
+
+
+class SamplingHeapProfileNode(WIPObject):
+    fields = (
+        ('callFrame',),
+        ('selfSize',),
+        ('id',),
+        ('children', list_of(lambda value: SamplingHeapProfileNode(value))),
+    )
+
+
+class SamplingHeapProfileSample(WIPObject):
+    fields = (
+        ('size',),
+        ('nodeId',),
+        ('ordinal',),
+    )
+
+
+class SamplingHeapProfile(WIPObject):
+    fields = (
+        ('head', SamplingHeapProfileNode),
+        ('samples', list_of(SamplingHeapProfileSample)),
+    )
+
+
+class GetObjectByHeapObjectIdResult(LazyView):
+    fields = (
+        ('result', RemoteObject),
+    )
+
+
+class GetSamplingProfileResult(LazyView):
+    fields = (
+        ('profile', SamplingHeapProfile),
+    )
+
+
+class StopSamplingResult(LazyView):
+    fields = (
+        ('profile', SamplingHeapProfile),
+    )
+
+
+register_parsers('HeapProfiler', globals())
@@ -0,0 +1,37 @@
+"""
+IO domain. Input/Output operations for streams produced by DevTools.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, register_parsers
+
+
+### IO.close
+def close(handle):
+    params = {'handle': handle}
+    command = Command('IO.close', params)
+    return command
+
+
+### IO.read
+def read(handle, offset=None, size=None):
+    params = {'handle': handle}
+    if offset is not None:
+        params['offset'] = offset
+    if size is not None:
+        params['size'] = size
+    command = Command('IO.read', params)
+    return command
+
+
+### IO.resolveBlob
+def resolveBlob(objectId):
+    params = {'objectId': objectId}
+    command = Command('IO.resolveBlob', params)
+    return command
+
+
+register_parsers('IO', globals())
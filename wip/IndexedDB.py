@@ -0,0 +1,198 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+from Runtime import RemoteObject
+
+
+### IndexedDB.clearObjectStore
+def clearObjectStore(databaseName, objectStoreName, securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {'databaseName': databaseName, 'objectStoreName': objectStoreName}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('IndexedDB.clearObjectStore', params)
+    return command
+
+
+### IndexedDB.deleteDatabase
+def deleteDatabase(databaseName, securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {'databaseName': databaseName}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('IndexedDB.deleteDatabase', params)
+    return command
+
+
+### IndexedDB.deleteObjectStoreEntries
+def deleteObjectStoreEntries(databaseName, objectStoreName, keyRange, securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {'databaseName': databaseName, 'objectStoreName': objectStoreName, 'keyRange': keyRange}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('IndexedDB.deleteObjectStoreEntries', params)
+    return command
+
+
+### IndexedDB.disable
+def disable():
+    params = {}
+    command = Command('IndexedDB.disable', params)
+    return command
+
+
+### IndexedDB.enable
+def enable():
+    params = {}
+    command = Command('IndexedDB.enable', params)
+    return command
+
+
+### IndexedDB.requestData
+def requestData(databaseName, objectStoreName, indexName, skipCount, pageSize, securityOrigin=None, storageKey=None, storageBucket=None, keyRange=None):
+    params = {'databaseName': databaseName, 'objectStoreName': objectStoreName, 'indexName': indexName, 'skipCount': skipCount, 'pageSize': pageSize}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    if keyRange is not None:
+        params['keyRange'] = keyRange
+    command = Command('IndexedDB.requestData', params)
+    return command
+
+
+def requestData_parser(result):
+    return RequestDataResult(result)
+
+
+### IndexedDB.getMetadata
+def getMetadata(databaseName, objectStoreName, securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {'databaseName': databaseName, 'objectStoreName': objectStoreName}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('IndexedDB.getMetadata', params)
+    return command
+
+
+### IndexedDB.requestDatabase
+def requestDatabase(databaseName, securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {'databaseName': databaseName}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('IndexedDB.requestDatabase', params)
+    return command
+
+
+def requestDatabase_parser(result):
+    return RequestDatabaseResult(result)
+
+
+### IndexedDB.requestDatabaseNames
+def requestDatabaseNames(securityOrigin=None, storageKey=None, storageBucket=None):
+    params = {}
+    if securityOrigin is not None:
+        params['securityOrigin'] = securityOrigin
+    if storageKey is not None:
+        params['storageKey'] = storageKey
+    if storageBucket is not None:
+        params['storageBucket'] = storageBucket
+    command = Command('IndexedDB.requestDatabaseNames', params)
+    return command
+
+
+class KeyPath(WIPObject):
+    fields = (
+        ('type',),
+        ('string',),
+        ('array',),
+    )
+
+
+class ObjectStoreIndex(WIPObject):
+    fields = (
+        ('name',),
+        ('keyPath', KeyPath),
+        ('unique',),
+        ('multiEntry',),
+    )
+
+
+class ObjectStore(WIPObject):
+    fields = (
+        ('name',),
+        ('keyPath', KeyPath),
+        ('autoIncrement',),
+        ('indexes', list_of(ObjectStoreIndex)),
+    )
+
+
+class DatabaseWithObjectStores(WIPObject):
+    fields = (
+        ('name',),
+        ('version',),
+        ('objectStores', list_of(ObjectStore)),
+    )
+
+
+class Key(WIPObject):
+    fields = (
+        ('type',),
+        ('number',),
+        ('string',),
+        ('date',),
+        ('array', list_of(lambda value: Key(value))),
+    )
+
+
+class KeyRange(WIPObject):
+    fields = (
+        ('lower', Key),
+        ('upper', Key),
+        ('lowerOpen',),
+        ('upperOpen',),
+    )
+
+
+class DataEntry(WIPObject):
+    fields = (
+        ('key', RemoteObject),
+        ('primaryKey', RemoteObject),
+        ('value', RemoteObject),
+    )
+
+
+class RequestDataResult(LazyView):
+    fields = (
+        ('objectStoreDataEntries', list_of(DataEntry)),
+        ('hasMore',),
+    )
+
+
+class RequestDatabaseResult(LazyView):
+    fields = (
+        ('databaseWithObjectStores', DatabaseWithObjectStores),
+    )
+
+
+register_parsers('IndexedDB', globals())
@@ -0,0 +1,252 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Input.dispatchDragEvent
+def dispatchDragEvent(type, x, y, data, modifiers=None):
+    params = {'type': type, 'x': x, 'y': y, 'data': data}
+    if modifiers is not None:
+        params['modifiers'] = modifiers
+    command = Command('Input.dispatchDragEvent', params)
+    return command
+
+
+### Input.dispatchKeyEvent
+def dispatchKeyEvent(type, modifiers=None, timestamp=None, text=None, unmodifiedText=None, keyIdentifier=None, code=None, key=None, windowsVirtualKeyCode=None, nativeVirtualKeyCode=None, autoRepeat=None, isKeypad=None, isSystemKey=None, location=None, commands=None):
+    params = {'type': type}
+    if modifiers is not None:
+        params['modifiers'] = modifiers
+    if timestamp is not None:
+        params['timestamp'] = timestamp
+    if text is not None:
+        params['text'] = text
+    if unmodifiedText is not None:
+        params['unmodifiedText'] = unmodifiedText
+    if keyIdentifier is not None:
+        params['keyIdentifier'] = keyIdentifier
+    if code is not None:
+        params['code'] = code
+    if key is not None:
+        params['key'] = key
+    if windowsVirtualKeyCode is not None:
+        params['windowsVirtualKeyCode'] = windowsVirtualKeyCode
+    if nativeVirtualKeyCode is not None:
+        params['nativeVirtualKeyCode'] = nativeVirtualKeyCode
+    if autoRepeat is not None:
+        params['autoRepeat'] = autoRepeat
+    if isKeypad is not None:
+        params['isKeypad'] = isKeypad
+    if isSystemKey is not None:
+        params['isSystemKey'] = isSystemKey
+    if location is not None:
+        params['location'] = location
+    if commands is not None:
+        params['commands'] = commands
+    command = Command('Input.dispatchKeyEvent', params)
+    return command
+
+
+### Input.insertText
+def insertText(text):
+    params = {'text': text}
+    command = Command('Input.insertText', params)
+    return command
+
+
+### Input.imeSetComposition
+def imeSetComposition(text, selectionStart, selectionEnd, replacementStart=None, replacementEnd=None):
+    params = {'text': text, 'selectionStart': selectionStart, 'selectionEnd': selectionEnd}
+    if replacementStart is not None:
+        params['replacementStart'] = replacementStart
+    if replacementEnd is not None:
+        params['replacementEnd'] = replacementEnd
+    command = Command('Input.imeSetComposition', params)
+    return command
+
+
+### Input.dispatchMouseEvent
+def dispatchMouseEvent(type, x, y, modifiers=None, timestamp=None, button=None, buttons=None, clickCount=None, force=None, tangentialPressure=None, tiltX=None, tiltY=None, twist=None, deltaX=None, deltaY=None, pointerType=None):
+    params = {'type': type, 'x': x, 'y': y}
+    if modifiers is not None:
+        params['modifiers'] = modifiers
+    if timestamp is not None:
+        params['timestamp'] = timestamp
+    if button is not None:
+        params['button'] = button
+    if buttons is not None:
+        params['buttons'] = buttons
+    if clickCount is not None:
+        params['clickCount'] = clickCount
+    if force is not None:
+        params['force'] = force
+    if tangentialPressure is not None:
+        params['tangentialPressure'] = tangentialPressure
+    if tiltX is not None:
+        params['tiltX'] = tiltX
+    if tiltY is not None:
+        params['tiltY'] = tiltY
+    if twist is not None:
+        params['twist'] = twist
+    if deltaX is not None:
+        params['deltaX'] = deltaX
+    if deltaY is not None:
+        params['deltaY'] = deltaY
+    if pointerType is not None:
+        params['pointerType'] = pointerType
+    command = Command('Input.dispatchMouseEvent', params)
+    return command
+
+
+### Input.dispatchTouchEvent
+def dispatchTouchEvent(type, touchPoints, modifiers=None, timestamp=None):
+    params = {'type': type, 'touchPoints': touchPoints}
+    if modifiers is not None:
+        params['modifiers'] = modifiers
+    if timestamp is not None:
+        params['timestamp'] = timestamp
+    command = Command('Input.dispatchTouchEvent', params)
+    return command
+
+
+### Input.cancelDragging
+def cancelDragging():
+    params = {}
+    command = Command('Input.cancelDragging', params)
+    return command
+
+
+### Input.emulateTouchFromMouseEvent
+def emulateTouchFromMouseEvent(type, x, y, button, timestamp=None, deltaX=None, deltaY=None, modifiers=None, clickCount=None):
+    params = {'type': type, 'x': x, 'y': y, 'button': button}
+    if timestamp is not None:
+        params['timestamp'] = timestamp
+    if deltaX is not None:
+        params['deltaX'] = deltaX
+    if deltaY is not None:
+        params['deltaY'] = deltaY
+    if modifiers is not None:
+        params['modifiers'] = modifiers
+    if clickCount is not None:
+        params['clickCount'] = clickCount
+    command = Command('Input.emulateTouchFromMouseEvent', params)
+    return command
+
+
+### Input.setIgnoreInputEvents
+def setIgnoreInputEvents(ignore):
+    params = {'ignore': ignore}
+    command = Command('Input.setIgnoreInputEvents', params)
+    return command
+
+
+### Input.setInterceptDrags
+def setInterceptDrags(enabled):
+    params = {'enabled': enabled}
+    command = Command('Input.setInterceptDrags', params)
+    return command
+
+
+### Input.synthesizePinchGesture
+def synthesizePinchGesture(x, y, scaleFactor, relativeSpeed=None, gestureSourceType=None):
+    params = {'x': x, 'y': y, 'scaleFactor': scaleFactor}
+    if relativeSpeed is not None:
+        params['relativeSpeed'] = relativeSpeed
+    if gestureSourceType is not None:
+        params['gestureSourceType'] = gestureSourceType
+    command = Command('Input.synthesizePinchGesture', params)
+    return command
+
+
+### Input.synthesizeScrollGesture
+def synthesizeScrollGesture(x, y, xDistance=None, yDistance=None, xOverscroll=None, yOverscroll=None, preventFling=None, speed=None, gestureSourceType=None, repeatCount=None, repeatDelayMs=None, interactionMarkerName=None):
+    params = {'x': x, 'y': y}
+    if xDistance is not None:
+        params['xDistance'] = xDistance
+    if yDistance is not None:
+        params['yDistance'] = yDistance
+    if xOverscroll is not None:
+        params['xOverscroll'] = xOverscroll
+    if yOverscroll is not None:
+        params['yOverscroll'] = yOverscroll
+    if preventFling is not None:
+        params['preventFling'] = preventFling
+    if speed is not None:
+        params['speed'] = speed
+    if gestureSourceType is not None:
+        params['gestureSourceType'] = gestureSourceType
+    if repeatCount is not None:
+        params['repeatCount'] = repeatCount
+    if repeatDelayMs is not None:
+        params['repeatDelayMs'] = repeatDelayMs
+    if interactionMarkerName is not None:
+        params['interactionMarkerName'] = interactionMarkerName
+    command = Command('Input.synthesizeScrollGesture', params)
+    return command
+
+
+### Input.synthesizeTapGesture
+def synthesizeTapGesture(x, y, duration=None, tapCount=None, gestureSourceType=None):
+    params = {'x': x, 'y': y}
+    if duration is not None:
+        params['duration'] = duration
+    if tapCount is not None:
+        params['tapCount'] = tapCount
+    if gestureSourceType is not None:
+        params['gestureSourceType'] = gestureSourceType
+    command = Command('Input.synthesizeTapGesture', params)
+    return command
+
+
+### Input.dragIntercepted
+def dragIntercepted():
+    notification = Notification('Input.dragIntercepted')
+    return notification
+
+
+def dragIntercepted_parser(params):
+    return DragIntercepted(params)
+
+
+class TouchPoint(WIPObject):
+    fields = (
+        ('x',),
+        ('y',),
+        ('radiusX',),
+        ('radiusY',),
+        ('rotationAngle',),
+        ('force',),
+        ('tangentialPressure',),
+        ('tiltX',),
+        ('tiltY',),
+        ('twist',),
+        ('id',),
+    )
+
+
+class DragDataItem(WIPObject):
+    fields = (
+        ('mimeType',),
+        ('data',),
+        ('title',),
+        ('baseURL',),
+    )
+
+
+class DragData(WIPObject):
+    fields = (
+        ('items', list_of(DragDataItem)),
+        ('files',),
+        ('dragOperationsMask',),
+    )
+
+
+class DragIntercepted(LazyView):
+    fields = (
+        ('data', DragData),
+    )
+
+
+register_parsers('Input', globals())
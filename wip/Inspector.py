@@ -0,0 +1,44 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, register_parsers
+
+
+### Inspector.disable
+def disable():
+    params = {}
+    command = Command('Inspector.disable', params)
+    return command
+
+
+### Inspector.enable
+def enable():
+    params = {}
+    command = Command('Inspector.enable', params)
+    return command
+
+
+### Inspector.detached
+def detached():
+    notification = Notification('Inspector.detached')
+    return notification
+
+
+def detached_parser(params):
+    return params
+
+
+### Inspector.targetCrashed
+def targetCrashed():
+    notification = Notification('Inspector.targetCrashed')
+    return notification
+
+
+### Inspector.targetReloadedAfterCrash
+def targetReloadedAfterCrash():
+    notification = Notification('Inspector.targetReloadedAfterCrash')
+    return notification
+
+
+register_parsers('Inspector', globals())
@@ -0,0 +1,162 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+import DOM
+
+
+### LayerTree.compositingReasons
+def compositingReasons(layerId):
+    params = {'layerId': layerId}
+    command = Command('LayerTree.compositingReasons', params)
+    return command
+
+
+### LayerTree.disable
+def disable():
+    params = {}
+    command = Command('LayerTree.disable', params)
+    return command
+
+
+### LayerTree.enable
+def enable():
+    params = {}
+    command = Command('LayerTree.enable', params)
+    return command
+
+
+### LayerTree.loadSnapshot
+def loadSnapshot(tiles):
+    params = {'tiles': tiles}
+    command = Command('LayerTree.loadSnapshot', params)
+    return command
+
+
+### LayerTree.makeSnapshot
+def makeSnapshot(layerId):
+    params = {'layerId': layerId}
+    command = Command('LayerTree.makeSnapshot', params)
+    return command
+
+
+### LayerTree.profileSnapshot
+def profileSnapshot(snapshotId, minRepeatCount=None, minDuration=None, clipRect=None):
+    params = {'snapshotId': snapshotId}
+    if minRepeatCount is not None:
+        params['minRepeatCount'] = minRepeatCount
+    if minDuration is not None:
+        params['minDuration'] = minDuration
+    if clipRect is not None:
+        params['clipRect'] = clipRect
+    command = Command('LayerTree.profileSnapshot', params)
+    return command
+
+
+### LayerTree.releaseSnapshot
+def releaseSnapshot(snapshotId):
+    params = {'snapshotId': snapshotId}
+    command = Command('LayerTree.releaseSnapshot', params)
+    return command
+
+
+### LayerTree.replaySnapshot
+def replaySnapshot(snapshotId, fromStep=None, toStep=None, scale=None):
+    params = {'snapshotId': snapshotId}
+    if fromStep is not None:
+        params['fromStep'] = fromStep
+    if toStep is not None:
+        params['toStep'] = toStep
+    if scale is not None:
+        params['scale'] = scale
+    command = Command('LayerTree.replaySnapshot', params)
+    return command
+
+
+### LayerTree.snapshotCommandLog
+def snapshotCommandLog(snapshotId):
+    params = {'snapshotId': snapshotId}
+    command = Command('LayerTree.snapshotCommandLog', params)
+    return command
+
+
+### LayerTree.layerPainted
+def layerPainted():
+    notification = Notification('LayerTree.layerPainted')
+    return notification
+
+
+def layerPainted_parser(params):
+    return LayerPainted(params)
+
+
+### LayerTree.layerTreeDidChange
+def layerTreeDidChange():
+    notification = Notification('LayerTree.layerTreeDidChange')
+    return notification
+
+
+def layerTreeDidChange_parser(params):
+    return LayerTreeDidChange(params)
+
+
+class ScrollRect(WIPObject):
+    fields = (
+        ('rect', lambda value: DOM.Rect(value)),
+        ('type',),
+    )
+
+
+class StickyPositionConstraint(WIPObject):
+    fields = (
+        ('stickyBoxRect', lambda value: DOM.Rect(value)),
+        ('containingBlockRect', lambda value: DOM.Rect(value)),
+        ('nearestLayerShiftingStickyBox',),
+        ('nearestLayerShiftingContainingBlock',),
+    )
+
+
+class PictureTile(WIPObject):
+    fields = (
+        ('x',),
+        ('y',),
+        ('picture',),
+    )
+
+
+class Layer(WIPObject):
+    fields = (
+        ('layerId',),
+        ('parentLayerId',),
+        ('backendNodeId',),
+        ('offsetX',),
+        ('offsetY',),
+        ('width',),
+        ('height',),
+        ('transform',),
+        ('anchorX',),
+        ('anchorY',),
+        ('anchorZ',),
+        ('paintCount',),
+        ('drawsContent',),
+        ('invisible',),
+        ('scrollRects', list_of(ScrollRect)),
+        ('stickyPositionConstraint', StickyPositionConstraint),
+    )
+
+
+class LayerPainted(LazyView):
+    fields = (
+        ('layerId',),
+        ('clip', lambda value: DOM.Rect(value)),
+    )
+
+
+class LayerTreeDidChange(LazyView):
+    fields = (
+        ('layers', list_of(Layer)),
+    )
+
+
+register_parsers('LayerTree', globals())
@@ -0,0 +1,88 @@
+"""
+Log domain. Provides access to log entries.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Network import RequestId
+from Runtime import RemoteObject
+
+
+### Log.clear
+def clear():
+    params = {}
+    command = Command('Log.clear', params)
+    return command
+
+
+### Log.disable
+def disable():
+    params = {}
+    command = Command('Log.disable', params)
+    return command
+
+
+### Log.enable
+def enable():
+    params = {}
+    command = Command('Log.enable', params)
+    return command
+
+
+### Log.startViolationsReport
+def startViolationsReport(config):
+    params = {'config': config}
+    command = Command('Log.startViolationsReport', params)
+    return command
+
+
+### Log.stopViolationsReport
+def stopViolationsReport():
+    params = {}
+    command = Command('Log.stopViolationsReport', params)
+    return command
+
+
+### Log.entryAdded
+def entryAdded():
+    notification = Notification('Log.entryAdded')
+    return notification
+
+
+def entryAdded_parser(params):
+    return EntryAdded(params)
+
+
+class LogEntry(WIPObject):
+    fields = (
+        ('source',),
+        ('level',),
+        ('text',),
+        ('category',),
+        ('timestamp',),
+        ('url',),
+        ('lineNumber',),
+        ('stackTrace',),
+        ('networkRequestId', RequestId),
+        ('workerId',),
+        ('args', list_of(RemoteObject)),
+    )
+
+
+class ViolationSetting(WIPObject):
+    fields = (
+        ('name',),
+        ('threshold',),
+    )
+
+
+class EntryAdded(LazyView):
+    fields = (
+        ('entry', LogEntry),
+    )
+
+
+register_parsers('Log', globals())
@@ -0,0 +1,155 @@
+"""
+Media domain. This domain allows detailed inspection of media elements.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Media.enable
+def enable():
+    params = {}
+    command = Command('Media.enable', params)
+    return command
+
+
+### Media.disable
+def disable():
+    params = {}
+    command = Command('Media.disable', params)
+    return command
+
+
+### Media.playerPropertiesChanged
+def playerPropertiesChanged():
+    notification = Notification('Media.playerPropertiesChanged')
+    return notification
+
+
+def playerPropertiesChanged_parser(params):
+    return PlayerPropertiesChanged(params)
+
+
+### Media.playerEventsAdded
+def playerEventsAdded():
+    notification = Notification('Media.playerEventsAdded')
+    return notification
+
+
+def playerEventsAdded_parser(params):
+    return PlayerEventsAdded(params)
+
+
+### Media.playerMessagesLogged
+def playerMessagesLogged():
+    notification = Notification('Media.playerMessagesLogged')
+    return notification
+
+
+def playerMessagesLogged_parser(params):
+    return PlayerMessagesLogged(params)
+
+
+### Media.playerErrorsRaised
+def playerErrorsRaised():
+    notification = Notification('Media.playerErrorsRaised')
+    return notification
+
+
+def playerErrorsRaised_parser(params):
+    return PlayerErrorsRaised(params)
+
+
+### Media.playerCreated
+def playerCreated():
+    notification = Notification('Media.playerCreated')
+    return notification
+
+
+def playerCreated_parser(params):
+    return PlayerCreated(params)
+
+
+class PlayerMessage(WIPObject):
+    fields = (
+        ('level',),
+        ('message',),
+    )
+
+
+class PlayerProperty(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class PlayerEvent(WIPObject):
+    fields = (
+        ('timestamp',),
+        ('value',),
+    )
+
+
+class PlayerErrorSourceLocation(WIPObject):
+    fields = (
+        ('file',),
+        ('line',),
+    )
+
+
+class PlayerError(WIPObject):
+    fields = (
+        ('errorType',),
+        ('code',),
+        ('stack', list_of(PlayerErrorSourceLocation)),
+        ('cause', list_of(lambda value: PlayerError(value))),
+        ('data',),
+    )
+
+
+class Player(WIPObject):
+    fields = (
+        ('playerId',),
+        ('domNodeId',),
+    )
+
+
+class PlayerPropertiesChanged(LazyView):
+    fields = (
+        ('playerId',),
+        ('properties', list_of(PlayerProperty)),
+    )
+
+
+class PlayerEventsAdded(LazyView):
+    fields = (
+        ('playerId',),
+        ('events', list_of(PlayerEvent)),
+    )
+
+
+class PlayerMessagesLogged(LazyView):
+    fields = (
+        ('playerId',),
+        ('messages', list_of(PlayerMessage)),
+    )
+
+
+class PlayerErrorsRaised(LazyView):
+    fields = (
+        ('playerId',),
+        ('errors', list_of(PlayerError)),
+    )
+
+
+class PlayerCreated(LazyView):
+    fields = (
+        ('player', Player),
+    )
+
+
+register_parsers('Media', globals())
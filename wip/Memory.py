@@ -0,0 +1,160 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+
+
+### Memory.getDOMCounters
+def getDOMCounters():
+    params = {}
+    command = Command('Memory.getDOMCounters', params)
+    return command
+
+
+### Memory.getDOMCountersForLeakDetection
+def getDOMCountersForLeakDetection():
+    params = {}
+    command = Command('Memory.getDOMCountersForLeakDetection', params)
+    return command
+
+
+def getDOMCountersForLeakDetection_parser(result):
+    return GetDOMCountersForLeakDetectionResult(result)
+
+
+### Memory.prepareForLeakDetection
+def prepareForLeakDetection():
+    params = {}
+    command = Command('Memory.prepareForLeakDetection', params)
+    return command
+
+
+### Memory.forciblyPurgeJavaScriptMemory
+def forciblyPurgeJavaScriptMemory():
+    params = {}
+    command = Command('Memory.forciblyPurgeJavaScriptMemory', params)
+    return command
+
+
+### Memory.setPressureNotificationsSuppressed
+def setPressureNotificationsSuppressed(suppressed):
+    params = {'suppressed': suppressed}
+    command = Command('Memory.setPressureNotificationsSuppressed', params)
+    return command
+
+
+### Memory.simulatePressureNotification
+def simulatePressureNotification(level):
+    params = {'level': level}
+    command = Command('Memory.simulatePressureNotification', params)
+    return command
+
+
+### Memory.startSampling
+def startSampling(samplingInterval=None, suppressRandomness=None):
+    params = {}
+    if samplingInterval is not None:
+        params['samplingInterval'] = samplingInterval
+    if suppressRandomness is not None:
+        params['suppressRandomness'] = suppressRandomness
+    command = Command('Memory.startSampling', params)
+    return command
+
+
+### Memory.stopSampling
+def stopSampling():
+    params = {}
+    command = Command('Memory.stopSampling', params)
+    return command
+
+
+### Memory.getAllTimeSamplingProfile
+def getAllTimeSamplingProfile():
+    params = {}
+    command = Command('Memory.getAllTimeSamplingProfile', params)
+    return command
+
+
+def getAllTimeSamplingProfile_parser(result):
+    return GetAllTimeSamplingProfileResult(result)
+
+
+### Memory.getBrowserSamplingProfile
+def getBrowserSamplingProfile():
+    params = {}
+    command = Command('Memory.getBrowserSamplingProfile', params)
+    return command
+
+
+def getBrowserSamplingProfile_parser(result):
+    return GetBrowserSamplingProfileResult(result)
+
+
+### Memory.getSamplingProfile
+def getSamplingProfile():
+    params = {}
+    command = Command('Memory.getSamplingProfile', params)
+    return command
+
+
+def getSamplingProfile_parser(result):
+    return GetSamplingProfileResult(result)
+
+
+class SamplingProfileNode(WIPObject):
+    fields = (
+        ('size',),
+        ('total',),
+        ('stack',),
+    )
+
+
+class Module(WIPObject):
+    fields = (
+        ('name',),
+        ('uuid',),
+        ('baseAddress',),
+        ('size',),
+    )
+
+
+class SamplingProfile(WIPObject):
+    fields = (
+        ('samples', list_of(SamplingProfileNode)),
+        ('modules', list_of(Module)),
+    )
+
+
+class DOMCounter(WIPObject):
+    fields = (
+        ('name',),
+        ('count',),
+    )
+
+
+class GetDOMCountersForLeakDetectionResult(LazyView):
+    fields = (
+        ('counters', list_of(DOMCounter)),
+    )
+
+
+class GetAllTimeSamplingProfileResult(LazyView):
+    fields = (
+        ('profile', SamplingProfile),
+    )
+
+
+class GetBrowserSamplingProfileResult(LazyView):
+    fields = (
+        ('profile', SamplingProfile),
+    )
+
+
+class GetSamplingProfileResult(LazyView):
+    fields = (
+        ('profile', SamplingProfile),
+    )
+
+
+register_parsers('Memory', globals())
@@ -1,4 +1,4 @@
-from utils import WIPObject, Command
+from utils import WIPObject, Command, register_parsers
 
 
 def clearBrowserCache():
@@ -17,6 +17,8 @@ def setCacheDisabled(value):
 
 
 class RequestId(WIPObject):
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -25,3 +27,6 @@ class RequestId(WIPObject):
 
     def __repr__(self):
         return self.value
+
+
+register_parsers('Network', globals())
@@ -0,0 +1,461 @@
+"""
+Overlay domain. This domain provides various functionality related to
+drawing atop the inspected page.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, register_parsers
+import DOM
+
+
+### Overlay.disable
+def disable():
+    params = {}
+    command = Command('Overlay.disable', params)
+    return command
+
+
+### Overlay.enable
+def enable():
+    params = {}
+    command = Command('Overlay.enable', params)
+    return command
+
+
+### Overlay.getHighlightObjectForTest
+def getHighlightObjectForTest(nodeId, includeDistance=None, includeStyle=None, colorFormat=None, showAccessibilityInfo=None):
+    params = {'nodeId': nodeId}
+    if includeDistance is not None:
+        params['includeDistance'] = includeDistance
+    if includeStyle is not None:
+        params['includeStyle'] = includeStyle
+    if colorFormat is not None:
+        params['colorFormat'] = colorFormat
+    if showAccessibilityInfo is not None:
+        params['showAccessibilityInfo'] = showAccessibilityInfo
+    command = Command('Overlay.getHighlightObjectForTest', params)
+    return command
+
+
+### Overlay.getGridHighlightObjectsForTest
+def getGridHighlightObjectsForTest(nodeIds):
+    params = {'nodeIds': nodeIds}
+    command = Command('Overlay.getGridHighlightObjectsForTest', params)
+    return command
+
+
+### Overlay.getSourceOrderHighlightObjectForTest
+def getSourceOrderHighlightObjectForTest(nodeId):
+    params = {'nodeId': nodeId}
+    command = Command('Overlay.getSourceOrderHighlightObjectForTest', params)
+    return command
+
+
+### Overlay.hideHighlight
+def hideHighlight():
+    params = {}
+    command = Command('Overlay.hideHighlight', params)
+    return command
+
+
+### Overlay.highlightFrame
+def highlightFrame(frameId, contentColor=None, contentOutlineColor=None):
+    params = {'frameId': frameId}
+    if contentColor is not None:
+        params['contentColor'] = contentColor
+    if contentOutlineColor is not None:
+        params['contentOutlineColor'] = contentOutlineColor
+    command = Command('Overlay.highlightFrame', params)
+    return command
+
+
+### Overlay.highlightNode
+def highlightNode(highlightConfig, nodeId=None, backendNodeId=None, objectId=None, selector=None):
+    params = {'highlightConfig': highlightConfig}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    if selector is not None:
+        params['selector'] = selector
+    command = Command('Overlay.highlightNode', params)
+    return command
+
+
+### Overlay.highlightQuad
+def highlightQuad(quad, color=None, outlineColor=None):
+    params = {'quad': quad}
+    if color is not None:
+        params['color'] = color
+    if outlineColor is not None:
+        params['outlineColor'] = outlineColor
+    command = Command('Overlay.highlightQuad', params)
+    return command
+
+
+### Overlay.highlightRect
+def highlightRect(x, y, width, height, color=None, outlineColor=None):
+    params = {'x': x, 'y': y, 'width': width, 'height': height}
+    if color is not None:
+        params['color'] = color
+    if outlineColor is not None:
+        params['outlineColor'] = outlineColor
+    command = Command('Overlay.highlightRect', params)
+    return command
+
+
+### Overlay.highlightSourceOrder
+def highlightSourceOrder(sourceOrderConfig, nodeId=None, backendNodeId=None, objectId=None):
+    params = {'sourceOrderConfig': sourceOrderConfig}
+    if nodeId is not None:
+        params['nodeId'] = nodeId
+    if backendNodeId is not None:
+        params['backendNodeId'] = backendNodeId
+    if objectId is not None:
+        params['objectId'] = objectId
+    command = Command('Overlay.highlightSourceOrder', params)
+    return command
+
+
+### Overlay.setInspectMode
+def setInspectMode(mode, highlightConfig=None):
+    params = {'mode': mode}
+    if highlightConfig is not None:
+        params['highlightConfig'] = highlightConfig
+    command = Command('Overlay.setInspectMode', params)
+    return command
+
+
+### Overlay.setShowAdHighlights
+def setShowAdHighlights(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowAdHighlights', params)
+    return command
+
+
+### Overlay.setPausedInDebuggerMessage
+def setPausedInDebuggerMessage(message=None):
+    params = {}
+    if message is not None:
+        params['message'] = message
+    command = Command('Overlay.setPausedInDebuggerMessage', params)
+    return command
+
+
+### Overlay.setShowDebugBorders
+def setShowDebugBorders(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowDebugBorders', params)
+    return command
+
+
+### Overlay.setShowFPSCounter
+def setShowFPSCounter(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowFPSCounter', params)
+    return command
+
+
+### Overlay.setShowGridOverlays
+def setShowGridOverlays(gridNodeHighlightConfigs):
+    params = {'gridNodeHighlightConfigs': gridNodeHighlightConfigs}
+    command = Command('Overlay.setShowGridOverlays', params)
+    return command
+
+
+### Overlay.setShowFlexOverlays
+def setShowFlexOverlays(flexNodeHighlightConfigs):
+    params = {'flexNodeHighlightConfigs': flexNodeHighlightConfigs}
+    command = Command('Overlay.setShowFlexOverlays', params)
+    return command
+
+
+### Overlay.setShowScrollSnapOverlays
+def setShowScrollSnapOverlays(scrollSnapHighlightConfigs):
+    params = {'scrollSnapHighlightConfigs': scrollSnapHighlightConfigs}
+    command = Command('Overlay.setShowScrollSnapOverlays', params)
+    return command
+
+
+### Overlay.setShowContainerQueryOverlays
+def setShowContainerQueryOverlays(containerQueryHighlightConfigs):
+    params = {'containerQueryHighlightConfigs': containerQueryHighlightConfigs}
+    command = Command('Overlay.setShowContainerQueryOverlays', params)
+    return command
+
+
+### Overlay.setShowPaintRects
+def setShowPaintRects(result):
+    params = {'result': result}
+    command = Command('Overlay.setShowPaintRects', params)
+    return command
+
+
+### Overlay.setShowLayoutShiftRegions
+def setShowLayoutShiftRegions(result):
+    params = {'result': result}
+    command = Command('Overlay.setShowLayoutShiftRegions', params)
+    return command
+
+
+### Overlay.setShowScrollBottleneckRects
+def setShowScrollBottleneckRects(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowScrollBottleneckRects', params)
+    return command
+
+
+### Overlay.setShowHitTestBorders
+def setShowHitTestBorders(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowHitTestBorders', params)
+    return command
+
+
+### Overlay.setShowWebVitals
+def setShowWebVitals(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowWebVitals', params)
+    return command
+
+
+### Overlay.setShowViewportSizeOnResize
+def setShowViewportSizeOnResize(show):
+    params = {'show': show}
+    command = Command('Overlay.setShowViewportSizeOnResize', params)
+    return command
+
+
+### Overlay.setShowHinge
+def setShowHinge(hingeConfig=None):
+    params = {}
+    if hingeConfig is not None:
+        params['hingeConfig'] = hingeConfig
+    command = Command('Overlay.setShowHinge', params)
+    return command
+
+
+### Overlay.setShowIsolatedElements
+def setShowIsolatedElements(isolatedElementHighlightConfigs):
+    params = {'isolatedElementHighlightConfigs': isolatedElementHighlightConfigs}
+    command = Command('Overlay.setShowIsolatedElements', params)
+    return command
+
+
+### Overlay.setShowWindowControlsOverlay
+def setShowWindowControlsOverlay(windowControlsOverlayConfig=None):
+    params = {}
+    if windowControlsOverlayConfig is not None:
+        params['windowControlsOverlayConfig'] = windowControlsOverlayConfig
+    command = Command('Overlay.setShowWindowControlsOverlay', params)
+    return command
+
+
+### Overlay.inspectNodeRequested
+def inspectNodeRequested():
+    notification = Notification('Overlay.inspectNodeRequested')
+    return notification
+
+
+def inspectNodeRequested_parser(params):
+    return params
+
+
+### Overlay.nodeHighlightRequested
+def nodeHighlightRequested():
+    notification = Notification('Overlay.nodeHighlightRequested')
+    return notification
+
+
+def nodeHighlightRequested_parser(params):
+    return params
+
+
+### Overlay.screenshotRequested
+def screenshotRequested():
+    notification = Notification('Overlay.screenshotRequested')
+    return notification
+
+
+def screenshotRequested_parser(params):
+    return params
+
+
+### Overlay.inspectModeCanceled
+def inspectModeCanceled():
+    notification = Notification('Overlay.inspectModeCanceled')
+    return notification
+
+
+class SourceOrderConfig(WIPObject):
+    fields = (
+        ('parentOutlineColor', lambda value: DOM.RGBA(value)),
+        ('childOutlineColor', lambda value: DOM.RGBA(value)),
+    )
+
+
+class GridHighlightConfig(WIPObject):
+    fields = (
+        ('showGridExtensionLines',),
+        ('showPositiveLineNumbers',),
+        ('showNegativeLineNumbers',),
+        ('showAreaNames',),
+        ('showLineNames',),
+        ('showTrackSizes',),
+        ('gridBorderColor', lambda value: DOM.RGBA(value)),
+        ('cellBorderColor', lambda value: DOM.RGBA(value)),
+        ('rowLineColor', lambda value: DOM.RGBA(value)),
+        ('columnLineColor', lambda value: DOM.RGBA(value)),
+        ('gridBorderDash',),
+        ('cellBorderDash',),
+        ('rowLineDash',),
+        ('columnLineDash',),
+        ('rowGapColor', lambda value: DOM.RGBA(value)),
+        ('rowHatchColor', lambda value: DOM.RGBA(value)),
+        ('columnGapColor', lambda value: DOM.RGBA(value)),
+        ('columnHatchColor', lambda value: DOM.RGBA(value)),
+        ('areaBorderColor', lambda value: DOM.RGBA(value)),
+        ('gridBackgroundColor', lambda value: DOM.RGBA(value)),
+    )
+
+
+class LineStyle(WIPObject):
+    fields = (
+        ('color', lambda value: DOM.RGBA(value)),
+        ('pattern',),
+    )
+
+
+class BoxStyle(WIPObject):
+    fields = (
+        ('fillColor', lambda value: DOM.RGBA(value)),
+        ('hatchColor', lambda value: DOM.RGBA(value)),
+    )
+
+
+class FlexContainerHighlightConfig(WIPObject):
+    fields = (
+        ('containerBorder', LineStyle),
+        ('lineSeparator', LineStyle),
+        ('itemSeparator', LineStyle),
+        ('mainDistributedSpace', BoxStyle),
+        ('crossDistributedSpace', BoxStyle),
+        ('rowGapSpace', BoxStyle),
+        ('columnGapSpace', BoxStyle),
+        ('crossAlignment', LineStyle),
+    )
+
+
+class FlexItemHighlightConfig(WIPObject):
+    fields = (
+        ('baseSizeBox', BoxStyle),
+        ('baseSizeBorder', LineStyle),
+        ('flexibilityArrow', LineStyle),
+    )
+
+
+class ContainerQueryContainerHighlightConfig(WIPObject):
+    fields = (
+        ('containerBorder', LineStyle),
+        ('descendantBorder', LineStyle),
+    )
+
+
+class HighlightConfig(WIPObject):
+    fields = (
+        ('showInfo',),
+        ('showStyles',),
+        ('showRulers',),
+        ('showAccessibilityInfo',),
+        ('showExtensionLines',),
+        ('contentColor', lambda value: DOM.RGBA(value)),
+        ('paddingColor', lambda value: DOM.RGBA(value)),
+        ('borderColor', lambda value: DOM.RGBA(value)),
+        ('marginColor', lambda value: DOM.RGBA(value)),
+        ('eventTargetColor', lambda value: DOM.RGBA(value)),
+        ('shapeColor', lambda value: DOM.RGBA(value)),
+        ('shapeMarginColor', lambda value: DOM.RGBA(value)),
+        ('cssGridColor', lambda value: DOM.RGBA(value)),
+        ('colorFormat',),
+        ('gridHighlightConfig', GridHighlightConfig),
+        ('flexContainerHighlightConfig', FlexContainerHighlightConfig),
+        ('flexItemHighlightConfig', FlexItemHighlightConfig),
+        ('contrastAlgorithm',),
+        ('containerQueryContainerHighlightConfig', ContainerQueryContainerHighlightConfig),
+    )
+
+
+class GridNodeHighlightConfig(WIPObject):
+    fields = (
+        ('gridHighlightConfig', GridHighlightConfig),
+        ('nodeId',),
+    )
+
+
+class FlexNodeHighlightConfig(WIPObject):
+    fields = (
+        ('flexContainerHighlightConfig', FlexContainerHighlightConfig),
+        ('nodeId',),
+    )
+
+
+class ScrollSnapContainerHighlightConfig(WIPObject):
+    fields = (
+        ('snapportBorder', LineStyle),
+        ('snapAreaBorder', LineStyle),
+        ('scrollMarginColor', lambda value: DOM.RGBA(value)),
+        ('scrollPaddingColor', lambda value: DOM.RGBA(value)),
+    )
+
+
+class ScrollSnapHighlightConfig(WIPObject):
+    fields = (
+        ('scrollSnapContainerHighlightConfig', ScrollSnapContainerHighlightConfig),
+        ('nodeId',),
+    )
+
+
+class HingeConfig(WIPObject):
+    fields = (
+        ('rect', lambda value: DOM.Rect(value)),
+        ('contentColor', lambda value: DOM.RGBA(value)),
+        ('outlineColor', lambda value: DOM.RGBA(value)),
+    )
+
+
+class WindowControlsOverlayConfig(WIPObject):
+    fields = (
+        ('showCSS',),
+        ('selectedPlatform',),
+        ('themeColor',),
+    )
+
+
+class ContainerQueryHighlightConfig(WIPObject):
+    fields = (
+        ('containerQueryContainerHighlightConfig', ContainerQueryContainerHighlightConfig),
+        ('nodeId',),
+    )
+
+
+class IsolationModeHighlightConfig(WIPObject):
+    fields = (
+        ('resizerColor', lambda value: DOM.RGBA(value)),
+        ('resizerHandleColor', lambda value: DOM.RGBA(value)),
+        ('maskColor', lambda value: DOM.RGBA(value)),
+    )
+
+
+class IsolatedElementHighlightConfig(WIPObject):
+    fields = (
+        ('isolationModeHighlightConfig', IsolationModeHighlightConfig),
+        ('nodeId',),
+    )
+
+
+register_parsers('Overlay', globals())
@@ -0,0 +1,96 @@
+"""
+PWA domain. This domain allows interacting with the browser to control
+PWAs.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+
+
+### PWA.getOsAppState
+def getOsAppState(manifestId):
+    params = {'manifestId': manifestId}
+    command = Command('PWA.getOsAppState', params)
+    return command
+
+
+def getOsAppState_parser(result):
+    return GetOsAppStateResult(result)
+
+
+### PWA.install
+def install(manifestId, installUrlOrBundleUrl=None):
+    params = {'manifestId': manifestId}
+    if installUrlOrBundleUrl is not None:
+        params['installUrlOrBundleUrl'] = installUrlOrBundleUrl
+    command = Command('PWA.install', params)
+    return command
+
+
+### PWA.uninstall
+def uninstall(manifestId):
+    params = {'manifestId': manifestId}
+    command = Command('PWA.uninstall', params)
+    return command
+
+
+### PWA.launch
+def launch(manifestId, url=None):
+    params = {'manifestId': manifestId}
+    if url is not None:
+        params['url'] = url
+    command = Command('PWA.launch', params)
+    return command
+
+
+### PWA.launchFilesInApp
+def launchFilesInApp(manifestId, files):
+    params = {'manifestId': manifestId, 'files': files}
+    command = Command('PWA.launchFilesInApp', params)
+    return command
+
+
+### PWA.openCurrentPageInApp
+def openCurrentPageInApp(manifestId):
+    params = {'manifestId': manifestId}
+    command = Command('PWA.openCurrentPageInApp', params)
+    return command
+
+
+### PWA.changeAppUserSettings
+def changeAppUserSettings(manifestId, linkCapturing=None, displayMode=None):
+    params = {'manifestId': manifestId}
+    if linkCapturing is not None:
+        params['linkCapturing'] = linkCapturing
+    if displayMode is not None:
+        params['displayMode'] = displayMode
+    command = Command('PWA.changeAppUserSettings', params)
+    return command
+
+
+class FileHandlerAccept(WIPObject):
+    fields = (
+        ('mediaType',),
+        ('fileExtensions',),
+    )
+
+
+class FileHandler(WIPObject):
+    fields = (
+        ('action',),
+        ('accepts', list_of(FileHandlerAccept)),
+        ('displayName',),
+    )
+
+
+class GetOsAppStateResult(LazyView):
+    fields = (
+        ('badgeCount',),
+        ('fileHandlers', list_of(FileHandler)),
+    )
+
+
+register_parsers('PWA', globals())
@@ -1,4 +1,4 @@
-from utils import Command, Notification
+from utils import Command, Notification, register_parsers
 
 
 def reload():
@@ -9,3 +9,5 @@ def reloaded():
     notification = Notification('Page.loadEventFired')
     return notification
 
+
+register_parsers('Page', globals())
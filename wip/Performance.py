@@ -0,0 +1,72 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Performance.disable
+def disable():
+    params = {}
+    command = Command('Performance.disable', params)
+    return command
+
+
+### Performance.enable
+def enable(timeDomain=None):
+    params = {}
+    if timeDomain is not None:
+        params['timeDomain'] = timeDomain
+    command = Command('Performance.enable', params)
+    return command
+
+
+### Performance.setTimeDomain
+def setTimeDomain(timeDomain):
+    params = {'timeDomain': timeDomain}
+    command = Command('Performance.setTimeDomain', params)
+    return command
+
+
+### Performance.getMetrics
+def getMetrics():
+    params = {}
+    command = Command('Performance.getMetrics', params)
+    return command
+
+
+def getMetrics_parser(result):
+    return GetMetricsResult(result)
+
+
+### Performance.metrics
+def metrics():
+    notification = Notification('Performance.metrics')
+    return notification
+
+
+def metrics_parser(params):
+    return Metrics(params)
+
+
+class Metric(WIPObject):
+    fields = (
+        ('name',),
+        ('value',),
+    )
+
+
+class GetMetricsResult(LazyView):
+    fields = (
+        ('metrics', list_of(Metric)),
+    )
+
+
+class Metrics(LazyView):
+    fields = (
+        ('metrics', list_of(Metric)),
+        ('title',),
+    )
+
+
+register_parsers('Performance', globals())
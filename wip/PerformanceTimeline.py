@@ -0,0 +1,78 @@
+"""
+PerformanceTimeline domain. Reporting of performance timeline events, as
+specified in https://w3c.github.io/performance-timeline/#dom-
+performanceobserver.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+import DOM
+
+
+### PerformanceTimeline.enable
+def enable(eventTypes):
+    params = {'eventTypes': eventTypes}
+    command = Command('PerformanceTimeline.enable', params)
+    return command
+
+
+### PerformanceTimeline.timelineEventAdded
+def timelineEventAdded():
+    notification = Notification('PerformanceTimeline.timelineEventAdded')
+    return notification
+
+
+def timelineEventAdded_parser(params):
+    return TimelineEventAdded(params)
+
+
+class LargestContentfulPaint(WIPObject):
+    fields = (
+        ('renderTime',),
+        ('loadTime',),
+        ('size',),
+        ('elementId',),
+        ('url',),
+        ('nodeId',),
+    )
+
+
+class LayoutShiftAttribution(WIPObject):
+    fields = (
+        ('previousRect', lambda value: DOM.Rect(value)),
+        ('currentRect', lambda value: DOM.Rect(value)),
+        ('nodeId',),
+    )
+
+
+class LayoutShift(WIPObject):
+    fields = (
+        ('value',),
+        ('hadRecentInput',),
+        ('lastInputTime',),
+        ('sources', list_of(LayoutShiftAttribution)),
+    )
+
+
+class TimelineEvent(WIPObject):
+    fields = (
+        ('frameId',),
+        ('type',),
+        ('name',),
+        ('time',),
+        ('duration',),
+        ('lcpDetails', LargestContentfulPaint),
+        ('layoutShiftDetails', LayoutShift),
+    )
+
+
+class TimelineEventAdded(LazyView):
+    fields = (
+        ('event', TimelineEvent),
+    )
+
+
+register_parsers('PerformanceTimeline', globals())
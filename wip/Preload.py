@@ -0,0 +1,157 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Network import RequestId
+
+
+### Preload.enable
+def enable():
+    params = {}
+    command = Command('Preload.enable', params)
+    return command
+
+
+### Preload.disable
+def disable():
+    params = {}
+    command = Command('Preload.disable', params)
+    return command
+
+
+### Preload.ruleSetUpdated
+def ruleSetUpdated():
+    notification = Notification('Preload.ruleSetUpdated')
+    return notification
+
+
+def ruleSetUpdated_parser(params):
+    return RuleSetUpdated(params)
+
+
+### Preload.ruleSetRemoved
+def ruleSetRemoved():
+    notification = Notification('Preload.ruleSetRemoved')
+    return notification
+
+
+def ruleSetRemoved_parser(params):
+    return params
+
+
+### Preload.preloadEnabledStateUpdated
+def preloadEnabledStateUpdated():
+    notification = Notification('Preload.preloadEnabledStateUpdated')
+    return notification
+
+
+def preloadEnabledStateUpdated_parser(params):
+    return params
+
+
+### Preload.prefetchStatusUpdated
+def prefetchStatusUpdated():
+    notification = Notification('Preload.prefetchStatusUpdated')
+    return notification
+
+
+def prefetchStatusUpdated_parser(params):
+    return PrefetchStatusUpdated(params)
+
+
+### Preload.prerenderStatusUpdated
+def prerenderStatusUpdated():
+    notification = Notification('Preload.prerenderStatusUpdated')
+    return notification
+
+
+def prerenderStatusUpdated_parser(params):
+    return PrerenderStatusUpdated(params)
+
+
+### Preload.preloadingAttemptSourcesUpdated
+def preloadingAttemptSourcesUpdated():
+    notification = Notification('Preload.preloadingAttemptSourcesUpdated')
+    return notification
+
+
+def preloadingAttemptSourcesUpdated_parser(params):
+    return PreloadingAttemptSourcesUpdated(params)
+
+
+class RuleSet(WIPObject):
+    fields = (
+        ('id',),
+        ('loaderId',),
+        ('sourceText',),
+        ('backendNodeId',),
+        ('url',),
+        ('requestId', RequestId),
+        ('errorType',),
+        ('errorMessage',),
+    )
+
+
+class PreloadingAttemptKey(WIPObject):
+    fields = (
+        ('loaderId',),
+        ('action',),
+        ('url',),
+        ('targetHint',),
+    )
+
+
+class PreloadingAttemptSource(WIPObject):
+    fields = (
+        ('key', PreloadingAttemptKey),
+        ('ruleSetIds',),
+        ('nodeIds',),
+    )
+
+
+class PrerenderMismatchedHeaders(WIPObject):
+    fields = (
+        ('headerName',),
+        ('initialValue',),
+        ('activationValue',),
+    )
+
+
+class RuleSetUpdated(LazyView):
+    fields = (
+        ('ruleSet', RuleSet),
+    )
+
+
+class PrefetchStatusUpdated(LazyView):
+    fields = (
+        ('key', PreloadingAttemptKey),
+        ('pipelineId',),
+        ('initiatingFrameId',),
+        ('prefetchUrl',),
+        ('status',),
+        ('prefetchStatus',),
+        ('requestId', RequestId),
+    )
+
+
+class PrerenderStatusUpdated(LazyView):
+    fields = (
+        ('key', PreloadingAttemptKey),
+        ('pipelineId',),
+        ('status',),
+        ('prerenderStatus',),
+        ('disallowedMojoInterface',),
+        ('mismatchedHeaders', list_of(PrerenderMismatchedHeaders)),
+    )
+
+
+class PreloadingAttemptSourcesUpdated(LazyView):
+    fields = (
+        ('loaderId',),
+        ('preloadingAttemptSources', list_of(PreloadingAttemptSource)),
+    )
+
+
+register_parsers('Preload', globals())
@@ -0,0 +1,216 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Debugger import Location
+
+
+### Profiler.disable
+def disable():
+    params = {}
+    command = Command('Profiler.disable', params)
+    return command
+
+
+### Profiler.enable
+def enable():
+    params = {}
+    command = Command('Profiler.enable', params)
+    return command
+
+
+### Profiler.getBestEffortCoverage
+def getBestEffortCoverage():
+    params = {}
+    command = Command('Profiler.getBestEffortCoverage', params)
+    return command
+
+
+def getBestEffortCoverage_parser(result):
+    return GetBestEffortCoverageResult(result)
+
+
+### Profiler.setSamplingInterval
+def setSamplingInterval(interval):
+    params = {'interval': interval}
+    command = Command('Profiler.setSamplingInterval', params)
+    return command
+
+
+### Profiler.start
+def start():
+    params = {}
+    command = Command('Profiler.start', params)
+    return command
+
+
+### Profiler.startPreciseCoverage
+def startPreciseCoverage(callCount=None, detailed=None, allowTriggeredUpdates=None):
+    params = {}
+    if callCount is not None:
+        params['callCount'] = callCount
+    if detailed is not None:
+        params['detailed'] = detailed
+    if allowTriggeredUpdates is not None:
+        params['allowTriggeredUpdates'] = allowTriggeredUpdates
+    command = Command('Profiler.startPreciseCoverage', params)
+    return command
+
+
+### Profiler.stop
+def stop():
+    params = {}
+    command = Command('Profiler.stop', params)
+    return command
+
+
+def stop_parser(result):
+    return StopResult(result)
+
+
+### Profiler.stopPreciseCoverage
+def stopPreciseCoverage():
+    params = {}
+    command = Command('Profiler.stopPreciseCoverage', params)
+    return command
+
+
+### Profiler.takePreciseCoverage
+def takePreciseCoverage():
+    params = {}
+    command = Command('Profiler.takePreciseCoverage', params)
+    return command
+
+
+def takePreciseCoverage_parser(result):
+    return TakePreciseCoverageResult(result)
+
+
+### Profiler.consoleProfileFinished
+def consoleProfileFinished():
+    notification = Notification('Profiler.consoleProfileFinished')
+    return notification
+
+
+def consoleProfileFinished_parser(params):
+    return ConsoleProfileFinished(params)
+
+
+### Profiler.consoleProfileStarted
+def consoleProfileStarted():
+    notification = Notification('Profiler.consoleProfileStarted')
+    return notification
+
+
+def consoleProfileStarted_parser(params):
+    return ConsoleProfileStarted(params)
+
+
+### Profiler.preciseCoverageDeltaUpdate
+def preciseCoverageDeltaUpdate():
+    notification = Notification('Profiler.preciseCoverageDeltaUpdate')
+    return notification
+
+
+def preciseCoverageDeltaUpdate_parser(params):
+    return PreciseCoverageDeltaUpdate(params)
+
+
+class PositionTickInfo(WIPObject):
+    fields = (
+        ('line',),
+        ('ticks',),
+    )
+
+
+class ProfileNode(WIPObject):
+    fields = (
+        ('id',),
+        ('callFrame',),
+        ('hitCount',),
+        ('children',),
+        ('deoptReason',),
+        ('positionTicks', list_of(PositionTickInfo)),
+    )
+
+
+class Profile(WIPObject):
+    fields = (
+        ('nodes', list_of(ProfileNode)),
+        ('startTime',),
+        ('endTime',),
+        ('samples',),
+        ('timeDeltas',),
+    )
+
+
+class CoverageRange(WIPObject):
+    fields = (
+        ('startOffset',),
+        ('endOffset',),
+        ('count',),
+    )
+
+
+class FunctionCoverage(WIPObject):
+    fields = (
+        ('functionName',),
+        ('ranges', list_of(CoverageRange)),
+        ('isBlockCoverage',),
+    )
+
+
+class ScriptCoverage(WIPObject):
+    fields = (
+        ('scriptId',),
+        ('url',),
+        ('functions', list_of(FunctionCoverage)),
+    )
+
+
+class GetBestEffortCoverageResult(LazyView):
+    fields = (
+        ('result', list_of(ScriptCoverage)),
+    )
+
+
+class StopResult(LazyView):
+    fields = (
+        ('profile', Profile),
+    )
+
+
+class TakePreciseCoverageResult(LazyView):
+    fields = (
+        ('result', list_of(ScriptCoverage)),
+        ('timestamp',),
+    )
+
+
+class ConsoleProfileFinished(LazyView):
+    fields = (
+        ('id',),
+        ('location', Location),
+        ('profile', Profile),
+        ('title',),
+    )
+
+
+class ConsoleProfileStarted(LazyView):
+    fields = (
+        ('id',),
+        ('location', Location),
+        ('title',),
+    )
+
+
+class PreciseCoverageDeltaUpdate(LazyView):
+    fields = (
+        ('timestamp',),
+        ('occasion',),
+        ('result', list_of(ScriptCoverage)),
+    )
+
+
+register_parsers('Profiler', globals())
@@ -1,5 +1,5 @@
 import json
-from utils import WIPObject, Command
+from utils import WIPObject, Command, register_parsers
 
 
 def evaluate(expression, objectGroup=None, returnByValue=None):
@@ -34,14 +34,37 @@ def getProperties_parser(result):
     return data
 
 
-class RemoteObject(WIPObject):
+class RemoteObjectId(WIPObject):
+    __slots__ = ('value',)
+
     def __init__(self, value):
-        self.set(value, 'className')
-        self.set(value, 'description')
-        self.set_class(value, 'objectId', RemoteObjectId)
-        self.set(value, 'subtype')
-        self.set(value, 'type')
-        self.set(value, 'value')
+        self.value = value
+
+    def __str__(self):
+        return self.value
+
+    def __call__(self):
+        return self.value
+
+    def dumps(self):
+        objid = json.loads(self.value)
+        return "Object_%d_%d" % (objid['injectedScriptId'], objid['id'])
+
+    def loads(self, text):
+        parts = text.split('_')
+        self.value = '{"injectedScriptId":%s,"id":%s}' % (parts[1], parts[2])
+        return self.value
+
+
+class RemoteObject(WIPObject):
+    fields = (
+        ('className',),
+        ('description',),
+        ('objectId', RemoteObjectId),
+        ('subtype',),
+        ('type',),
+        ('value',),
+    )
 
     def __str__(self):
         if self.type == 'boolean':
@@ -66,35 +89,19 @@ class RemoteObject(WIPObject):
 
 
 class PropertyDescriptor(WIPObject):
-    def __init__(self, _value):
-        self.set(_value, 'configurable')
-        self.set(_value, 'enumerable')
-        #self.set_class(_value, 'get', RemoteObject)
-        #self.set_class(_value, 'set', RemoteObject)
-        self.set(_value, 'name')
-        self.set_class(_value, 'value', RemoteObject)
-        self.set(_value, 'wasThrown')
-        self.set(_value, 'writable')
+    fields = (
+        ('configurable',),
+        ('enumerable',),
+        #('get', RemoteObject),
+        #('set', RemoteObject),
+        ('name',),
+        ('value', RemoteObject),
+        ('wasThrown',),
+        ('writable',),
+    )
 
     def __str__(self):
         return self.name
 
 
-class RemoteObjectId(WIPObject):
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return self.value
-
-    def __call__(self):
-        return self.value
-
-    def dumps(self):
-        objid = json.loads(self.value)
-        return "Object_%d_%d" % (objid['injectedScriptId'], objid['id'])
-
-    def loads(self, text):
-        parts = text.split('_')
-        self.value = '{"injectedScriptId":%s,"id":%s}' % (parts[1], parts[2])
-        return self.value
+register_parsers('Runtime', globals())
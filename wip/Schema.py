@@ -0,0 +1,36 @@
+"""
+Schema domain. This domain is deprecated.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+
+
+### Schema.getDomains
+def getDomains():
+    params = {}
+    command = Command('Schema.getDomains', params)
+    return command
+
+
+def getDomains_parser(result):
+    return GetDomainsResult(result)
+
+
+class Domain(WIPObject):
+    fields = (
+        ('name',),
+        ('version',),
+    )
+
+
+class GetDomainsResult(LazyView):
+    fields = (
+        ('domains', list_of(Domain)),
+    )
+
+
+register_parsers('Schema', globals())
@@ -0,0 +1,152 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Security.disable
+def disable():
+    params = {}
+    command = Command('Security.disable', params)
+    return command
+
+
+### Security.enable
+def enable():
+    params = {}
+    command = Command('Security.enable', params)
+    return command
+
+
+### Security.setIgnoreCertificateErrors
+def setIgnoreCertificateErrors(ignore):
+    params = {'ignore': ignore}
+    command = Command('Security.setIgnoreCertificateErrors', params)
+    return command
+
+
+### Security.handleCertificateError
+def handleCertificateError(eventId, action):
+    params = {'eventId': eventId, 'action': action}
+    command = Command('Security.handleCertificateError', params)
+    return command
+
+
+### Security.setOverrideCertificateErrors
+def setOverrideCertificateErrors(override):
+    params = {'override': override}
+    command = Command('Security.setOverrideCertificateErrors', params)
+    return command
+
+
+### Security.certificateError
+def certificateError():
+    notification = Notification('Security.certificateError')
+    return notification
+
+
+def certificateError_parser(params):
+    return params
+
+
+### Security.visibleSecurityStateChanged
+def visibleSecurityStateChanged():
+    notification = Notification('Security.visibleSecurityStateChanged')
+    return notification
+
+
+def visibleSecurityStateChanged_parser(params):
+    return VisibleSecurityStateChanged(params)
+
+
+### Security.securityStateChanged
+def securityStateChanged():
+    notification = Notification('Security.securityStateChanged')
+    return notification
+
+
+def securityStateChanged_parser(params):
+    return SecurityStateChanged(params)
+
+
+class CertificateSecurityState(WIPObject):
+    fields = (
+        ('protocol',),
+        ('keyExchange',),
+        ('keyExchangeGroup',),
+        ('cipher',),
+        ('mac',),
+        ('certificate',),
+        ('subjectName',),
+        ('issuer',),
+        ('validFrom',),
+        ('validTo',),
+        ('certificateNetworkError',),
+        ('certificateHasWeakSignature',),
+        ('certificateHasSha1Signature',),
+        ('modernSSL',),
+        ('obsoleteSslProtocol',),
+        ('obsoleteSslKeyExchange',),
+        ('obsoleteSslCipher',),
+        ('obsoleteSslSignature',),
+    )
+
+
+class SafetyTipInfo(WIPObject):
+    fields = (
+        ('safetyTipStatus',),
+        ('safeUrl',),
+    )
+
+
+class VisibleSecurityState(WIPObject):
+    fields = (
+        ('securityState',),
+        ('certificateSecurityState', CertificateSecurityState),
+        ('safetyTipInfo', SafetyTipInfo),
+        ('securityStateIssueIds',),
+    )
+
+
+class SecurityStateExplanation(WIPObject):
+    fields = (
+        ('securityState',),
+        ('title',),
+        ('summary',),
+        ('description',),
+        ('mixedContentType',),
+        ('certificate',),
+        ('recommendations',),
+    )
+
+
+class InsecureContentStatus(WIPObject):
+    fields = (
+        ('ranMixedContent',),
+        ('displayedMixedContent',),
+        ('containedMixedForm',),
+        ('ranContentWithCertErrors',),
+        ('displayedContentWithCertErrors',),
+        ('ranInsecureContentStyle',),
+        ('displayedInsecureContentStyle',),
+    )
+
+
+class VisibleSecurityStateChanged(LazyView):
+    fields = (
+        ('visibleSecurityState', VisibleSecurityState),
+    )
+
+
+class SecurityStateChanged(LazyView):
+    fields = (
+        ('securityState',),
+        ('schemeIsCryptographic',),
+        ('explanations', list_of(SecurityStateExplanation)),
+        ('insecureContentStatus', InsecureContentStatus),
+        ('summary',),
+    )
+
+
+register_parsers('Security', globals())
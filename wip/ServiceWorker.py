@@ -0,0 +1,174 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### ServiceWorker.deliverPushMessage
+def deliverPushMessage(origin, registrationId, data):
+    params = {'origin': origin, 'registrationId': registrationId, 'data': data}
+    command = Command('ServiceWorker.deliverPushMessage', params)
+    return command
+
+
+### ServiceWorker.disable
+def disable():
+    params = {}
+    command = Command('ServiceWorker.disable', params)
+    return command
+
+
+### ServiceWorker.dispatchSyncEvent
+def dispatchSyncEvent(origin, registrationId, tag, lastChance):
+    params = {'origin': origin, 'registrationId': registrationId, 'tag': tag, 'lastChance': lastChance}
+    command = Command('ServiceWorker.dispatchSyncEvent', params)
+    return command
+
+
+### ServiceWorker.dispatchPeriodicSyncEvent
+def dispatchPeriodicSyncEvent(origin, registrationId, tag):
+    params = {'origin': origin, 'registrationId': registrationId, 'tag': tag}
+    command = Command('ServiceWorker.dispatchPeriodicSyncEvent', params)
+    return command
+
+
+### ServiceWorker.enable
+def enable():
+    params = {}
+    command = Command('ServiceWorker.enable', params)
+    return command
+
+
+### ServiceWorker.setForceUpdateOnPageLoad
+def setForceUpdateOnPageLoad(forceUpdateOnPageLoad):
+    params = {'forceUpdateOnPageLoad': forceUpdateOnPageLoad}
+    command = Command('ServiceWorker.setForceUpdateOnPageLoad', params)
+    return command
+
+
+### ServiceWorker.skipWaiting
+def skipWaiting(scopeURL):
+    params = {'scopeURL': scopeURL}
+    command = Command('ServiceWorker.skipWaiting', params)
+    return command
+
+
+### ServiceWorker.startWorker
+def startWorker(scopeURL):
+    params = {'scopeURL': scopeURL}
+    command = Command('ServiceWorker.startWorker', params)
+    return command
+
+
+### ServiceWorker.stopAllWorkers
+def stopAllWorkers():
+    params = {}
+    command = Command('ServiceWorker.stopAllWorkers', params)
+    return command
+
+
+### ServiceWorker.stopWorker
+def stopWorker(versionId):
+    params = {'versionId': versionId}
+    command = Command('ServiceWorker.stopWorker', params)
+    return command
+
+
+### ServiceWorker.unregister
+def unregister(scopeURL):
+    params = {'scopeURL': scopeURL}
+    command = Command('ServiceWorker.unregister', params)
+    return command
+
+
+### ServiceWorker.updateRegistration
+def updateRegistration(scopeURL):
+    params = {'scopeURL': scopeURL}
+    command = Command('ServiceWorker.updateRegistration', params)
+    return command
+
+
+### ServiceWorker.workerErrorReported
+def workerErrorReported():
+    notification = Notification('ServiceWorker.workerErrorReported')
+    return notification
+
+
+def workerErrorReported_parser(params):
+    return WorkerErrorReported(params)
+
+
+### ServiceWorker.workerRegistrationUpdated
+def workerRegistrationUpdated():
+    notification = Notification('ServiceWorker.workerRegistrationUpdated')
+    return notification
+
+
+def workerRegistrationUpdated_parser(params):
+    return WorkerRegistrationUpdated(params)
+
+
+### ServiceWorker.workerVersionUpdated
+def workerVersionUpdated():
+    notification = Notification('ServiceWorker.workerVersionUpdated')
+    return notification
+
+
+def workerVersionUpdated_parser(params):
+    return WorkerVersionUpdated(params)
+
+
+class ServiceWorkerRegistration(WIPObject):
+    fields = (
+        ('registrationId',),
+        ('scopeURL',),
+        ('isDeleted',),
+    )
+
+
+class ServiceWorkerVersion(WIPObject):
+    fields = (
+        ('versionId',),
+        ('registrationId',),
+        ('scriptURL',),
+        ('runningStatus',),
+        ('status',),
+        ('scriptLastModified',),
+        ('scriptResponseTime',),
+        ('controlledClients',),
+        ('targetId',),
+        ('routerRules',),
+    )
+
+
+class ServiceWorkerErrorMessage(WIPObject):
+    fields = (
+        ('errorMessage',),
+        ('registrationId',),
+        ('versionId',),
+        ('sourceURL',),
+        ('lineNumber',),
+        ('columnNumber',),
+    )
+
+
+class WorkerErrorReported(LazyView):
+    fields = (
+        ('errorMessage', ServiceWorkerErrorMessage),
+    )
+
+
+class WorkerRegistrationUpdated(LazyView):
+    fields = (
+        ('registrations', list_of(ServiceWorkerRegistration)),
+    )
+
+
+class WorkerVersionUpdated(LazyView):
+    fields = (
+        ('versions', list_of(ServiceWorkerVersion)),
+    )
+
+
+register_parsers('ServiceWorker', globals())
@@ -0,0 +1,782 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+from Network import RequestId
+
+
+### Storage.getStorageKeyForFrame
+def getStorageKeyForFrame(frameId):
+    params = {'frameId': frameId}
+    command = Command('Storage.getStorageKeyForFrame', params)
+    return command
+
+
+### Storage.clearDataForOrigin
+def clearDataForOrigin(origin, storageTypes):
+    params = {'origin': origin, 'storageTypes': storageTypes}
+    command = Command('Storage.clearDataForOrigin', params)
+    return command
+
+
+### Storage.clearDataForStorageKey
+def clearDataForStorageKey(storageKey, storageTypes):
+    params = {'storageKey': storageKey, 'storageTypes': storageTypes}
+    command = Command('Storage.clearDataForStorageKey', params)
+    return command
+
+
+### Storage.getCookies
+def getCookies(browserContextId=None):
+    params = {}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Storage.getCookies', params)
+    return command
+
+
+### Storage.setCookies
+def setCookies(cookies, browserContextId=None):
+    params = {'cookies': cookies}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Storage.setCookies', params)
+    return command
+
+
+### Storage.clearCookies
+def clearCookies(browserContextId=None):
+    params = {}
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    command = Command('Storage.clearCookies', params)
+    return command
+
+
+### Storage.getUsageAndQuota
+def getUsageAndQuota(origin):
+    params = {'origin': origin}
+    command = Command('Storage.getUsageAndQuota', params)
+    return command
+
+
+def getUsageAndQuota_parser(result):
+    return GetUsageAndQuotaResult(result)
+
+
+### Storage.overrideQuotaForOrigin
+def overrideQuotaForOrigin(origin, quotaSize=None):
+    params = {'origin': origin}
+    if quotaSize is not None:
+        params['quotaSize'] = quotaSize
+    command = Command('Storage.overrideQuotaForOrigin', params)
+    return command
+
+
+### Storage.trackCacheStorageForOrigin
+def trackCacheStorageForOrigin(origin):
+    params = {'origin': origin}
+    command = Command('Storage.trackCacheStorageForOrigin', params)
+    return command
+
+
+### Storage.trackCacheStorageForStorageKey
+def trackCacheStorageForStorageKey(storageKey):
+    params = {'storageKey': storageKey}
+    command = Command('Storage.trackCacheStorageForStorageKey', params)
+    return command
+
+
+### Storage.trackIndexedDBForOrigin
+def trackIndexedDBForOrigin(origin):
+    params = {'origin': origin}
+    command = Command('Storage.trackIndexedDBForOrigin', params)
+    return command
+
+
+### Storage.trackIndexedDBForStorageKey
+def trackIndexedDBForStorageKey(storageKey):
+    params = {'storageKey': storageKey}
+    command = Command('Storage.trackIndexedDBForStorageKey', params)
+    return command
+
+
+### Storage.untrackCacheStorageForOrigin
+def untrackCacheStorageForOrigin(origin):
+    params = {'origin': origin}
+    command = Command('Storage.untrackCacheStorageForOrigin', params)
+    return command
+
+
+### Storage.untrackCacheStorageForStorageKey
+def untrackCacheStorageForStorageKey(storageKey):
+    params = {'storageKey': storageKey}
+    command = Command('Storage.untrackCacheStorageForStorageKey', params)
+    return command
+
+
+### Storage.untrackIndexedDBForOrigin
+def untrackIndexedDBForOrigin(origin):
+    params = {'origin': origin}
+    command = Command('Storage.untrackIndexedDBForOrigin', params)
+    return command
+
+
+### Storage.untrackIndexedDBForStorageKey
+def untrackIndexedDBForStorageKey(storageKey):
+    params = {'storageKey': storageKey}
+    command = Command('Storage.untrackIndexedDBForStorageKey', params)
+    return command
+
+
+### Storage.getTrustTokens
+def getTrustTokens():
+    params = {}
+    command = Command('Storage.getTrustTokens', params)
+    return command
+
+
+def getTrustTokens_parser(result):
+    return GetTrustTokensResult(result)
+
+
+### Storage.clearTrustTokens
+def clearTrustTokens(issuerOrigin):
+    params = {'issuerOrigin': issuerOrigin}
+    command = Command('Storage.clearTrustTokens', params)
+    return command
+
+
+### Storage.getInterestGroupDetails
+def getInterestGroupDetails(ownerOrigin, name):
+    params = {'ownerOrigin': ownerOrigin, 'name': name}
+    command = Command('Storage.getInterestGroupDetails', params)
+    return command
+
+
+### Storage.setInterestGroupTracking
+def setInterestGroupTracking(enable):
+    params = {'enable': enable}
+    command = Command('Storage.setInterestGroupTracking', params)
+    return command
+
+
+### Storage.setInterestGroupAuctionTracking
+def setInterestGroupAuctionTracking(enable):
+    params = {'enable': enable}
+    command = Command('Storage.setInterestGroupAuctionTracking', params)
+    return command
+
+
+### Storage.getSharedStorageMetadata
+def getSharedStorageMetadata(ownerOrigin):
+    params = {'ownerOrigin': ownerOrigin}
+    command = Command('Storage.getSharedStorageMetadata', params)
+    return command
+
+
+def getSharedStorageMetadata_parser(result):
+    return GetSharedStorageMetadataResult(result)
+
+
+### Storage.getSharedStorageEntries
+def getSharedStorageEntries(ownerOrigin):
+    params = {'ownerOrigin': ownerOrigin}
+    command = Command('Storage.getSharedStorageEntries', params)
+    return command
+
+
+def getSharedStorageEntries_parser(result):
+    return GetSharedStorageEntriesResult(result)
+
+
+### Storage.setSharedStorageEntry
+def setSharedStorageEntry(ownerOrigin, key, value, ignoreIfPresent=None):
+    params = {'ownerOrigin': ownerOrigin, 'key': key, 'value': value}
+    if ignoreIfPresent is not None:
+        params['ignoreIfPresent'] = ignoreIfPresent
+    command = Command('Storage.setSharedStorageEntry', params)
+    return command
+
+
+### Storage.deleteSharedStorageEntry
+def deleteSharedStorageEntry(ownerOrigin, key):
+    params = {'ownerOrigin': ownerOrigin, 'key': key}
+    command = Command('Storage.deleteSharedStorageEntry', params)
+    return command
+
+
+### Storage.clearSharedStorageEntries
+def clearSharedStorageEntries(ownerOrigin):
+    params = {'ownerOrigin': ownerOrigin}
+    command = Command('Storage.clearSharedStorageEntries', params)
+    return command
+
+
+### Storage.resetSharedStorageBudget
+def resetSharedStorageBudget(ownerOrigin):
+    params = {'ownerOrigin': ownerOrigin}
+    command = Command('Storage.resetSharedStorageBudget', params)
+    return command
+
+
+### Storage.setSharedStorageTracking
+def setSharedStorageTracking(enable):
+    params = {'enable': enable}
+    command = Command('Storage.setSharedStorageTracking', params)
+    return command
+
+
+### Storage.setStorageBucketTracking
+def setStorageBucketTracking(storageKey, enable):
+    params = {'storageKey': storageKey, 'enable': enable}
+    command = Command('Storage.setStorageBucketTracking', params)
+    return command
+
+
+### Storage.deleteStorageBucket
+def deleteStorageBucket(bucket):
+    params = {'bucket': bucket}
+    command = Command('Storage.deleteStorageBucket', params)
+    return command
+
+
+### Storage.runBounceTrackingMitigations
+def runBounceTrackingMitigations():
+    params = {}
+    command = Command('Storage.runBounceTrackingMitigations', params)
+    return command
+
+
+### Storage.setAttributionReportingLocalTestingMode
+def setAttributionReportingLocalTestingMode(enabled):
+    params = {'enabled': enabled}
+    command = Command('Storage.setAttributionReportingLocalTestingMode', params)
+    return command
+
+
+### Storage.setAttributionReportingTracking
+def setAttributionReportingTracking(enable):
+    params = {'enable': enable}
+    command = Command('Storage.setAttributionReportingTracking', params)
+    return command
+
+
+### Storage.sendPendingAttributionReports
+def sendPendingAttributionReports():
+    params = {}
+    command = Command('Storage.sendPendingAttributionReports', params)
+    return command
+
+
+### Storage.getRelatedWebsiteSets
+def getRelatedWebsiteSets():
+    params = {}
+    command = Command('Storage.getRelatedWebsiteSets', params)
+    return command
+
+
+def getRelatedWebsiteSets_parser(result):
+    return GetRelatedWebsiteSetsResult(result)
+
+
+### Storage.getAffectedUrlsForThirdPartyCookieMetadata
+def getAffectedUrlsForThirdPartyCookieMetadata(firstPartyUrl, thirdPartyUrls):
+    params = {'firstPartyUrl': firstPartyUrl, 'thirdPartyUrls': thirdPartyUrls}
+    command = Command('Storage.getAffectedUrlsForThirdPartyCookieMetadata', params)
+    return command
+
+
+### Storage.setProtectedAudienceKAnonymity
+def setProtectedAudienceKAnonymity(owner, name, hashes):
+    params = {'owner': owner, 'name': name, 'hashes': hashes}
+    command = Command('Storage.setProtectedAudienceKAnonymity', params)
+    return command
+
+
+### Storage.cacheStorageContentUpdated
+def cacheStorageContentUpdated():
+    notification = Notification('Storage.cacheStorageContentUpdated')
+    return notification
+
+
+def cacheStorageContentUpdated_parser(params):
+    return params
+
+
+### Storage.cacheStorageListUpdated
+def cacheStorageListUpdated():
+    notification = Notification('Storage.cacheStorageListUpdated')
+    return notification
+
+
+def cacheStorageListUpdated_parser(params):
+    return params
+
+
+### Storage.indexedDBContentUpdated
+def indexedDBContentUpdated():
+    notification = Notification('Storage.indexedDBContentUpdated')
+    return notification
+
+
+def indexedDBContentUpdated_parser(params):
+    return params
+
+
+### Storage.indexedDBListUpdated
+def indexedDBListUpdated():
+    notification = Notification('Storage.indexedDBListUpdated')
+    return notification
+
+
+def indexedDBListUpdated_parser(params):
+    return params
+
+
+### Storage.interestGroupAccessed
+def interestGroupAccessed():
+    notification = Notification('Storage.interestGroupAccessed')
+    return notification
+
+
+def interestGroupAccessed_parser(params):
+    return params
+
+
+### Storage.interestGroupAuctionEventOccurred
+def interestGroupAuctionEventOccurred():
+    notification = Notification('Storage.interestGroupAuctionEventOccurred')
+    return notification
+
+
+def interestGroupAuctionEventOccurred_parser(params):
+    return params
+
+
+### Storage.interestGroupAuctionNetworkRequestCreated
+def interestGroupAuctionNetworkRequestCreated():
+    notification = Notification('Storage.interestGroupAuctionNetworkRequestCreated')
+    return notification
+
+
+def interestGroupAuctionNetworkRequestCreated_parser(params):
+    return InterestGroupAuctionNetworkRequestCreated(params)
+
+
+### Storage.sharedStorageAccessed
+def sharedStorageAccessed():
+    notification = Notification('Storage.sharedStorageAccessed')
+    return notification
+
+
+def sharedStorageAccessed_parser(params):
+    return SharedStorageAccessed(params)
+
+
+### Storage.sharedStorageWorkletOperationExecutionFinished
+def sharedStorageWorkletOperationExecutionFinished():
+    notification = Notification('Storage.sharedStorageWorkletOperationExecutionFinished')
+    return notification
+
+
+def sharedStorageWorkletOperationExecutionFinished_parser(params):
+    return params
+
+
+### Storage.storageBucketCreatedOrUpdated
+def storageBucketCreatedOrUpdated():
+    notification = Notification('Storage.storageBucketCreatedOrUpdated')
+    return notification
+
+
+def storageBucketCreatedOrUpdated_parser(params):
+    return StorageBucketCreatedOrUpdated(params)
+
+
+### Storage.storageBucketDeleted
+def storageBucketDeleted():
+    notification = Notification('Storage.storageBucketDeleted')
+    return notification
+
+
+def storageBucketDeleted_parser(params):
+    return params
+
+
+### Storage.attributionReportingSourceRegistered
+def attributionReportingSourceRegistered():
+    notification = Notification('Storage.attributionReportingSourceRegistered')
+    return notification
+
+
+def attributionReportingSourceRegistered_parser(params):
+    return AttributionReportingSourceRegistered(params)
+
+
+### Storage.attributionReportingTriggerRegistered
+def attributionReportingTriggerRegistered():
+    notification = Notification('Storage.attributionReportingTriggerRegistered')
+    return notification
+
+
+def attributionReportingTriggerRegistered_parser(params):
+    return AttributionReportingTriggerRegistered(params)
+
+
+### Storage.attributionReportingReportSent
+def attributionReportingReportSent():
+    notification = Notification('Storage.attributionReportingReportSent')
+    return notification
+
+
+def attributionReportingReportSent_parser(params):
+    return params
+
+
+### Storage.attributionReportingVerboseDebugReportSent
+def attributionReportingVerboseDebugReportSent():
+    notification = Notification('Storage.attributionReportingVerboseDebugReportSent')
+    return notification
+
+
+def attributionReportingVerboseDebugReportSent_parser(params):
+    return params
+
+
+class UsageForType(WIPObject):
+    fields = (
+        ('storageType',),
+        ('usage',),
+    )
+
+
+class TrustTokens(WIPObject):
+    fields = (
+        ('issuerOrigin',),
+        ('count',),
+    )
+
+
+class SharedStorageEntry(WIPObject):
+    fields = (
+        ('key',),
+        ('value',),
+    )
+
+
+class SharedStorageMetadata(WIPObject):
+    fields = (
+        ('creationTime',),
+        ('length',),
+        ('remainingBudget',),
+        ('bytesUsed',),
+    )
+
+
+class SharedStoragePrivateAggregationConfig(WIPObject):
+    fields = (
+        ('aggregationCoordinatorOrigin',),
+        ('contextId',),
+        ('filteringIdMaxBytes',),
+        ('maxContributions',),
+    )
+
+
+class SharedStorageReportingMetadata(WIPObject):
+    fields = (
+        ('eventType',),
+        ('reportingUrl',),
+    )
+
+
+class SharedStorageUrlWithMetadata(WIPObject):
+    fields = (
+        ('url',),
+        ('reportingMetadata', list_of(SharedStorageReportingMetadata)),
+    )
+
+
+class SharedStorageAccessParams(WIPObject):
+    fields = (
+        ('scriptSourceUrl',),
+        ('dataOrigin',),
+        ('operationName',),
+        ('operationId',),
+        ('keepAlive',),
+        ('privateAggregationConfig', SharedStoragePrivateAggregationConfig),
+        ('serializedData',),
+        ('urlsWithMetadata', list_of(SharedStorageUrlWithMetadata)),
+        ('urnUuid',),
+        ('key',),
+        ('value',),
+        ('ignoreIfPresent',),
+        ('workletOrdinal',),
+        ('workletTargetId',),
+        ('withLock',),
+        ('batchUpdateId',),
+        ('batchSize',),
+    )
+
+
+class StorageBucket(WIPObject):
+    fields = (
+        ('storageKey',),
+        ('name',),
+    )
+
+
+class StorageBucketInfo(WIPObject):
+    fields = (
+        ('bucket', StorageBucket),
+        ('id',),
+        ('expiration',),
+        ('quota',),
+        ('persistent',),
+        ('durability',),
+    )
+
+
+class AttributionReportingFilterDataEntry(WIPObject):
+    fields = (
+        ('key',),
+        ('values',),
+    )
+
+
+class AttributionReportingFilterConfig(WIPObject):
+    fields = (
+        ('filterValues', list_of(AttributionReportingFilterDataEntry)),
+        ('lookbackWindow',),
+    )
+
+
+class AttributionReportingFilterPair(WIPObject):
+    fields = (
+        ('filters', list_of(AttributionReportingFilterConfig)),
+        ('notFilters', list_of(AttributionReportingFilterConfig)),
+    )
+
+
+class AttributionReportingAggregationKeysEntry(WIPObject):
+    fields = (
+        ('key',),
+        ('value',),
+    )
+
+
+class AttributionReportingEventReportWindows(WIPObject):
+    fields = (
+        ('start',),
+        ('ends',),
+    )
+
+
+class AttributionReportingAggregatableDebugReportingData(WIPObject):
+    fields = (
+        ('keyPiece',),
+        ('value',),
+        ('types',),
+    )
+
+
+class AttributionReportingAggregatableDebugReportingConfig(WIPObject):
+    fields = (
+        ('budget',),
+        ('keyPiece',),
+        ('debugData', list_of(AttributionReportingAggregatableDebugReportingData)),
+        ('aggregationCoordinatorOrigin',),
+    )
+
+
+class AttributionScopesData(WIPObject):
+    fields = (
+        ('values',),
+        ('limit',),
+        ('maxEventStates',),
+    )
+
+
+class AttributionReportingNamedBudgetDef(WIPObject):
+    fields = (
+        ('name',),
+        ('budget',),
+    )
+
+
+class AttributionReportingSourceRegistration(WIPObject):
+    fields = (
+        ('time',),
+        ('expiry',),
+        ('triggerData',),
+        ('eventReportWindows', AttributionReportingEventReportWindows),
+        ('aggregatableReportWindow',),
+        ('type',),
+        ('sourceOrigin',),
+        ('reportingOrigin',),
+        ('destinationSites',),
+        ('eventId',),
+        ('priority',),
+        ('filterData', list_of(AttributionReportingFilterDataEntry)),
+        ('aggregationKeys', list_of(AttributionReportingAggregationKeysEntry)),
+        ('debugKey',),
+        ('triggerDataMatching',),
+        ('destinationLimitPriority',),
+        ('aggregatableDebugReportingConfig', AttributionReportingAggregatableDebugReportingConfig),
+        ('scopesData', AttributionScopesData),
+        ('maxEventLevelReports',),
+        ('namedBudgets', list_of(AttributionReportingNamedBudgetDef)),
+        ('debugReporting',),
+        ('eventLevelEpsilon',),
+    )
+
+
+class AttributionReportingAggregatableValueDictEntry(WIPObject):
+    fields = (
+        ('key',),
+        ('value',),
+        ('filteringId',),
+    )
+
+
+class AttributionReportingAggregatableValueEntry(WIPObject):
+    fields = (
+        ('values', list_of(AttributionReportingAggregatableValueDictEntry)),
+        ('filters', AttributionReportingFilterPair),
+    )
+
+
+class AttributionReportingEventTriggerData(WIPObject):
+    fields = (
+        ('data',),
+        ('priority',),
+        ('dedupKey',),
+        ('filters', AttributionReportingFilterPair),
+    )
+
+
+class AttributionReportingAggregatableTriggerData(WIPObject):
+    fields = (
+        ('keyPiece',),
+        ('sourceKeys',),
+        ('filters', AttributionReportingFilterPair),
+    )
+
+
+class AttributionReportingAggregatableDedupKey(WIPObject):
+    fields = (
+        ('dedupKey',),
+        ('filters', AttributionReportingFilterPair),
+    )
+
+
+class AttributionReportingNamedBudgetCandidate(WIPObject):
+    fields = (
+        ('name',),
+        ('filters', AttributionReportingFilterPair),
+    )
+
+
+class AttributionReportingTriggerRegistration(WIPObject):
+    fields = (
+        ('filters', AttributionReportingFilterPair),
+        ('debugKey',),
+        ('aggregatableDedupKeys', list_of(AttributionReportingAggregatableDedupKey)),
+        ('eventTriggerData', list_of(AttributionReportingEventTriggerData)),
+        ('aggregatableTriggerData', list_of(AttributionReportingAggregatableTriggerData)),
+        ('aggregatableValues', list_of(AttributionReportingAggregatableValueEntry)),
+        ('aggregatableFilteringIdMaxBytes',),
+        ('debugReporting',),
+        ('aggregationCoordinatorOrigin',),
+        ('sourceRegistrationTimeConfig',),
+        ('triggerContextId',),
+        ('aggregatableDebugReportingConfig', AttributionReportingAggregatableDebugReportingConfig),
+        ('scopes',),
+        ('namedBudgets', list_of(AttributionReportingNamedBudgetCandidate)),
+    )
+
+
+class RelatedWebsiteSet(WIPObject):
+    fields = (
+        ('primarySites',),
+        ('associatedSites',),
+        ('serviceSites',),
+    )
+
+
+class GetUsageAndQuotaResult(LazyView):
+    fields = (
+        ('usage',),
+        ('quota',),
+        ('overrideActive',),
+        ('usageBreakdown', list_of(UsageForType)),
+    )
+
+
+class GetTrustTokensResult(LazyView):
+    fields = (
+        ('tokens', list_of(TrustTokens)),
+    )
+
+
+class GetSharedStorageMetadataResult(LazyView):
+    fields = (
+        ('metadata', SharedStorageMetadata),
+    )
+
+
+class GetSharedStorageEntriesResult(LazyView):
+    fields = (
+        ('entries', list_of(SharedStorageEntry)),
+    )
+
+
+class GetRelatedWebsiteSetsResult(LazyView):
+    fields = (
+        ('sets', list_of(RelatedWebsiteSet)),
+    )
+
+
+class InterestGroupAuctionNetworkRequestCreated(LazyView):
+    fields = (
+        ('type',),
+        ('requestId', RequestId),
+        ('auctions',),
+    )
+
+
+class SharedStorageAccessed(LazyView):
+    fields = (
+        ('accessTime',),
+        ('scope',),
+        ('method',),
+        ('mainFrameId',),
+        ('ownerOrigin',),
+        ('ownerSite',),
+        ('params', SharedStorageAccessParams),
+    )
+
+
+class StorageBucketCreatedOrUpdated(LazyView):
+    fields = (
+        ('bucketInfo', StorageBucketInfo),
+    )
+
+
+class AttributionReportingSourceRegistered(LazyView):
+    fields = (
+        ('registration', AttributionReportingSourceRegistration),
+        ('result',),
+    )
+
+
+class AttributionReportingTriggerRegistered(LazyView):
+    fields = (
+        ('registration', AttributionReportingTriggerRegistration),
+        ('eventLevel',),
+        ('aggregatable',),
+    )
+
+
+register_parsers('Storage', globals())
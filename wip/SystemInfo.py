@@ -0,0 +1,123 @@
+"""
+SystemInfo domain. The SystemInfo domain defines methods and events for
+querying low-level system information.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, WIPObject, LazyView, list_of, register_parsers
+
+
+### SystemInfo.getInfo
+def getInfo():
+    params = {}
+    command = Command('SystemInfo.getInfo', params)
+    return command
+
+
+def getInfo_parser(result):
+    return GetInfoResult(result)
+
+
+### SystemInfo.getFeatureState
+def getFeatureState(featureState):
+    params = {'featureState': featureState}
+    command = Command('SystemInfo.getFeatureState', params)
+    return command
+
+
+### SystemInfo.getProcessInfo
+def getProcessInfo():
+    params = {}
+    command = Command('SystemInfo.getProcessInfo', params)
+    return command
+
+
+def getProcessInfo_parser(result):
+    return GetProcessInfoResult(result)
+
+
+class GPUDevice(WIPObject):
+    fields = (
+        ('vendorId',),
+        ('deviceId',),
+        ('subSysId',),
+        ('revision',),
+        ('vendorString',),
+        ('deviceString',),
+        ('driverVendor',),
+        ('driverVersion',),
+    )
+
+
+class Size(WIPObject):
+    fields = (
+        ('width',),
+        ('height',),
+    )
+
+
+class VideoDecodeAcceleratorCapability(WIPObject):
+    fields = (
+        ('profile',),
+        ('maxResolution', Size),
+        ('minResolution', Size),
+    )
+
+
+class VideoEncodeAcceleratorCapability(WIPObject):
+    fields = (
+        ('profile',),
+        ('maxResolution', Size),
+        ('maxFramerateNumerator',),
+        ('maxFramerateDenominator',),
+    )
+
+
+class ImageDecodeAcceleratorCapability(WIPObject):
+    fields = (
+        ('imageType',),
+        ('maxDimensions', Size),
+        ('minDimensions', Size),
+        ('subsamplings',),
+    )
+
+
+class GPUInfo(WIPObject):
+    fields = (
+        ('devices', list_of(GPUDevice)),
+        ('auxAttributes',),
+        ('featureStatus',),
+        ('driverBugWorkarounds',),
+        ('videoDecoding', list_of(VideoDecodeAcceleratorCapability)),
+        ('videoEncoding', list_of(VideoEncodeAcceleratorCapability)),
+        ('imageDecoding', list_of(ImageDecodeAcceleratorCapability)),
+    )
+
+
+class ProcessInfo(WIPObject):
+    fields = (
+        ('type',),
+        ('id',),
+        ('cpuTime',),
+    )
+
+
+class GetInfoResult(LazyView):
+    fields = (
+        ('gpu', GPUInfo),
+        ('modelName',),
+        ('modelVersion',),
+        ('commandLine',),
+    )
+
+
+class GetProcessInfoResult(LazyView):
+    fields = (
+        ('processInfo', list_of(ProcessInfo)),
+    )
+
+
+register_parsers('SystemInfo', globals())
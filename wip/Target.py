@@ -0,0 +1,335 @@
+"""
+Target domain. Supports additional targets discovery and allows to
+attach to them.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### Target.activateTarget
+def activateTarget(targetId):
+    params = {'targetId': targetId}
+    command = Command('Target.activateTarget', params)
+    return command
+
+
+### Target.attachToTarget
+def attachToTarget(targetId, flatten=None):
+    params = {'targetId': targetId}
+    if flatten is not None:
+        params['flatten'] = flatten
+    command = Command('Target.attachToTarget', params)
+    return command
+
+
+### Target.attachToBrowserTarget
+def attachToBrowserTarget():
+    params = {}
+    command = Command('Target.attachToBrowserTarget', params)
+    return command
+
+
+### Target.closeTarget
+def closeTarget(targetId):
+    params = {'targetId': targetId}
+    command = Command('Target.closeTarget', params)
+    return command
+
+
+### Target.exposeDevToolsProtocol
+def exposeDevToolsProtocol(targetId, bindingName=None, inheritPermissions=None):
+    params = {'targetId': targetId}
+    if bindingName is not None:
+        params['bindingName'] = bindingName
+    if inheritPermissions is not None:
+        params['inheritPermissions'] = inheritPermissions
+    command = Command('Target.exposeDevToolsProtocol', params)
+    return command
+
+
+### Target.createBrowserContext
+def createBrowserContext(disposeOnDetach=None, proxyServer=None, proxyBypassList=None, originsWithUniversalNetworkAccess=None):
+    params = {}
+    if disposeOnDetach is not None:
+        params['disposeOnDetach'] = disposeOnDetach
+    if proxyServer is not None:
+        params['proxyServer'] = proxyServer
+    if proxyBypassList is not None:
+        params['proxyBypassList'] = proxyBypassList
+    if originsWithUniversalNetworkAccess is not None:
+        params['originsWithUniversalNetworkAccess'] = originsWithUniversalNetworkAccess
+    command = Command('Target.createBrowserContext', params)
+    return command
+
+
+### Target.getBrowserContexts
+def getBrowserContexts():
+    params = {}
+    command = Command('Target.getBrowserContexts', params)
+    return command
+
+
+### Target.createTarget
+def createTarget(url, left=None, top=None, width=None, height=None, windowState=None, browserContextId=None, enableBeginFrameControl=None, newWindow=None, background=None, forTab=None, hidden=None):
+    params = {'url': url}
+    if left is not None:
+        params['left'] = left
+    if top is not None:
+        params['top'] = top
+    if width is not None:
+        params['width'] = width
+    if height is not None:
+        params['height'] = height
+    if windowState is not None:
+        params['windowState'] = windowState
+    if browserContextId is not None:
+        params['browserContextId'] = browserContextId
+    if enableBeginFrameControl is not None:
+        params['enableBeginFrameControl'] = enableBeginFrameControl
+    if newWindow is not None:
+        params['newWindow'] = newWindow
+    if background is not None:
+        params['background'] = background
+    if forTab is not None:
+        params['forTab'] = forTab
+    if hidden is not None:
+        params['hidden'] = hidden
+    command = Command('Target.createTarget', params)
+    return command
+
+
+### Target.detachFromTarget
+def detachFromTarget(sessionId=None, targetId=None):
+    params = {}
+    if sessionId is not None:
+        params['sessionId'] = sessionId
+    if targetId is not None:
+        params['targetId'] = targetId
+    command = Command('Target.detachFromTarget', params)
+    return command
+
+
+### Target.disposeBrowserContext
+def disposeBrowserContext(browserContextId):
+    params = {'browserContextId': browserContextId}
+    command = Command('Target.disposeBrowserContext', params)
+    return command
+
+
+### Target.getTargetInfo
+def getTargetInfo(targetId=None):
+    params = {}
+    if targetId is not None:
+        params['targetId'] = targetId
+    command = Command('Target.getTargetInfo', params)
+    return command
+
+
+def getTargetInfo_parser(result):
+    return GetTargetInfoResult(result)
+
+
+### Target.getTargets
+def getTargets(filter=None):
+    params = {}
+    if filter is not None:
+        params['filter'] = filter
+    command = Command('Target.getTargets', params)
+    return command
+
+
+def getTargets_parser(result):
+    return GetTargetsResult(result)
+
+
+### Target.sendMessageToTarget
+def sendMessageToTarget(message, sessionId=None, targetId=None):
+    params = {'message': message}
+    if sessionId is not None:
+        params['sessionId'] = sessionId
+    if targetId is not None:
+        params['targetId'] = targetId
+    command = Command('Target.sendMessageToTarget', params)
+    return command
+
+
+### Target.setAutoAttach
+def setAutoAttach(autoAttach, waitForDebuggerOnStart, flatten=None, filter=None):
+    params = {'autoAttach': autoAttach, 'waitForDebuggerOnStart': waitForDebuggerOnStart}
+    if flatten is not None:
+        params['flatten'] = flatten
+    if filter is not None:
+        params['filter'] = filter
+    command = Command('Target.setAutoAttach', params)
+    return command
+
+
+### Target.autoAttachRelated
+def autoAttachRelated(targetId, waitForDebuggerOnStart, filter=None):
+    params = {'targetId': targetId, 'waitForDebuggerOnStart': waitForDebuggerOnStart}
+    if filter is not None:
+        params['filter'] = filter
+    command = Command('Target.autoAttachRelated', params)
+    return command
+
+
+### Target.setDiscoverTargets
+def setDiscoverTargets(discover, filter=None):
+    params = {'discover': discover}
+    if filter is not None:
+        params['filter'] = filter
+    command = Command('Target.setDiscoverTargets', params)
+    return command
+
+
+### Target.setRemoteLocations
+def setRemoteLocations(locations):
+    params = {'locations': locations}
+    command = Command('Target.setRemoteLocations', params)
+    return command
+
+
+### Target.openDevTools
+def openDevTools(targetId):
+    params = {'targetId': targetId}
+    command = Command('Target.openDevTools', params)
+    return command
+
+
+### Target.attachedToTarget
+def attachedToTarget():
+    notification = Notification('Target.attachedToTarget')
+    return notification
+
+
+def attachedToTarget_parser(params):
+    return AttachedToTarget(params)
+
+
+### Target.detachedFromTarget
+def detachedFromTarget():
+    notification = Notification('Target.detachedFromTarget')
+    return notification
+
+
+def detachedFromTarget_parser(params):
+    return params
+
+
+### Target.receivedMessageFromTarget
+def receivedMessageFromTarget():
+    notification = Notification('Target.receivedMessageFromTarget')
+    return notification
+
+
+def receivedMessageFromTarget_parser(params):
+    return params
+
+
+### Target.targetCreated
+def targetCreated():
+    notification = Notification('Target.targetCreated')
+    return notification
+
+
+def targetCreated_parser(params):
+    return TargetCreated(params)
+
+
+### Target.targetDestroyed
+def targetDestroyed():
+    notification = Notification('Target.targetDestroyed')
+    return notification
+
+
+def targetDestroyed_parser(params):
+    return params
+
+
+### Target.targetCrashed
+def targetCrashed():
+    notification = Notification('Target.targetCrashed')
+    return notification
+
+
+def targetCrashed_parser(params):
+    return params
+
+
+### Target.targetInfoChanged
+def targetInfoChanged():
+    notification = Notification('Target.targetInfoChanged')
+    return notification
+
+
+def targetInfoChanged_parser(params):
+    return TargetInfoChanged(params)
+
+
+class TargetInfo(WIPObject):
+    fields = (
+        ('targetId',),
+        ('type',),
+        ('title',),
+        ('url',),
+        ('attached',),
+        ('openerId',),
+        ('canAccessOpener',),
+        ('openerFrameId',),
+        ('parentFrameId',),
+        ('browserContextId',),
+        ('subtype',),
+    )
+
+
+class FilterEntry(WIPObject):
+    fields = (
+        ('exclude',),
+        ('type',),
+    )
+
+
+class RemoteLocation(WIPObject):
+    fields = (
+        ('host',),
+        ('port',),
+    )
+
+
+class GetTargetInfoResult(LazyView):
+    fields = (
+        ('targetInfo', TargetInfo),
+    )
+
+
+class GetTargetsResult(LazyView):
+    fields = (
+        ('targetInfos', list_of(TargetInfo)),
+    )
+
+
+class AttachedToTarget(LazyView):
+    fields = (
+        ('sessionId',),
+        ('targetInfo', TargetInfo),
+        ('waitingForDebugger',),
+    )
+
+
+class TargetCreated(LazyView):
+    fields = (
+        ('targetInfo', TargetInfo),
+    )
+
+
+class TargetInfoChanged(LazyView):
+    fields = (
+        ('targetInfo', TargetInfo),
+    )
+
+
+register_parsers('Target', globals())
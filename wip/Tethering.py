@@ -0,0 +1,37 @@
+"""
+Tethering domain. The Tethering domain defines methods and events for
+browser port binding.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, register_parsers
+
+
+### Tethering.bind
+def bind(port):
+    params = {'port': port}
+    command = Command('Tethering.bind', params)
+    return command
+
+
+### Tethering.unbind
+def unbind(port):
+    params = {'port': port}
+    command = Command('Tethering.unbind', params)
+    return command
+
+
+### Tethering.accepted
+def accepted():
+    notification = Notification('Tethering.accepted')
+    return notification
+
+
+def accepted_parser(params):
+    return params
+
+
+register_parsers('Tethering', globals())
@@ -0,0 +1,109 @@
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, register_parsers
+
+
+### Tracing.end
+def end():
+    params = {}
+    command = Command('Tracing.end', params)
+    return command
+
+
+### Tracing.getCategories
+def getCategories():
+    params = {}
+    command = Command('Tracing.getCategories', params)
+    return command
+
+
+### Tracing.recordClockSyncMarker
+def recordClockSyncMarker(syncId):
+    params = {'syncId': syncId}
+    command = Command('Tracing.recordClockSyncMarker', params)
+    return command
+
+
+### Tracing.requestMemoryDump
+def requestMemoryDump(deterministic=None, levelOfDetail=None):
+    params = {}
+    if deterministic is not None:
+        params['deterministic'] = deterministic
+    if levelOfDetail is not None:
+        params['levelOfDetail'] = levelOfDetail
+    command = Command('Tracing.requestMemoryDump', params)
+    return command
+
+
+### Tracing.start
+def start(categories=None, options=None, bufferUsageReportingInterval=None, transferMode=None, streamFormat=None, streamCompression=None, traceConfig=None, perfettoConfig=None, tracingBackend=None):
+    params = {}
+    if categories is not None:
+        params['categories'] = categories
+    if options is not None:
+        params['options'] = options
+    if bufferUsageReportingInterval is not None:
+        params['bufferUsageReportingInterval'] = bufferUsageReportingInterval
+    if transferMode is not None:
+        params['transferMode'] = transferMode
+    if streamFormat is not None:
+        params['streamFormat'] = streamFormat
+    if streamCompression is not None:
+        params['streamCompression'] = streamCompression
+    if traceConfig is not None:
+        params['traceConfig'] = traceConfig
+    if perfettoConfig is not None:
+        params['perfettoConfig'] = perfettoConfig
+    if tracingBackend is not None:
+        params['tracingBackend'] = tracingBackend
+    command = Command('Tracing.start', params)
+    return command
+
+
+### Tracing.bufferUsage
+def bufferUsage():
+    notification = Notification('Tracing.bufferUsage')
+    return notification
+
+
+def bufferUsage_parser(params):
+    return params
+
+
+### Tracing.dataCollected
+def dataCollected():
+    notification = Notification('Tracing.dataCollected')
+    return notification
+
+
+def dataCollected_parser(params):
+    return params
+
+
+### Tracing.tracingComplete
+def tracingComplete():
+    notification = Notification('Tracing.tracingComplete')
+    return notification
+
+
+def tracingComplete_parser(params):
+    return params
+
+
+class TraceConfig(WIPObject):
+    fields = (
+        ('recordMode',),
+        ('traceBufferSizeInKb',),
+        ('enableSampling',),
+        ('enableSystrace',),
+        ('enableArgumentFilter',),
+        ('includedCategories',),
+        ('excludedCategories',),
+        ('syntheticDelays',),
+        ('memoryDumpConfig',),
+    )
+
+
+register_parsers('Tracing', globals())
@@ -0,0 +1,258 @@
+"""
+WebAudio domain. This domain allows inspection of Web Audio API.
+https://webaudio.github.io/web-audio-api/
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, register_parsers
+
+
+### WebAudio.enable
+def enable():
+    params = {}
+    command = Command('WebAudio.enable', params)
+    return command
+
+
+### WebAudio.disable
+def disable():
+    params = {}
+    command = Command('WebAudio.disable', params)
+    return command
+
+
+### WebAudio.getRealtimeData
+def getRealtimeData(contextId):
+    params = {'contextId': contextId}
+    command = Command('WebAudio.getRealtimeData', params)
+    return command
+
+
+def getRealtimeData_parser(result):
+    return GetRealtimeDataResult(result)
+
+
+### WebAudio.contextCreated
+def contextCreated():
+    notification = Notification('WebAudio.contextCreated')
+    return notification
+
+
+def contextCreated_parser(params):
+    return ContextCreated(params)
+
+
+### WebAudio.contextWillBeDestroyed
+def contextWillBeDestroyed():
+    notification = Notification('WebAudio.contextWillBeDestroyed')
+    return notification
+
+
+def contextWillBeDestroyed_parser(params):
+    return params
+
+
+### WebAudio.contextChanged
+def contextChanged():
+    notification = Notification('WebAudio.contextChanged')
+    return notification
+
+
+def contextChanged_parser(params):
+    return ContextChanged(params)
+
+
+### WebAudio.audioListenerCreated
+def audioListenerCreated():
+    notification = Notification('WebAudio.audioListenerCreated')
+    return notification
+
+
+def audioListenerCreated_parser(params):
+    return AudioListenerCreated(params)
+
+
+### WebAudio.audioListenerWillBeDestroyed
+def audioListenerWillBeDestroyed():
+    notification = Notification('WebAudio.audioListenerWillBeDestroyed')
+    return notification
+
+
+def audioListenerWillBeDestroyed_parser(params):
+    return params
+
+
+### WebAudio.audioNodeCreated
+def audioNodeCreated():
+    notification = Notification('WebAudio.audioNodeCreated')
+    return notification
+
+
+def audioNodeCreated_parser(params):
+    return AudioNodeCreated(params)
+
+
+### WebAudio.audioNodeWillBeDestroyed
+def audioNodeWillBeDestroyed():
+    notification = Notification('WebAudio.audioNodeWillBeDestroyed')
+    return notification
+
+
+def audioNodeWillBeDestroyed_parser(params):
+    return params
+
+
+### WebAudio.audioParamCreated
+def audioParamCreated():
+    notification = Notification('WebAudio.audioParamCreated')
+    return notification
+
+
+def audioParamCreated_parser(params):
+    return AudioParamCreated(params)
+
+
+### WebAudio.audioParamWillBeDestroyed
+def audioParamWillBeDestroyed():
+    notification = Notification('WebAudio.audioParamWillBeDestroyed')
+    return notification
+
+
+def audioParamWillBeDestroyed_parser(params):
+    return params
+
+
+### WebAudio.nodesConnected
+def nodesConnected():
+    notification = Notification('WebAudio.nodesConnected')
+    return notification
+
+
+def nodesConnected_parser(params):
+    return params
+
+
+### WebAudio.nodesDisconnected
+def nodesDisconnected():
+    notification = Notification('WebAudio.nodesDisconnected')
+    return notification
+
+
+def nodesDisconnected_parser(params):
+    return params
+
+
+### WebAudio.nodeParamConnected
+def nodeParamConnected():
+    notification = Notification('WebAudio.nodeParamConnected')
+    return notification
+
+
+def nodeParamConnected_parser(params):
+    return params
+
+
+### WebAudio.nodeParamDisconnected
+def nodeParamDisconnected():
+    notification = Notification('WebAudio.nodeParamDisconnected')
+    return notification
+
+
+def nodeParamDisconnected_parser(params):
+    return params
+
+
+class ContextRealtimeData(WIPObject):
+    fields = (
+        ('currentTime',),
+        ('renderCapacity',),
+        ('callbackIntervalMean',),
+        ('callbackIntervalVariance',),
+    )
+
+
+class BaseAudioContext(WIPObject):
+    fields = (
+        ('contextId',),
+        ('contextType',),
+        ('contextState',),
+        ('realtimeData', ContextRealtimeData),
+        ('callbackBufferSize',),
+        ('maxOutputChannelCount',),
+        ('sampleRate',),
+    )
+
+
+class AudioListener(WIPObject):
+    fields = (
+        ('listenerId',),
+        ('contextId',),
+    )
+
+
+class AudioNode(WIPObject):
+    fields = (
+        ('nodeId',),
+        ('contextId',),
+        ('nodeType',),
+        ('numberOfInputs',),
+        ('numberOfOutputs',),
+        ('channelCount',),
+        ('channelCountMode',),
+        ('channelInterpretation',),
+    )
+
+
+class AudioParam(WIPObject):
+    fields = (
+        ('paramId',),
+        ('nodeId',),
+        ('contextId',),
+        ('paramType',),
+        ('rate',),
+        ('defaultValue',),
+        ('minValue',),
+        ('maxValue',),
+    )
+
+
+class GetRealtimeDataResult(LazyView):
+    fields = (
+        ('realtimeData', ContextRealtimeData),
+    )
+
+
+class ContextCreated(LazyView):
+    fields = (
+        ('context', BaseAudioContext),
+    )
+
+
+class ContextChanged(LazyView):
+    fields = (
+        ('context', BaseAudioContext),
+    )
+
+
+class AudioListenerCreated(LazyView):
+    fields = (
+        ('listener', AudioListener),
+    )
+
+
+class AudioNodeCreated(LazyView):
+    fields = (
+        ('node', AudioNode),
+    )
+
+
+class AudioParamCreated(LazyView):
+    fields = (
+        ('param', AudioParam),
+    )
+
+
+register_parsers('WebAudio', globals())
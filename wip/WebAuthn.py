@@ -0,0 +1,231 @@
+"""
+WebAuthn domain. This domain allows configuring virtual authenticators
+to test the WebAuthn API.
+"""
+
+# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+
+from utils import Command, Notification, WIPObject, LazyView, list_of, register_parsers
+
+
+### WebAuthn.enable
+def enable(enableUI=None):
+    params = {}
+    if enableUI is not None:
+        params['enableUI'] = enableUI
+    command = Command('WebAuthn.enable', params)
+    return command
+
+
+### WebAuthn.disable
+def disable():
+    params = {}
+    command = Command('WebAuthn.disable', params)
+    return command
+
+
+### WebAuthn.addVirtualAuthenticator
+def addVirtualAuthenticator(options):
+    params = {'options': options}
+    command = Command('WebAuthn.addVirtualAuthenticator', params)
+    return command
+
+
+### WebAuthn.setResponseOverrideBits
+def setResponseOverrideBits(authenticatorId, isBogusSignature=None, isBadUV=None, isBadUP=None):
+    params = {'authenticatorId': authenticatorId}
+    if isBogusSignature is not None:
+        params['isBogusSignature'] = isBogusSignature
+    if isBadUV is not None:
+        params['isBadUV'] = isBadUV
+    if isBadUP is not None:
+        params['isBadUP'] = isBadUP
+    command = Command('WebAuthn.setResponseOverrideBits', params)
+    return command
+
+
+### WebAuthn.removeVirtualAuthenticator
+def removeVirtualAuthenticator(authenticatorId):
+    params = {'authenticatorId': authenticatorId}
+    command = Command('WebAuthn.removeVirtualAuthenticator', params)
+    return command
+
+
+### WebAuthn.addCredential
+def addCredential(authenticatorId, credential):
+    params = {'authenticatorId': authenticatorId, 'credential': credential}
+    command = Command('WebAuthn.addCredential', params)
+    return command
+
+
+### WebAuthn.getCredential
+def getCredential(authenticatorId, credentialId):
+    params = {'authenticatorId': authenticatorId, 'credentialId': credentialId}
+    command = Command('WebAuthn.getCredential', params)
+    return command
+
+
+def getCredential_parser(result):
+    return GetCredentialResult(result)
+
+
+### WebAuthn.getCredentials
+def getCredentials(authenticatorId):
+    params = {'authenticatorId': authenticatorId}
+    command = Command('WebAuthn.getCredentials', params)
+    return command
+
+
+def getCredentials_parser(result):
+    return GetCredentialsResult(result)
+
+
+### WebAuthn.removeCredential
+def removeCredential(authenticatorId, credentialId):
+    params = {'authenticatorId': authenticatorId, 'credentialId': credentialId}
+    command = Command('WebAuthn.removeCredential', params)
+    return command
+
+
+### WebAuthn.clearCredentials
+def clearCredentials(authenticatorId):
+    params = {'authenticatorId': authenticatorId}
+    command = Command('WebAuthn.clearCredentials', params)
+    return command
+
+
+### WebAuthn.setUserVerified
+def setUserVerified(authenticatorId, isUserVerified):
+    params = {'authenticatorId': authenticatorId, 'isUserVerified': isUserVerified}
+    command = Command('WebAuthn.setUserVerified', params)
+    return command
+
+
+### WebAuthn.setAutomaticPresenceSimulation
+def setAutomaticPresenceSimulation(authenticatorId, enabled):
+    params = {'authenticatorId': authenticatorId, 'enabled': enabled}
+    command = Command('WebAuthn.setAutomaticPresenceSimulation', params)
+    return command
+
+
+### WebAuthn.setCredentialProperties
+def setCredentialProperties(authenticatorId, credentialId, backupEligibility=None, backupState=None):
+    params = {'authenticatorId': authenticatorId, 'credentialId': credentialId}
+    if backupEligibility is not None:
+        params['backupEligibility'] = backupEligibility
+    if backupState is not None:
+        params['backupState'] = backupState
+    command = Command('WebAuthn.setCredentialProperties', params)
+    return command
+
+
+### WebAuthn.credentialAdded
+def credentialAdded():
+    notification = Notification('WebAuthn.credentialAdded')
+    return notification
+
+
+def credentialAdded_parser(params):
+    return CredentialAdded(params)
+
+
+### WebAuthn.credentialDeleted
+def credentialDeleted():
+    notification = Notification('WebAuthn.credentialDeleted')
+    return notification
+
+
+def credentialDeleted_parser(params):
+    return params
+
+
+### WebAuthn.credentialUpdated
+def credentialUpdated():
+    notification = Notification('WebAuthn.credentialUpdated')
+    return notification
+
+
+def credentialUpdated_parser(params):
+    return CredentialUpdated(params)
+
+
+### WebAuthn.credentialAsserted
+def credentialAsserted():
+    notification = Notification('WebAuthn.credentialAsserted')
+    return notification
+
+
+def credentialAsserted_parser(params):
+    return CredentialAsserted(params)
+
+
+class VirtualAuthenticatorOptions(WIPObject):
+    fields = (
+        ('protocol',),
+        ('ctap2Version',),
+        ('transport',),
+        ('hasResidentKey',),
+        ('hasUserVerification',),
+        ('hasLargeBlob',),
+        ('hasCredBlob',),
+        ('hasMinPinLength',),
+        ('hasPrf',),
+        ('automaticPresenceSimulation',),
+        ('isUserVerified',),
+        ('defaultBackupEligibility',),
+        ('defaultBackupState',),
+    )
+
+
+class Credential(WIPObject):
+    fields = (
+        ('credentialId',),
+        ('isResidentCredential',),
+        ('rpId',),
+        ('privateKey',),
+        ('userHandle',),
+        ('signCount',),
+        ('largeBlob',),
+        ('backupEligibility',),
+        ('backupState',),
+        ('userName',),
+        ('userDisplayName',),
+    )
+
+
+class GetCredentialResult(LazyView):
+    fields = (
+        ('credential', Credential),
+    )
+
+
+class GetCredentialsResult(LazyView):
+    fields = (
+        ('credentials', list_of(Credential)),
+    )
+
+
+class CredentialAdded(LazyView):
+    fields = (
+        ('authenticatorId',),
+        ('credential', Credential),
+    )
+
+
+class CredentialUpdated(LazyView):
+    fields = (
+        ('authenticatorId',),
+        ('credential', Credential),
+    )
+
+
+class CredentialAsserted(LazyView):
+    fields = (
+        ('authenticatorId',),
+        ('credential', Credential),
+    )
+
+
+register_parsers('WebAuthn', globals())
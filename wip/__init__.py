@@ -2,13 +2,43 @@
 WIP Protocol - WebInspectorProtocol implementation for python
 
 Copyright (C) 2013 Sokolov Stansilav
+
+The domain modules are only imported the first time they are used
+(wip.Debugger, from wip import DOM, ...), so importing wip is cheap
+however many domains there are.
 """
 
-import Console
-import Debugger
-import DOMDebugger
-import DOM
-import Network
-import Page
-import Runtime
+from __future__ import absolute_import
+
+import importlib
+import os
+import sys
+import types
+
+
+# the domain modules in the package, written by hand or generated by
+# wip/generate.py (domains generated from a browser's descriptor too)
+DOMAINS = tuple(sorted(set(
+    os.path.splitext(name)[0]
+    for name in os.listdir(os.path.dirname(os.path.abspath(__file__)))
+    if name[:1].isupper() and name.endswith(('.py', '.pyc')))))
+
+__all__ = list(DOMAINS)
+
+
+class _Package(types.ModuleType):
+    """The wip package, importing a domain when it is first looked up.
+    (Python 2 modules can't have a __getattr__ of their own.)"""
+
+    def __getattr__(self, name):
+        if name not in DOMAINS:
+            raise AttributeError("'module' object has no attribute %r" % name)
+        # importing it sets it on the package as well
+        return importlib.import_module(__name__ + '.' + name)
+
 
+_package = _Package(__name__, __doc__)
+_package.__dict__.update(globals())
+# keep this module alive, python 2 clears the globals of a dead module
+_package._module = sys.modules[__name__]
+sys.modules[__name__] = _package
@@ -0,0 +1,310 @@
+"""
+Generate wip domain modules from Chrome's protocol descriptor.
+
+    $ python -m wip.generate [--url http://localhost:9222/json/protocol] [Domain ...]
+
+Reads wip/protocol.json (Chrome's protocol descriptor, browser_protocol.json
+and js_protocol.json from the devtools-protocol project in one file) or
+the descriptor a running browser serves at /json/protocol, and writes
+wip/<Domain>.py for every domain in it, or just the ones named. Domains
+in HAND_WRITTEN are left alone.
+
+For every domain it makes command factories, notification factories,
+parsers registered with wip.utils.register_parsers, WIPObject records
+with declared fields for the object types, and LazyView classes for
+command results and event params. The output is checked in, so there is
+no cost at run time.
+"""
+
+import json
+import keyword
+import os
+import sys
+import textwrap
+import urllib2
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROTOCOL = os.path.join(HERE, 'protocol.json')
+
+# domains written by hand, never overwritten. sync and swi rely on their
+# interfaces (ids wrapped in objects, parsers that build CallFrames, ...),
+# which differ from what would be generated
+HAND_WRITTEN = set(['Console', 'Debugger', 'Network', 'Page', 'Runtime'])
+
+HEADER = '''# Generated by wip/generate.py from Chrome's protocol descriptor, any
+# changes here will be lost. Parameters are passed on as they are, so
+# give them plain JSON values.
+'''
+
+
+# what a module can take from wip.utils, in the order it is imported
+UTILS = ('Command', 'Notification', 'WIPObject', 'LazyView', 'list_of',
+         'register_parsers')
+
+
+def load(url=None):
+    if url:
+        return json.load(urllib2.urlopen(url))
+    with open(PROTOCOL) as f:
+        return json.load(f)
+
+
+def identifier(name):
+    """name, made safe to use as a python name."""
+    name = str(name)
+    if keyword.iskeyword(name):
+        return name + '_'
+    return name
+
+
+def capitalize(name):
+    return name[0].upper() + name[1:]
+
+
+class Generator(object):
+    """Writes one domain module."""
+
+    def __init__(self, protocol, domain):
+        self.domain = domain
+        self.name = str(domain['domain'])
+        self.domains = dict((d['domain'], d) for d in protocol['domains'])
+        self.types = dict((t['id'], t) for t in domain.get('types', ()))
+        self.records = [t['id'] for t in self.sorted_records()]
+        self.defined = set()
+        self.imports = set()
+        self.from_imports = set()
+        # names taken from utils, register_parsers ends every module
+        self.utils = set(['register_parsers'])
+
+    # -- types --
+
+    def is_record(self, spec):
+        return spec.get('type') == 'object' and 'properties' in spec
+
+    def sorted_records(self):
+        """Object types, each after the ones it refers to where it can
+        be (cycles are broken with a lambda, see converter)."""
+        records = [t for t in self.domain.get('types', ())
+                   if self.is_record(t)]
+        done = []
+        visiting = set()
+
+        def visit(spec):
+            if spec in done or spec['id'] in visiting:
+                return
+            visiting.add(spec['id'])
+            for prop in spec['properties']:
+                for ref in self.local_refs(prop):
+                    if ref in self.types and self.is_record(self.types[ref]):
+                        visit(self.types[ref])
+            visiting.discard(spec['id'])
+            done.append(spec)
+
+        for spec in records:
+            visit(spec)
+        return done
+
+    def local_refs(self, spec):
+        refs = []
+        if '$ref' in spec and '.' not in spec['$ref']:
+            refs.append(spec['$ref'])
+        if 'items' in spec:
+            refs.extend(self.local_refs(spec['items']))
+        return refs
+
+    def converter(self, spec):
+        """Source of the converter for a value of spec, None if the value
+        is used as it is."""
+        if spec.get('type') == 'array' and 'items' in spec:
+            item = self.converter(spec['items'])
+            if item is None:
+                return None
+            self.utils.add('list_of')
+            return 'list_of(%s)' % item
+        if '$ref' not in spec:
+            return None
+
+        ref = spec['$ref']
+        if '.' in ref:
+            domain, name = ref.split('.', 1)
+        else:
+            domain, name = self.name, ref
+
+        if domain == self.name:
+            target = self.types.get(name)
+            if target is None:
+                return None
+            if not self.is_record(target):
+                return self.converter(target)
+            if name in self.defined:
+                return name
+            # not defined yet, look it up when it is needed
+            return 'lambda value: %s(value)' % name
+
+        if domain in self.domains and domain not in HAND_WRITTEN:
+            other = self.domains[domain]
+            target = dict((t['id'], t) for t in other.get('types', ())).get(name)
+            if target is None:
+                return None
+            if not self.is_record(target):
+                return None
+            self.imports.add(domain)
+            return 'lambda value: %s.%s(value)' % (domain, name)
+
+        # a class in a module written by hand
+        try:
+            module = __import__('wip.' + domain, fromlist=[name])
+        except ImportError:
+            return None
+        if isinstance(getattr(module, name, None), type):
+            self.from_imports.add((domain, name))
+            return name
+        return None
+
+    def fields(self, properties, indent):
+        lines = [indent + 'fields = (']
+        for prop in properties:
+            convert = self.converter(prop)
+            if convert is None:
+                lines.append(indent + '    (%r,),' % str(prop['name']))
+            else:
+                lines.append(indent + '    (%r, %s),' % (str(prop['name']), convert))
+        lines.append(indent + ')')
+        return lines
+
+    def needs_parsing(self, properties):
+        return any(self.converter(prop) is not None for prop in properties)
+
+    # -- output --
+
+    def command(self, command):
+        name = str(command['name'])
+        method = '%s.%s' % (self.name, name)
+        params = command.get('parameters', ())
+        required = [p for p in params if not p.get('optional')]
+        optional = [p for p in params if p.get('optional')]
+
+        args = [identifier(p['name']) for p in required]
+        args += ['%s=None' % identifier(p['name']) for p in optional]
+        lines = ['### %s' % method, 'def %s(%s):' % (identifier(name), ', '.join(args))]
+        if required:
+            lines.append('    params = {%s}' % ', '.join(
+                '%r: %s' % (str(p['name']), identifier(p['name'])) for p in required))
+        else:
+            lines.append('    params = {}')
+        for p in optional:
+            lines.append('    if %s is not None:' % identifier(p['name']))
+            lines.append('        params[%r] = %s' % (str(p['name']), identifier(p['name'])))
+        lines.append('    command = Command(%r, params)' % method)
+        self.utils.add('Command')
+        lines.append('    return command')
+
+        view = None
+        returns = command.get('returns', ())
+        if self.needs_parsing(returns):
+            view = self.view_name(name, 'Result')
+            lines += ['', '', 'def %s_parser(result):' % name,
+                      '    return %s(result)' % view]
+        return lines, (view, returns) if view else None
+
+    def event(self, event):
+        name = str(event['name'])
+        method = '%s.%s' % (self.name, name)
+        lines = ['### %s' % method, 'def %s():' % identifier(name),
+                 '    notification = Notification(%r)' % method,
+                 '    return notification']
+        self.utils.add('Notification')
+
+        view = None
+        params = event.get('parameters', ())
+        if params:
+            lines += ['', '']
+            if self.needs_parsing(params):
+                view = self.view_name(name, 'Event')
+                lines += ['def %s_parser(params):' % name,
+                          '    return %s(params)' % view]
+            else:
+                lines += ['def %s_parser(params):' % name, '    return params']
+        return lines, (view, params) if view else None
+
+    def view_name(self, name, suffix):
+        view = capitalize(name)
+        if suffix == 'Result' or view in self.types:
+            view += suffix
+        return view
+
+    def record(self, spec):
+        lines = ['class %s(WIPObject):' % spec['id']]
+        self.utils.add('WIPObject')
+        lines += self.fields(spec['properties'], '    ')
+        self.defined.add(spec['id'])
+        return lines
+
+    def view(self, name, properties):
+        lines = ['class %s(LazyView):' % name]
+        self.utils.add('LazyView')
+        lines += self.fields(properties, '    ')
+        return lines
+
+    def module(self):
+        blocks = []
+        views = []
+        for command in self.domain.get('commands', ()):
+            lines, view = self.command(command)
+            blocks.append(lines)
+            if view:
+                views.append(view)
+        for event in self.domain.get('events', ()):
+            lines, view = self.event(event)
+            blocks.append(lines)
+            if view:
+                views.append(view)
+        for name in self.records:
+            blocks.append(self.record(self.types[name]))
+        for name, properties in views:
+            blocks.append(self.view(name, properties))
+        blocks.append(['register_parsers(%r, globals())' % str(self.name)])
+
+        head = [line.rstrip() for line in HEADER.splitlines()]
+        description = self.domain.get('description')
+        if description:
+            text = '%s domain. %s' % (self.name, description.strip())
+            head = ['"""'] + textwrap.wrap(text, 72) + ['"""', ''] + head
+        head.append('')
+        head.append('from utils import %s' % ', '.join(
+            name for name in UTILS if name in self.utils))
+        for domain, name in sorted(self.from_imports):
+            head.append('from %s import %s' % (domain, name))
+        for domain in sorted(self.imports):
+            head.append('import %s' % domain)
+
+        out = '\n'.join(head) + '\n\n\n'
+        out += '\n\n\n'.join('\n'.join(block) for block in blocks)
+        return out + '\n'
+
+
+def generate(protocol, names=None):
+    written = []
+    for domain in protocol['domains']:
+        name = domain['domain']
+        if name in HAND_WRITTEN or (names and name not in names):
+            continue
+        path = os.path.join(HERE, name + '.py')
+        with open(path, 'w') as f:
+            f.write(Generator(protocol, domain).module())
+        written.append(path)
+    return written
+
+
+def main(args):
+    url = None
+    if args[:1] == ['--url']:
+        url = args[1]
+        args = args[2:]
+    for path in generate(load(url), set(args)):
+        print 'wrote', os.path.relpath(path)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
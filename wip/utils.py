@@ -1,4 +1,93 @@
+import json
+import keyword
+
+
+# Parsers for the answers to commands and the params of notifications,
+# by method name ('Debugger.setScriptSource'). The domain modules fill it
+# in with register_parsers when they are imported.
+parsers = {}
+
+
+def register_parsers(domain, namespace):
+    """Register every <method>_parser function in namespace for domain."""
+    for name, value in namespace.items():
+        if name.endswith('_parser') and callable(value):
+            parsers[domain + '.' + name[:-len('_parser')]] = value
+
+
+def list_of(convert):
+    """Field converter for a list of items that are each convert-ed."""
+    def convert_list(values):
+        return [convert(value) for value in values]
+    return convert_list
+
+
+class WIPObjectType(type):
+    """Metaclass of WIPObject.
+
+    A class can declare its fields instead of setting them in __init__:
+
+        fields = (
+            ('lineNumber',),
+            ('scriptId', ScriptId),
+            ('scopeChain', list_of(Scope), list),
+        )
+
+    Each field is (name, converter, default), the last two can be left
+    off. The converter (None to keep the value as it is) is called on the
+    value when it is in the object Chrome sent. Otherwise the attribute
+    gets the default, or a new one of it when the default is a type (like
+    list). Both default to None.
+
+    The class then gets __slots__ for its fields, so instances have no
+    __dict__, and an __init__ made for those fields when it doesn't
+    define its own.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get('fields')
+        if fields is not None:
+            fields = tuple((field + (None, None))[:3] for field in fields)
+            namespace['fields'] = fields
+            namespace.setdefault('__slots__', tuple(f[0] for f in fields))
+            if '__init__' not in namespace:
+                namespace['__init__'] = mcs.make_init(name, fields)
+        return type.__new__(mcs, name, bases, namespace)
+
+    @staticmethod
+    def make_init(name, fields):
+        """Compile an __init__ that reads fields out of a dict."""
+        lines = ['def __init__(self, value):']
+        scope = {}
+        for n, (field, convert, default) in enumerate(fields):
+            if keyword.iskeyword(field):
+                target = 'setattr(self, %r, %%s)' % field
+            else:
+                target = 'self.%s = %%s' % field
+            value = 'value[%r]' % field
+            if convert is not None:
+                scope['convert%d' % n] = convert
+                value = 'convert%d(%s)' % (n, value)
+            scope['default%d' % n] = default
+            if isinstance(default, type):
+                missing = 'default%d()' % n
+            else:
+                missing = 'default%d' % n
+            lines.append('    if %r in value:' % field)
+            lines.append('        ' + target % value)
+            lines.append('    else:')
+            lines.append('        ' + target % missing)
+        if not fields:
+            lines.append('    pass')
+        code = compile('\n'.join(lines), '<%s fields>' % name, 'exec')
+        exec code in scope
+        return scope['__init__']
+
+
 class WIPObject(object):
+    __metaclass__ = WIPObjectType
+    __slots__ = ()
+
     def set(self, obj, name, default=None):
         setattr(self, name, obj.get(name, default))
 
@@ -15,13 +104,82 @@ class WIPObject(object):
             setattr(self, name, None)
 
 
+class LazyViewType(type):
+    """Metaclass of LazyView, indexes the fields by name."""
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get('fields', ())
+        namespace['specs'] = dict(
+            (field[0], (field + (None, None))[1:3]) for field in fields)
+        return type.__new__(mcs, name, bases, namespace)
+
+
+class LazyView(object):
+    """Read only view of a dict Chrome sent, that only converts a field
+    when it is first read, and keeps the result.
+
+    Fields are declared like a WIPObject's. They can be read as items
+    (view['url']) or attributes (view.url), other keys of the dict just
+    as they are. For events that come in by the thousand and are hardly
+    looked at, like Debugger.scriptParsed.
+    """
+
+    __metaclass__ = LazyViewType
+    __slots__ = ('raw', 'cache')
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.cache = {}
+
+    def __getitem__(self, name):
+        try:
+            return self.cache[name]
+        except KeyError:
+            pass
+        if name not in self.specs:
+            return self.raw[name]
+        convert, default = self.specs[name]
+        if name in self.raw:
+            value = self.raw[name]
+            if convert is not None:
+                value = convert(value)
+        elif isinstance(default, type):
+            value = default()
+        else:
+            value = default
+        self.cache[name] = value
+        return value
+
+    def __getattr__(self, name):
+        if name in LazyView.__slots__:
+            raise AttributeError(name)
+        if name in self.specs or name in self.raw:
+            return self[name]
+        raise AttributeError(name)
+
+    def __contains__(self, name):
+        return name in self.raw
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def get(self, name, default=None):
+        if name in self.specs or name in self.raw:
+            return self[name]
+        return default
+
+    def keys(self):
+        return self.raw.keys()
+
+    def __repr__(self):
+        # the dict itself can be huge
+        return '<%s %s>' % (type(self).__name__, ' '.join(sorted(self.raw)))
+
+
 class Notification(object):
     def __init__(self, notification_name):
         self.name = notification_name
-        try:
-            self.parser = eval('wip.' + notification_name + '_parser', {'wip': __import__('wip')})
-        except:
-            self.parser = Notification.default_parser
+        self.parser = parsers.get(notification_name, Notification.default_parser)
         self.lastResponse = None
         self.callback = None
 
@@ -35,10 +193,7 @@ class Command(object):
     def __init__(self, method_name, params={}):
         self.request = {'id': 0, 'method': '', 'params': params}
         self.method = method_name
-        try:
-            self.parser = eval('wip.' + method_name + '_parser', {'wip': __import__('wip')})
-        except:
-            self.parser = Command.default_parser
+        self.parser = parsers.get(method_name, Command.default_parser)
         self.params = params
         self.options = None
         self.callback = None
@@ -46,6 +201,14 @@ class Command(object):
         self.error = None
         self.data = None
 
+    def serialize(self):
+        return json.dumps(self.request)
+
+    def release_params(self):
+        # drop the params once they've been sent, they can be big
+        self.params = None
+        self.request['params'] = None
+
     def get_id(self):
         return self.request['id']
 
@@ -64,3 +227,26 @@ class Command(object):
     @staticmethod
     def default_parser(params):
         return params
+
+
+class PreparedCommand(Command):
+    """A command with some of its params JSON encoded already.
+
+    encoded maps param names to their JSON, made with json.dumps. When
+    the same big value (a script's source) goes to many tabs, it only
+    has to be encoded once. The small params are given as usual."""
+
+    def __init__(self, method_name, params, encoded):
+        Command.__init__(self, method_name, params)
+        self.encoded = encoded
+
+    def serialize(self):
+        params = [json.dumps(self.params)[1:-1]] if self.params else []
+        params += ['%s: %s' % (json.dumps(name), value)
+                   for name, value in self.encoded.items()]
+        return '{"id": %d, "method": %s, "params": {%s}}' % (
+            self.id, json.dumps(self.method), ', '.join(params))
+
+    def release_params(self):
+        Command.release_params(self)
+        self.encoded = None